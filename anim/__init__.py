@@ -1,12 +1,18 @@
 from .algorithms import *
 from .animator import animator
+from .clock import clock, real_time_clock, virtual_clock
 from .actor import actor
 from .animation import animation
 from .simple_animation import simple_animation, anim_description
 from .options import option, options
 from .scene import scene
 from .view import view
+from .renderer import frame_renderer, render_in_parallel
+from .profiler import profiler
+from .frame_cache import frame_cache
 from .shot import shot
+from .snapshot import snapshot, scene_state
+from .timeline import timeline
 from .items import *
 from .anims import *
 from . import ui
@@ -5,14 +5,30 @@ from .named import named
 from .shot import shot
 from .options import option, options
 from .scene import scene
+from .snapshot import snapshot, scene_state
 from . import anims
 
-from collections import defaultdict
-from typing import Dict as _Dict, List as _List
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from typing import Dict as _Dict, Iterator as _Iterator, List as _List
+import sys as _sys
+import traceback as _traceback
 
 from PySide6.QtCore import QPointF, Signal, QObject
 
 
+_no_more_shots = object()
+_no_geometry = object()
+
+# Note: a single worker, so geometries are generated one at a time, in order.
+_geometry_executor: _ThreadPoolExecutor = None
+
+def _get_geometry_executor() -> _ThreadPoolExecutor:
+    global _geometry_executor
+    if _geometry_executor is None:
+        _geometry_executor = _ThreadPoolExecutor(1, 'geometry')
+    return _geometry_executor
+
 class animation(QObject, named):
     """
     Animation base class.
@@ -27,6 +43,14 @@ class animation(QObject, named):
                    The app window automatically calls it when a new animation is
                    selected.
 
+        - generate_geometry(): generates the pure geometry used by the actors, without
+                               creating any Qt graphics items. The result is kept in the
+                               geometry member for generate_actors.
+
+                               When the background_generation flag is True, it is called
+                               in a worker thread when the options change, while the
+                               current scene stays interactive.
+
         - generate_actors(): generates the actors that will be used in the
                             animation. The names of the actors will be used
                             to create UI to let the user decide what gets drawn.
@@ -41,6 +65,10 @@ class animation(QObject, named):
                             add_shots function from within generate_shots, passing
                             the shots.
 
+                            The shots can also be passed as a generator, which is
+                            only pulled one shot ahead of the playing shot. This
+                            keeps resetting long animations quick.
+
                             A shot has a name, description and at least a prepare_anim
                             function. Optionally, it can have a cleanup_anim function.
 
@@ -60,8 +88,25 @@ class animation(QObject, named):
                             implement reset() or even just let the generate_actors and
                             generate_shots react to the new options.
 
+        - options_changed(): called once when several options have changed together,
+                             for example after a burst of changes in the UI. By default,
+                             resets the animation once for all of them, then calls
+                             option_changed for each of them without resetting again.
+
         - shot_ended(): called when the currently playing shot ends. By default, plays
                         the next shot if the animation is still playing.
+
+        - save_state(): returns the state of the animation changed by its shots, apart
+                        from the state of the scene items, and restore_state() restores it.
+                        Used to seek to any shot, see seek(). Animations whose state is
+                        too large to be kept for each shot set the snapshot_shots flag to
+                        False, seeking then plays the shots from the start.
+
+        The state of the scene items can also be saved in compact arrays, possibly in
+        a file, and restored later, see save_scene_state() and restore_scene_state().
+
+        While stopped, the frames shown by the view can be cached and replayed when
+        scrubbing through a shot, see get_frame_key().
     """
     def __init__(self, name: str, description: str) -> None:
         QObject.__init__(self)
@@ -72,16 +117,32 @@ class animation(QObject, named):
         self.options = options()
         self.actors = set()
         self.shots = []
+        self._pending_shots = deque()
+        self._generating_shots = False
 
         self.current_shot_index = -1
         self.playing = False
+        self.snapshots = {}
 
         self.loop = False
         self.reset_on_change = True
         self.auto_framing = True
         self.frame_on_start = True
+        self.batch_point_moves = False
+        self.item_index = 'none'
+        self.snapshot_shots = True
+        self._options_reset = False
+        self._shot_plays = 0
+
+        self.background_generation = False
+        self.geometry = None
+        self._prepared_geometry = _no_geometry
+        self._generation = 0
+        self._background_target = None
+        self._geometry_generated.connect(self._on_geometry_generated)
 
     on_shot_changed = Signal(scene, animator, shot)
+    _geometry_generated = Signal(int, object, object)
 
 
     ########################################################################
@@ -96,29 +157,80 @@ class animation(QObject, named):
         The reset function gets called when the options of the animation
         change or when the user press the reset-button in the UI.
         """
-        was_last = (self.current_shot_index >= 0 and self.current_shot_index == len(self.shots) - 1)
+        was_last = self._is_at_last_shot()
         shown_by_names = self.get_shown_actors_by_names()
 
+        # Note: a geometry still being generated in the background is now outdated.
+        self._generation += 1
+        self._background_target = None
+        if self._prepared_geometry is _no_geometry:
+            self.geometry = self.generate_geometry()
+        else:
+            self.geometry, self._prepared_geometry = self._prepared_geometry, _no_geometry
+
         animator.reset()
         
         for actor in self.actors:
             scene.remove_actor(actor)
         scene.remove_all_items()
+        scene.set_item_index(self.item_index)
         self.actors = set()
-        self.shots = []
 
         self.actors.add(scene.pointing_arrow)
         self.generate_actors(scene)
+        self._regenerate_shots(scene, shown_by_names, was_last)
+
+    def reset_actors(self, scene: scene, animator: animator, actor_names) -> bool:
+        """
+        Removes the actors with the given names and recreates them by
+        calling the regenerate_actors function. The other actors, their
+        items and the scene are kept. The shots are recreated.
+
+        Returns False if the animation cannot regenerate only some of its
+        actors, in which case it must be reset.
+        """
+        was_last = self._is_at_last_shot()
+        shown_by_names = self.get_shown_actors_by_names()
+
+        animator.reset()
+
+        for actor in [actor for actor in self.actors if actor.name in actor_names]:
+            self.remove_actor(actor, scene)
+        if not self.regenerate_actors(scene, actor_names):
+            return False
+        self._regenerate_shots(scene, shown_by_names, was_last)
+        return True
+
+    def _is_at_last_shot(self) -> bool:
+        return self.current_shot_index >= 0 and self.current_shot_index == len(self.shots) - 1 and not self._pending_shots
+
+    def _regenerate_shots(self, scene: scene, shown_by_names: _Dict[str, bool], was_last: bool) -> None:
         self.apply_shown_to_actors(shown_by_names)
+        self.snapshots = {}
+        scene.view.clear_frame_cache()
+        self.shots = []
+        self._pending_shots = deque()
         self.generate_shots()
         if self.auto_framing or self.frame_on_start:
             scene.ensure_all_contents_fit()
 
         if was_last:
+            self.generate_all_shots()
             self.current_shot_index = len(self.shots) - 1
         else:
             self.current_shot_index = -1
 
+    def generate_geometry(self):
+        """
+        Generates the pure geometry of the animation, like points and
+        intervals, and returns it. It is kept in the geometry member
+        before generate_actors is called.
+
+        It must not create Qt graphics items, since it can be called
+        in a worker thread, see background_generation.
+        """
+        return None
+
     def generate_actors(self, scene: scene) -> None:
         """
         Generates the actors that will be used in the animation.
@@ -132,6 +244,18 @@ class animation(QObject, named):
         """
         pass
 
+    def regenerate_actors(self, scene: scene, actor_names) -> bool:
+        """
+        Regenerates only the actors with the given names, after an option
+        that affects them changed. The previous actors with these names
+        were already removed. The new ones must be added by calling the
+        add_actors function, like in generate_actors.
+
+        Returns False if the animation cannot regenerate only some of its
+        actors, which is the default. It then gets fully reset.
+        """
+        return False
+
     def generate_shots(self) -> None:
         """
         Generates the shots that make=up the entire animation.
@@ -170,13 +294,73 @@ class animation(QObject, named):
         You can instead react to the options in reset() or just let the
         generate_actors and generate_shots functions react to the new
         options when they do their work.
+
+        When the option declares which actors it affects, only those
+        are regenerated, see regenerate_actors. When several options
+        changed together, the reset was already done once for all of
+        them, see options_changed.
+        """
+        if not self._options_reset:
+            self.reset_play(scene, animator, option.affects)
+
+    def options_changed(self, scene: scene, animator: animator, options: _List[option]) -> None:
+        """
+        Called when several option values changed together, for example
+        when the UI applies the changes made while the user was busy.
+
+        Resets once: only the actors affected by the options when they
+        all declare them, otherwise the whole animation. Then each option
+        is given to option_changed, which does not reset again.
         """
-        self.reset_play(scene, animator)
+        if len(options) == 1:
+            return self.option_changed(scene, animator, options[0])
+        actor_names = set()
+        for option in options:
+            if option.affects is None:
+                actor_names = None
+                break
+            actor_names.update(option.affects)
+        self.reset_play(scene, animator, actor_names)
+
+        self._options_reset = True
+        try:
+            for option in options:
+                self.option_changed(scene, animator, option)
+        finally:
+            self._options_reset = False
+
+    def option_previewed(self, scene: scene, animator: animator, option: option) -> None:
+        """
+        Called on every change of an option value made in the UI, while
+        the call to option_changed is delayed until the user pauses.
+
+        Override in sub-classes to give quick feedback, for example at a
+        reduced level of details, if needed. Does nothing by default.
+        """
+        pass
+
+    def save_state(self):
+        """
+        Returns the state of the animation that its shots change, apart
+        from the state of the scene items, to be restored by restore_state.
+        It is kept in the snapshot taken at the start of each shot.
+
+        Override in sub-classes whose shots change other state. Returns None by default.
+        """
+        return None
+
+    def restore_state(self, state) -> None:
+        """
+        Restores the state returned by save_state, when seeking to a shot.
+        Does nothing by default.
+        """
+        pass
 
     def shot_ended(self, ended_shot: shot, ended_scene: scene, ended_animator: animator):
         """
         Called when the current shot has finished playing in the animator.
         """
+        self.generate_shots_until(self.current_shot_index + 1)
         is_last_shot = (self.current_shot_index == len(self.shots) - 1)
         has_more_shots = self.loop or ended_shot.repeat or not is_last_shot
         keep_playing = self.playing and not self.single_shot and has_more_shots
@@ -255,19 +439,61 @@ class animation(QObject, named):
 
         The shots can be a single shot, a list of shots or a list of lists, etc.
         (Actually supports any iterable.)
+
+        Iterators, like generators, are not pulled immediately but only when
+        the shots they produce are needed, see generate_shots_until(). They
+        can produce shots like add_shots accepts or add them directly.
         """
-        if isinstance(shots, shot):
+        if self._pending_shots and not self._generating_shots:
+            # Note: shots added after a pending iterator must follow its shots.
+            self._pending_shots.append(shots if isinstance(shots, _Iterator) else iter([shots]))
+        elif isinstance(shots, shot):
+            # Note: recorded timelines refer to the actors the shot played on before.
+            shots.clear_timelines()
             self.shots.append(shots)
+        elif isinstance(shots, _Iterator) and not self._generating_shots:
+            self._pending_shots.append(shots)
         else:
             for s in shots:
                 self.add_shots(s)
 
+    def generate_shots_until(self, index: int) -> bool:
+        """
+        Pulls shots from the pending shot iterators until the shot at
+        the given index exists or there are no more shots.
+
+        Returns True if the shot exists.
+        """
+        pending = self._pending_shots
+        while len(self.shots) <= index and pending:
+            self._generating_shots = True
+            try:
+                shots = next(pending[0], _no_more_shots)
+            finally:
+                self._generating_shots = False
+            if shots is _no_more_shots:
+                pending.popleft()
+            elif isinstance(shots, shot):
+                shots.clear_timelines()
+                self.shots.append(shots)
+            elif shots is not None:
+                pending.appendleft(iter(shots))
+        return index < len(self.shots)
+
+    def generate_all_shots(self) -> None:
+        """
+        Pulls all shots from the pending shot iterators.
+        """
+        while self._pending_shots:
+            self.generate_shots_until(len(self.shots))
+
     def add_next_shots(self, shots) -> None:
         """
         Insert the given shots after the currently playing shot.
         """
         if isinstance(shots, shot):
             shots.generated = True
+            shots.clear_timelines()
             self.shots.insert(self.current_shot_index + 1, shots)
         else:
             for s in reversed(shots):
@@ -345,23 +571,68 @@ class animation(QObject, named):
             self.current_shot_index = start_at_shot_index - 1
         self.play_next_shot(scene, animator)
 
-    def reset_play(self, scene: scene, animator: animator) -> None:
+    def reset_play(self, scene: scene, animator: animator, actor_names = None) -> None:
         """
         Reset the current playing shot, if any, when a setting changes.
 
         If the reset_on_change flag is True then it calls the
         reset function and continues playing the animation with the new
-        settings.
+        settings. If actor names are given, it tries to only reset these
+        actors instead, see reset_actors.
+
+        If the background_generation flag is True, the geometry is first
+        generated in a worker thread and the reset happens when it is ready.
         """
         if self.reset_on_change:
+            if self.background_generation and (actor_names is None or self._background_target):
+                self._generate_in_background(scene, animator)
+                return
             # The reset function regenerate the actors, anims and shots,
             # which will make the animator pick up the new animations on the fly.
             was_playing = self.playing
-            self.reset(scene, animator)
+            if actor_names is None or not self.reset_actors(scene, animator, actor_names):
+                self.reset(scene, animator)
             if was_playing:
                 self.resume_play(scene, animator)
                 #self.stop(scene, animator)
 
+    def _generate_in_background(self, scene: scene, animator: animator) -> None:
+        """
+        Generates the geometry in a worker thread. The scene and animator
+        are reset when it is ready, unless another reset happened meanwhile.
+        When the generation fails, the current scene is kept and the error
+        is printed.
+        """
+        self._generation += 1
+        self._background_target = (scene, animator)
+        _get_geometry_executor().submit(self._generate_geometry_in_worker, self._generation)
+
+    def _generate_geometry_in_worker(self, generation: int) -> None:
+        if generation != self._generation:
+            return
+        try:
+            geometry, error = self.generate_geometry(), None
+        except Exception as ex:
+            geometry, error = None, ex
+        # Note: the signal is queued to the thread of the animation.
+        self._geometry_generated.emit(generation, geometry, error)
+
+    def _on_geometry_generated(self, generation: int, geometry, error: Exception) -> None:
+        if generation != self._generation or not self._background_target:
+            return
+        scene, animator = self._background_target
+        self._background_target = None
+        if error:
+            # Note: raising in a queued slot would not reach the caller.
+            print(f"Failed to generate the geometry of {self.name}, keeping the current scene:", file=_sys.stderr)
+            _traceback.print_exception(type(error), error, error.__traceback__)
+            return
+        self._prepared_geometry = geometry
+        was_playing = self.playing
+        self.reset(scene, animator)
+        if was_playing:
+            self.resume_play(scene, animator)
+
     def play_next_shot(self, scene: scene, animator: animator) -> None:
         """
         Plays the next shot, even if already playing.
@@ -369,8 +640,7 @@ class animation(QObject, named):
         If the current shot is a repeating shot, then this repeats the
         curent shot.
         """
-        current_shot = self.shots[self.current_shot_index]
-        if self.current_shot_index == -1 or not current_shot.repeat:
+        if self.current_shot_index == -1 or not self.shots[self.current_shot_index].repeat:
             self.current_shot_index = self.current_shot_index + 1
         self.play_current_shot(scene, animator)
 
@@ -379,7 +649,7 @@ class animation(QObject, named):
         If it was already playing, plays the current shot and keep playing.
         If it was not already playing, then play *only* the current shot.
         """
-        if not self.shots:
+        if not self.generate_shots_until(0):
             return
 
         if not self.playing:
@@ -396,16 +666,29 @@ class animation(QObject, named):
 
         force_framing = False
 
+        self.generate_shots_until(max(0, self.current_shot_index) + 1)
         self.current_shot_index = max(0, self.current_shot_index) % len(self.shots)
         if not self.current_shot_index:
             self.prepare_playing(scene, animator)
             force_framing = self.frame_on_start
 
+        # Note: the previous shot must be finished before capturing the snapshot.
+        #       Only shots reached by playing all the previous ones are captured.
+        animator.reset()
+        index = self.current_shot_index
+        if self.snapshot_shots and index not in self.snapshots and (index == 0 or index - 1 in self.snapshots):
+            self.snapshots[index] = snapshot(scene, self.actors, self.save_state(), self.shots)
+
+        # Note: a repeating shot, or a shot played again after seeking, may
+        #       not show the same thing, so each play has its own frames.
+        self._shot_plays += 1
+
         current_shot = self.shots[self.current_shot_index]
         scene.set_main_title(self.name)
         scene.set_subtitle(self.description)
         scene.set_shot_title(current_shot.name)
         scene.set_shot_description(current_shot.description)
+        scene.update_item_index()
         if force_framing or self.auto_framing:
             scene.ensure_all_contents_fit()
         animator.play(current_shot, self, scene)
@@ -413,6 +696,104 @@ class animation(QObject, named):
             scene.ensure_all_contents_fit()
         self.on_shot_changed.emit(scene, animator, current_shot)
 
+    def seek(self, scene: scene, animator: animator, shot_index: int, fraction: float = 0.) -> None:
+        """
+        Moves to the given fraction of the duration of the given shot and
+        keeps playing if it was playing.
+
+        The state at the start of each shot is captured in a snapshot the
+        first time it plays. Seeking restores the snapshot of the nearest
+        shot at or before the given one, then quickly plays the shots in
+        between, if any, capturing their snapshots along the way. Seeking
+        to a shot that already played thus takes the same time wherever
+        it is in the animation, even if the shots have side effects in
+        their cleanup functions. Without snapshots, see snapshot_shots,
+        the animation is reset and all the shots up to the given one are
+        quickly played.
+        """
+        if not self.generate_shots_until(shot_index):
+            return
+
+        was_playing = self.playing
+        animator.reset()
+        self.playing = False
+
+        start_index = max([index for index in self.snapshots if index <= shot_index], default=None)
+        if start_index is not None:
+            self.restore_snapshot(scene, self.snapshots[start_index])
+        else:
+            start_index = 0
+            if not self.snapshot_shots:
+                self.reset(scene, animator)
+                if not self.generate_shots_until(shot_index):
+                    return
+
+        for index in range(start_index, shot_index):
+            self.current_shot_index = index
+            self.play_current_shot(scene, animator)
+            animator.finish()
+            self.playing = False
+
+        self.current_shot_index = shot_index
+        self.playing = was_playing
+        self.play_current_shot(scene, animator)
+        if fraction > 0.:
+            animator.set_current_time_fraction(fraction)
+        if not was_playing:
+            self.stop(scene, animator)
+
+    def get_frame_key(self, animator: animator, time_quantum: float = 1.):
+        """
+        Returns a key identifying what the scene shows while the animation
+        is stopped, to be given to the frame cache of the view: the current
+        shot and which time it is played, since a shot can show something
+        else when played again, its current time quantized to the given
+        milliseconds, the speed and the shown actors. Returns None while
+        playing, since the frames are not shown again. See view.set_frame_cache().
+        """
+        if self.playing or self.current_shot_index < 0:
+            return None
+        quantized_time = int(round(animator.anim_group.currentTime() / time_quantum))
+        shown_names = tuple(sorted(name for name, shown in self.get_shown_actors_by_names().items() if shown))
+        return (self.current_shot_index, self._shot_plays, quantized_time, animator.anim_speedup, shown_names)
+
+    def restore_snapshot(self, scene: scene, shot_snapshot: snapshot) -> None:
+        """
+        Restores the scene items, the actors, the shots and the state
+        of the animation captured in the given snapshot.
+        """
+        shot_snapshot.restore(scene)
+        self.actors = set(shot_snapshot.actors)
+
+        # Note: the shots added by the shots played after the snapshot will be added again.
+        #       The shots generated from the pending shot iterators since then are kept.
+        captured = { id(s) for s in shot_snapshot.shots }
+        self.shots = shot_snapshot.shots + [s for s in self.shots if not s.generated and id(s) not in captured]
+        self.restore_state(shot_snapshot.state)
+
+    def save_scene_state(self, scene: scene, file_name: str = None) -> scene_state:
+        """
+        Captures the position of all the points and the opacity, drawing order,
+        outline and fill of all the items of the scene in compact arrays, and
+        saves them in the given file, if any. Useful to compare the scene at
+        different times or in different runs, see scene_state.
+        """
+        state = scene_state.capture(scene)
+        if file_name:
+            state.save(file_name)
+        return state
+
+    def restore_scene_state(self, scene: scene, state) -> None:
+        """
+        Restores the state of the items of the scene captured by save_scene_state,
+        given directly or as the name of the file where it was saved. The scene
+        must contain the same items, as created by this animation with the same
+        options. The state of the animation itself is not restored.
+        """
+        if isinstance(state, str):
+            state = scene_state.load(state)
+        state.restore(scene)
+
     def stop(self, scene: scene, animator: animator) -> None:
         """
         Stops playing. Does nothing if already stopped.
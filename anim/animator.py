@@ -1,8 +1,13 @@
 from .ui.ui import connect_auto_signal, disconnect_auto_signals
+from .clock import clock, real_time_clock
+from .tracks import track_engine
+from .timeline import timeline
 from .shot import shot
 from .scene import scene
 from .items import static_point
 
+from time import perf_counter as _perf_counter
+
 from PySide6.QtCore import QVariantAnimation, QAbstractAnimation, QParallelAnimationGroup, Signal, QObject, Qt, QPointF
 
 from typing import List as _List
@@ -51,22 +56,47 @@ class animator(QObject):
     it is also possible to add new animation items when a given item is done.
     This can be useful if you want to chain animations of different items with
     different durations without having to calculate the exact chain of durations.
+
+    The values animated with animate_value() are all evaluated together
+    by a single track_engine per shot instead of a Qt animation per value.
+    When batch_point_moves is set, the items whose points are moved by
+    these values are updated once per tick, see point_batch.
+
+    The time of the shot is provided by a clock. By default, it follows the
+    wall-clock. A virtual_clock can be given instead to advance the time
+    explicitly by exact amounts with advance().
+
+    A profiler can record where the time of each tick goes, see set_profiler().
+
+    The values animated by a shot, or part of a shot, can be recorded in
+    a timeline once and replayed on the following plays, see animate_baked().
     """
 
-    def __init__(self) -> None:
+    def __init__(self, clock: clock = None) -> None:
         """
-        Creates an animator with the given default anmation duration
-        and the optional animation-done callback. This callback is called
-        once all animations added in animate() are done.
+        Creates an animator using the given clock, real-time by default.
         """
         super().__init__()
+        self.clock = clock if clock else real_time_clock()
         self.anim_speedup = 1.
         self.queued_anims = set()
         self.ended_anims = set()
         self.anim_group = animation_group()
+        self.tracks = None
+        self.batch_point_moves = False
         self.current_scene = None
         self.current_shot = None
         self.current_animation = None
+        self.profiler = None
+        self.recording = None
+
+    def set_profiler(self, profiler) -> None:
+        """
+        Sets the profiler recording the ticks of the animations, None to stop profiling.
+        """
+        self.profiler = profiler
+        if self.tracks is not None:
+            self.tracks.profiler = profiler
 
     #################################################################
     #
@@ -108,14 +138,10 @@ class animator(QObject):
         if not values:
             return
 
-        anim = QVariantAnimation()
+        if self.recording is not None:
+            self.recording.record(values, duration, on_changed, on_finished)
 
-        anim.setStartValue(values[0][1])
-        anim.setEndValue(values[-1][1])
-        anim.setKeyValues(values)
-        if on_changed:
-            connect_auto_signal(anim, anim.valueChanged, on_changed)
-        self.animate(anim, duration, on_finished)
+        self._get_tracks().add_track(values, self._get_duration_msecs(duration), on_changed, on_finished)
 
     def animate(self, anim: QAbstractAnimation, duration: float, on_finished = None) -> None:
         """
@@ -126,8 +152,58 @@ class animator(QObject):
 
         When all animations that were added are done, the current animation shot_ended is called.
         """
+        if self.recording is not None:
+            self.recording.replayable = False
+
+        anim.setDuration(self._get_duration_msecs(duration))
+        self._queue_anim(anim, on_finished)
+
+    def animate_baked(self, shot: shot, key, prepare: callable) -> None:
+        """
+        Calls the prepare function, which takes no argument, and records the
+        values it animates in a timeline kept in the shot under the given key.
+        When the shot already has a replayable timeline for that key, replays
+        it instead of calling the prepare function.
+
+        The prepare function must always animate the same values and have
+        no other effect, since it will not be called again until the shot
+        timelines are cleared, which happens when the shot is added again
+        to an animation.
+        """
+        baked = shot.timelines.get(key)
+        if baked is not None and baked.replayable:
+            baked.replay(self)
+            return
+
+        baked = timeline()
+        outer = self.recording
+        self.recording = baked
+        try:
+            prepare()
+        finally:
+            self.recording = outer
+        shot.timelines[key] = baked
+
+        # Note: when nested in another recording, it contains all the same values.
+        if outer is not None:
+            outer.tracks.extend(baked.tracks)
+            outer.replayable = outer.replayable and baked.replayable
+
+    def _get_duration_msecs(self, duration: float) -> int:
+        return int(max(1., duration * 1000. / max(0.001, self.anim_speedup)))
+
+    def _get_tracks(self) -> track_engine:
+        """
+        Returns the track engine evaluating the animated values of the shot.
+        A new one is queued when there is none or when it has already ended.
+        """
+        if self.tracks is None or self.tracks in self.ended_anims:
+            self.tracks = track_engine(self.batch_point_moves, profiler=self.profiler)
+            self._queue_anim(self.tracks)
+        return self.tracks
+
+    def _queue_anim(self, anim: QAbstractAnimation, on_finished = None) -> None:
         self.queued_anims.add(anim)
-        anim.setDuration(max(1., duration * 1000. / max(0.001, self.anim_speedup)))
         if on_finished:
             connect_auto_signal(anim, anim.finished, on_finished)
         ended = lambda: self._anim_ended(anim)
@@ -155,7 +231,8 @@ class animator(QObject):
         from the anim group, clear all queued animations.
 
         Prepare all animations of the shot by calling their prepare_anim functions
-        unless the shot is set to not be shown, in which case do nothing.
+        unless the shot is set to not be shown, in which case do nothing. A baked
+        shot that already played replays its recorded timeline instead.
         """
         # Make sure the anim group is stopped and everything
         # from a previous shot is cleared.
@@ -170,16 +247,42 @@ class animator(QObject):
         self.current_shot = shot
         self.current_scene = scene
         self.current_animation = animation
-        shot.prepare(animation, scene, self)
+        if animation:
+            self.batch_point_moves = animation.batch_point_moves
+        if self.profiler:
+            start = _perf_counter()
+            self._prepare_shot(shot, animation, scene)
+            self.profiler.record_span('prepare', start, _perf_counter())
+        else:
+            self._prepare_shot(shot, animation, scene)
 
-        self.anim_group.start()
+        self.clock.start(self)
         self.check_all_anims_done()
 
+    def _prepare_shot(self, shot: shot, animation, scene: scene) -> None:
+        if shot.bake:
+            self.animate_baked(shot, None, lambda: shot.prepare(animation, scene, self))
+        else:
+            shot.prepare(animation, scene, self)
+
     def stop(self) -> None:
         """
         Stops the anim group.
         """
-        self.anim_group.stop()
+        self.clock.stop(self)
+
+    def advance(self, msecs: float) -> None:
+        """
+        Advances the time of the current shot by the given milliseconds.
+        Mostly useful with a virtual clock.
+        """
+        self.clock.advance(self, msecs)
+
+    def set_current_time(self, msecs: float) -> None:
+        """
+        Sets the current time of the current shot, in milliseconds.
+        """
+        self.clock.set_current_time(self, msecs)
 
     def set_current_time_fraction(self, frac: float):
         """
@@ -187,7 +290,29 @@ class animator(QObject):
         between zero and one.
         """
         duration = self.anim_group.totalDuration()
-        self.anim_group.setCurrentTime(int(round(duration * frac)))
+        self.set_current_time(duration * frac)
+
+    def finish(self, max_rounds: int = 1000) -> None:
+        """
+        Moves all animations of the current shot to their end-time and
+        triggers their anim-finished signals, which ends the shot. The
+        animations queued meanwhile are also finished, for at most the
+        given number of rounds, since an animation may queue another one
+        each time it ends. Animations looping forever are moved to the
+        end of their first loop.
+        """
+        shot = self.current_shot
+        for _ in range(max_rounds):
+            if not shot or self.current_shot is not shot or self.are_all_anims_done():
+                break
+            for anim in list(self.queued_anims):
+                if anim not in self.queued_anims or anim in self.ended_anims:
+                    continue
+                # Note: the total duration of an animation looping forever is -1.
+                duration = anim.totalDuration()
+                anim.setCurrentTime(duration if duration >= 0 else anim.duration())
+                if anim in self.queued_anims and anim not in self.ended_anims:
+                    anim.finished.emit()
 
     def reset(self):
         """
@@ -212,6 +337,7 @@ class animator(QObject):
         self.queued_anims.clear()
         self.ended_anims.clear()
         self.anim_group.clear()
+        self.tracks = None
 
     def are_all_anims_done(self):
         return len(self.queued_anims) == len(self.ended_anims)
@@ -0,0 +1,171 @@
+from PySide6.QtCore import QRectF as _QRectF
+from PySide6.QtWidgets import QGraphicsItem as _QGraphicsItem
+
+from typing import Dict as _Dict, List as _List, Tuple as _Tuple
+
+
+_rect_tuple = _Tuple[float, float, float, float]
+
+class items_bounds:
+    """
+    Bounding rectangle of a set of graphics items, maintained incrementally.
+
+    The scene bounding rectangle of each item is kept, along with their union.
+    Items tell when their geometry changed through item_changed(), which only
+    remembers them. Their new rectangles are read when the union is requested.
+
+    Items growing the union only extend it. The union is only recomputed from
+    the kept rectangles when an item touching its boundary shrank, moved
+    inward or was removed.
+
+    As with QGraphicsScene.itemsBoundingRect(), the children of items are
+    included and empty rectangles are ignored.
+
+    The items whose geometry changed are also counted, to know how many
+    items are moving.
+    """
+
+    def __init__(self) -> None:
+        self._items: _Dict[int, _QGraphicsItem] = {}
+        self._rects: _Dict[int, _rect_tuple] = {}
+        self._changed: _Dict[int, _QGraphicsItem] = {}
+        self._moved = set()
+        self._union: _rect_tuple = None
+        self._needs_recompute = False
+
+    def add_item(self, item: _QGraphicsItem) -> None:
+        """
+        Adds the item and its children. Adding an item again refreshes it.
+        """
+        to_add = [item]
+        while to_add:
+            item = to_add.pop()
+            self._items[id(item)] = item
+            self._changed[id(item)] = item
+            item._bounds = self
+            to_add.extend(item.childItems())
+
+    def remove_item(self, item: _QGraphicsItem) -> None:
+        """
+        Removes the item and its children.
+        """
+        to_remove = [item]
+        while to_remove:
+            item = to_remove.pop()
+            if self._items.pop(id(item), None) is None:
+                continue
+            self._changed.pop(id(item), None)
+            if item._bounds is self:
+                item._bounds = None
+            if self._rects.pop(id(item), None) is not None:
+                self._needs_recompute = True
+            to_remove.extend(item.childItems())
+
+    def item_changed(self, item: _QGraphicsItem) -> None:
+        """
+        Tells that the geometry of the item changed.
+        """
+        if id(item) in self._items:
+            self._changed[id(item)] = item
+            self._moved.add(id(item))
+
+    def items(self) -> _List[_QGraphicsItem]:
+        """
+        Returns the items, including children, in the order they were added.
+        """
+        return list(self._items.values())
+
+    @property
+    def item_count(self) -> int:
+        """
+        The number of items, including children.
+        """
+        return len(self._items)
+
+    def take_moved_count(self) -> int:
+        """
+        Returns the number of items whose geometry changed since the last call.
+        """
+        moved_count = len(self._moved & self._items.keys())
+        self._moved = set()
+        return moved_count
+
+    def rect(self) -> _QRectF:
+        """
+        Returns the union of the scene bounding rectangles of all items.
+        """
+        if self._changed:
+            self._update_changed()
+        if self._needs_recompute:
+            self._recompute()
+        if self._union is None:
+            return _QRectF()
+        left, top, right, bottom = self._union
+        return _QRectF(left, top, right - left, bottom - top)
+
+    @staticmethod
+    def _get_rect(item: _QGraphicsItem) -> _rect_tuple:
+        rect = items_bounds.scene_bounding_rect(item)
+        if rect.isNull():
+            return None
+        return (rect.left(), rect.top(), rect.right(), rect.bottom())
+
+    @staticmethod
+    def scene_bounding_rect(item: _QGraphicsItem) -> _QRectF:
+        """
+        Returns the scene bounding rectangle of the item as Qt computes it.
+
+        Note: some items override sceneBoundingRect in Python, which Qt
+              does not use since it is not virtual.
+        """
+        return _QGraphicsItem.sceneBoundingRect(item)
+
+    def _update_changed(self) -> None:
+        """
+        Reads the new rectangle of the changed items and extends the union.
+        """
+        changed = self._changed
+        self._changed = {}
+        rects = self._rects
+        for key, item in changed.items():
+            new_rect = self._get_rect(item)
+            old_rect = rects.get(key)
+            if new_rect == old_rect:
+                continue
+            if new_rect is None:
+                del rects[key]
+            else:
+                rects[key] = new_rect
+            if self._needs_recompute:
+                continue
+            if old_rect is not None and self._touches_union(old_rect) and not self._covers(new_rect, old_rect):
+                self._needs_recompute = True
+            elif new_rect is not None:
+                self._extend_union(new_rect)
+
+    def _touches_union(self, rect: _rect_tuple) -> bool:
+        left, top, right, bottom = self._union
+        return rect[0] <= left or rect[1] <= top or rect[2] >= right or rect[3] >= bottom
+
+    @staticmethod
+    def _covers(rect: _rect_tuple, other: _rect_tuple) -> bool:
+        if rect is None:
+            return False
+        return rect[0] <= other[0] and rect[1] <= other[1] and rect[2] >= other[2] and rect[3] >= other[3]
+
+    def _extend_union(self, rect: _rect_tuple) -> None:
+        if self._union is None:
+            self._union = rect
+        else:
+            left, top, right, bottom = self._union
+            self._union = (min(left, rect[0]), min(top, rect[1]), max(right, rect[2]), max(bottom, rect[3]))
+
+    def _recompute(self) -> None:
+        self._needs_recompute = False
+        rects = self._rects.values()
+        if not rects:
+            self._union = None
+            return
+        self._union = (
+            min(rect[0] for rect in rects), min(rect[1] for rect in rects),
+            max(rect[2] for rect in rects), max(rect[3] for rect in rects))
@@ -0,0 +1,92 @@
+class clock:
+    """
+    Source of time of an animator.
+
+    The animator starts the clock at the beginning of each shot and stops
+    it when the animation is stopped. The clock decides how the time of
+    the animator anim group advances.
+    """
+
+    def start(self, animator) -> None:
+        """
+        Starts the clock at the beginning of a shot.
+        """
+        pass
+
+    def stop(self, animator) -> None:
+        """
+        Stops the clock.
+        """
+        animator.anim_group.stop()
+
+    def set_current_time(self, animator, msecs: float) -> None:
+        """
+        Sets the current time of the shot, in milliseconds.
+        """
+        animator.anim_group.setCurrentTime(int(round(msecs)))
+
+    def advance(self, animator, msecs: float) -> None:
+        """
+        Advances the current time of the shot by the given milliseconds.
+        """
+        self.set_current_time(animator, animator.anim_group.currentTime() + msecs)
+
+
+class real_time_clock(clock):
+    """
+    Clock following the wall-clock, using the Qt animation timers.
+
+    The time advances while the Qt event loop runs. This is what is used
+    to play animations in the app window.
+    """
+
+    def start(self, animator) -> None:
+        animator.anim_group.start()
+
+
+class virtual_clock(clock):
+    """
+    Clock whose time only advances when explicitly told to.
+
+    The anim group is kept stopped, so the Qt timers never advance it.
+    The time only advances when calling advance() or set_current_time(),
+    by exact amounts. This makes playing an animation fully deterministic,
+    which is useful for exporting frames, tests and benchmarks.
+
+    The end of animations, and thus the end of the shot, are triggered
+    from within the call that moved the time past their end.
+    """
+
+    def __init__(self) -> None:
+        self.current_time = 0.
+
+    def start(self, animator) -> None:
+        self.current_time = 0.
+        animator.anim_group.stop()
+        animator.anim_group.setCurrentTime(0)
+
+    def set_current_time(self, animator, msecs: float) -> None:
+        self.current_time = msecs
+        super().set_current_time(animator, msecs)
+        self._finish_ended_anims(animator)
+
+    def advance(self, animator, msecs: float) -> None:
+        self.set_current_time(animator, self.current_time + msecs)
+
+    def _finish_ended_anims(self, animator) -> None:
+        """
+        Triggers the finished signal of the animations that reached their end.
+
+        Note: the anim group is stopped, so Qt does not emit them by itself.
+              Emitting them from within the anim group would be unsafe anyway
+              because ending the shot removes the animations from the group.
+        """
+        queued_anims = animator.queued_anims
+        ended_anims = animator.ended_anims
+        for anim in list(queued_anims):
+            # Note: a finished animation may have ended the shot and started
+            #       the next one, which replaces the queued animations.
+            if anim not in queued_anims or anim in ended_anims:
+                continue
+            if anim.currentTime() >= anim.totalDuration():
+                anim.finished.emit()
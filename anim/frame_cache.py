@@ -0,0 +1,76 @@
+from PySide6.QtGui import QImage as _QImage
+
+from collections import OrderedDict
+
+
+class frame_cache:
+    """
+    Images of recently painted frames of the view, to replay them without
+    painting the scene again, for example when scrubbing back and forth
+    through a shot with the current time slider.
+
+    The frames are kept under a key identifying what the view shows, see
+    view.set_frame_cache(). The least recently used frames are evicted
+    when the images take more than the maximum number of bytes.
+
+    The number of lookups that found a frame are counted to give the hit rate.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024) -> None:
+        """
+        Creates an empty cache keeping at most the given number of bytes of images.
+        """
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._frames = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        The fraction of lookups that found a frame, between zero and one.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.
+
+    def get(self, key) -> _QImage:
+        """
+        Returns the frame kept under the given key, None if there is none.
+        """
+        image = self._frames.get(key)
+        if image is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._frames.move_to_end(key)
+        return image
+
+    def put(self, key, image: _QImage) -> None:
+        """
+        Keeps the frame under the given key, evicting the least recently
+        used frames to stay within the maximum number of bytes. A frame
+        larger than the maximum is not kept.
+        """
+        old_image = self._frames.pop(key, None)
+        if old_image is not None:
+            self.size_bytes -= old_image.sizeInBytes()
+        image_bytes = image.sizeInBytes()
+        if image_bytes > self.max_bytes:
+            return
+        while self._frames and self.size_bytes + image_bytes > self.max_bytes:
+            _, evicted = self._frames.popitem(last=False)
+            self.size_bytes -= evicted.sizeInBytes()
+        self._frames[key] = image
+        self.size_bytes += image_bytes
+
+    def clear(self) -> None:
+        """
+        Forgets all frames, for example when the scene changed other than by
+        the time advancing. The hit counts are kept.
+        """
+        self._frames.clear()
+        self.size_bytes = 0
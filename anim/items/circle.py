@@ -48,6 +48,16 @@ class _circle_base(_QGraphicsEllipseItem, item):
         self.setSpanAngle(fraction * 360. * 16.)
         return self
 
+    def get_state(self) -> dict:
+        state = super().get_state()
+        state['angles'] = (self.startAngle(), self.spanAngle())
+        return state
+
+    def set_state(self, state: dict):
+        self.setStartAngle(state['angles'][0])
+        self.setSpanAngle(state['angles'][1])
+        return super().set_state(state)
+
     def scene_rect(self) -> static_rectangle:
         return self.sceneBoundingRect()        
 
@@ -61,6 +71,7 @@ class _circle_base(_QGraphicsEllipseItem, item):
         if current_rect != self.rect():
             self.prepareGeometryChange()
             self.setRect(current_rect)
+            self._geometry_changed()
 
 
 class circle(_circle_base):
@@ -93,6 +104,18 @@ class circle(_circle_base):
         """
         return (self.center, self.radius)
 
+    def get_state(self) -> dict:
+        state = super().get_state()
+        state['center'] = self.center
+        state['radius'] = self.radius
+        return state
+
+    def set_state(self, state: dict) -> _circle_base:
+        if state['center'] is not self.center:
+            self.set_center(state['center'])
+        self.radius = state['radius']
+        return super().set_state(state)
+
     def get_all_points(self) -> _List[point]:
         """
         Retrieve all animatable points in the item.
@@ -171,6 +194,19 @@ class radius_circle(_circle_base):
 
         return (center, radius)
 
+    def get_state(self) -> dict:
+        state = super().get_state()
+        state['center'] = self.center
+        state['radius_point'] = self.radius_point
+        return state
+
+    def set_state(self, state: dict) -> _circle_base:
+        if state['center'] is not self.center:
+            self.set_center(state['center'])
+        if state['radius_point'] is not self.radius_point:
+            self.set_radius(state['radius_point'])
+        return super().set_state(state)
+
     def get_all_points(self) -> _List[point]:
         """
         Retrieve all animatable points in the item.
@@ -199,6 +235,17 @@ class partial_circle(circle):
         radius_point2.add_user(self)
         return self
 
+    def get_state(self) -> dict:
+        state = super().get_state()
+        state['radius_points'] = (self.radius_point1, self.radius_point2)
+        return state
+
+    def set_state(self, state: dict) -> _circle_base:
+        radius_point1, radius_point2 = state['radius_points']
+        if radius_point1 is not self.radius_point1 or radius_point2 is not self.radius_point2:
+            self.set_radius_points(radius_point1, radius_point2)
+        return super().set_state(state)
+
     def get_all_points(self) -> _List[point]:
         """
         Retrieve all animatable points in the item.
@@ -33,6 +33,8 @@ class group(_Group, item):
         self.sub_items = sub_items or []
         for i in self.sub_items:
             self.addToGroup(i)
+        if self._bounds is not None:
+            self._bounds.add_item(self)
 
     def get_all_points(self) -> _List[point]:
         """
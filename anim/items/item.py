@@ -2,7 +2,7 @@ from .color import color
 from .pen import pen
 from .point import point, static_point
 
-from PySide6.QtGui import QBrush as _QBrush
+from PySide6.QtGui import QBrush as _QBrush, QPen as _QPen
 
 from typing import List as _List
 
@@ -10,6 +10,10 @@ class item:
     """
     Item that can be animated.
     """
+
+    # Note: the bounds of the scene containing the item, see items_bounds.
+    _bounds = None
+
     def __init__(self, _) -> None:
         pass
 
@@ -36,6 +40,13 @@ class item:
     def scene_rect(self):
         pass
 
+    def _geometry_changed(self) -> None:
+        """
+        Tells the scene bounds that the geometry of the item changed.
+        """
+        if self._bounds is not None:
+            self._bounds.item_changed(self)
+
     def center_on(self, other):
         """
         Centers this item on the given item.
@@ -57,6 +68,7 @@ class item:
         Sets the color of the pen used to draw the outline of the item.
         """
         self.setPen(pen(new_color, self.pen().widthF()))
+        self._geometry_changed()
         return self
 
     def get_outline(self) -> color:
@@ -70,6 +82,7 @@ class item:
         Sets the thickness of the pen used to draw the outline of the item.
         """
         self.setPen(pen(self.pen().color(), new_width))
+        self._geometry_changed()
         return self
 
     def get_thickness(self) -> float:
@@ -122,4 +135,37 @@ class item:
         Set drawing priority, higher order is on top.
         """
         self.setZValue(order)
-        return self
\ No newline at end of file
+        return self
+
+
+    ########################################################################
+    #
+    # State
+
+    def get_state(self) -> dict:
+        """
+        Retrieves the state of the item that animations change, apart from
+        its points, to be restored with set_state. See snapshot.
+
+        The visibility is not part of it, since the user chooses which actors are shown.
+        Items holding more state extend it.
+        """
+        state = { 'opacity': self.opacity(), 'z': self.zValue() }
+        if hasattr(self, 'pen'):
+            state['pen'] = _QPen(self.pen())
+        if hasattr(self, 'brush'):
+            state['brush'] = _QBrush(self.brush())
+        return state
+
+    def set_state(self, state: dict):
+        """
+        Restores the state retrieved with get_state. The geometry of
+        the item is updated afterward, once its points are restored.
+        """
+        self.setOpacity(state['opacity'])
+        self.setZValue(state['z'])
+        if 'pen' in state:
+            self.setPen(state['pen'])
+        if 'brush' in state:
+            self.setBrush(state['brush'])
+        return self
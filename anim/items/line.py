@@ -44,3 +44,4 @@ class line(_QGraphicsLineItem, item):
         if current_line != self.line():
             self.prepareGeometryChange()
             self.setLine(current_line)
+            self._geometry_changed()
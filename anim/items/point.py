@@ -4,6 +4,71 @@ from math import cos as _cos, sin as _sin, sqrt as _sqrt, atan2 as _atan2
 
 static_point= _QPointF
     
+class point_batch:
+    """
+    Defers the geometry updates of the items built from points while moving
+    many points, so that each item is updated only once, when the batch ends.
+
+    Use as a context manager:
+
+        with point_batch():
+            for pt in points:
+                pt.set_point(...)
+
+    Points that depend on other points are still updated immediately, so
+    the position of any point can be read within the batch. Batches can be
+    nested, the items are updated when the outermost batch ends.
+
+    The geometry of the items is out-of-date until the batch ends, so items
+    whose updates read the geometry of other items or move points should
+    not be updated in a batch.
+    """
+
+    _depth = 0
+    _dirty_users = {}
+
+    def __enter__(self) -> 'point_batch':
+        point_batch.begin()
+        return self
+
+    def __exit__(self, *args) -> None:
+        point_batch.end()
+
+    @staticmethod
+    def begin() -> None:
+        """
+        Starts deferring the item updates.
+        """
+        point_batch._depth += 1
+
+    @staticmethod
+    def end() -> None:
+        """
+        Ends the batch started by begin(). Updates the items if it was the outermost batch.
+        """
+        point_batch._depth -= 1
+        if not point_batch._depth:
+            point_batch.flush()
+
+    @staticmethod
+    def defer_update(user) -> None:
+        """
+        Defers the geometry update of the given item until the batch ends.
+        """
+        point_batch._dirty_users[id(user)] = user
+
+    @staticmethod
+    def flush() -> None:
+        """
+        Updates the geometry of the items whose points moved.
+        """
+        dirty_users = point_batch._dirty_users
+        while dirty_users:
+            users = list(dirty_users.values())
+            dirty_users.clear()
+            for u in users:
+                u._update_geometry()
+
 class point(static_point):
     """
     A dynamic point that can be animated from its original position and which
@@ -53,9 +118,24 @@ class point(static_point):
             self.setX(new_point.x())
             self.setY(new_point.y())
 
+            self._notify_users()
+        return self
+
+    def _notify_users(self) -> None:
+        """
+        Updates the users of the point. Inside a point_batch, the update of
+        the users that are not points is deferred until the batch ends.
+        """
+        if point_batch._depth:
+            dirty_users = point_batch._dirty_users
+            for u in self._users:
+                if isinstance(u, point):
+                    u._update_geometry()
+                else:
+                    dirty_users[id(u)] = u
+        else:
             for u in self._users:
                 u._update_geometry()
-        return self
 
     def set_absolute_point(self, new_point: static_point) -> static_point:
         """
@@ -71,6 +151,27 @@ class point(static_point):
         self.set_absolute_point(self.original_point)
         return self
 
+    def get_origins(self) -> _List[static_point]:
+        """
+        Retrieves the points this point depends on.
+        """
+        return []
+
+    def get_state(self):
+        """
+        Retrieves the state of the point, to be restored with set_state.
+        """
+        return static_point(self)
+
+    def set_state(self, state) -> static_point:
+        """
+        Restores the state of the point without notifying its users,
+        which must be updated once all the points they use are restored.
+        """
+        self.setX(state.x())
+        self.setY(state.y())
+        return self
+
     @staticmethod
     def distance_squared(p1: static_point, p2: static_point) -> float:
         """
@@ -149,6 +250,16 @@ class relative_point(point):
         self._update_geometry()
         return self
 
+    def get_origins(self) -> _List[static_point]:
+        return [self.origin]
+
+    def get_state(self):
+        return (super().get_state(), static_point(self.delta))
+
+    def set_state(self, state) -> point:
+        self.delta = static_point(state[1])
+        return super().set_state(state[0])
+
 class radial_point(point):
     """
     A dynamic point with an position at given distance and angle around from another point, called its origin.
@@ -217,6 +328,17 @@ class radial_point(point):
         self._update_geometry()
         return self
 
+    def get_origins(self) -> _List[static_point]:
+        return [self.origin]
+
+    def get_state(self):
+        return (super().get_state(), self.radius, self.angle)
+
+    def set_state(self, state) -> point:
+        self.radius = state[1]
+        self.angle = state[2]
+        return super().set_state(state[0])
+
 
 class relative_radial_point(point):
     """
@@ -283,6 +405,17 @@ class relative_radial_point(point):
         self._update_geometry()
         return self
 
+    def get_origins(self) -> _List[static_point]:
+        return [self.origin]
+
+    def get_state(self):
+        return (super().get_state(), self.radius_delta, self.angle_delta)
+
+    def set_state(self, state) -> point:
+        self.radius_delta = state[1]
+        self.angle_delta = state[2]
+        return super().set_state(state[0])
+
 
 class selected_point(point):
     """
@@ -316,3 +449,5 @@ class selected_point(point):
         if new_pos != self:
             super().set_absolute_point(new_pos)
 
+    def get_origins(self) -> _List[static_point]:
+        return list(self._points)
@@ -0,0 +1,243 @@
+from .point import point, relative_point, radial_point, relative_radial_point, static_point, point_batch
+
+import numpy as _np
+from typing import Dict as _Dict, List as _List
+
+
+class point_graph:
+    """
+    A compiled copy of a hierarchy of dynamic points, kept in NumPy arrays.
+
+    The graph is made of the given points, all the points depending on them
+    and all the points they depend on. For each point, it keeps its kind,
+    the index of its origin and its parameters: the delta of relative points,
+    the radius and angle of radial points and the radius and angle deltas
+    of relative radial points.
+
+    Points of other kinds, like selected points, and the points they depend on
+    are not compiled. They are used as roots of the graph, whose position is
+    read from the point when evaluating, or updated as normal users of the
+    compiled points when writing back. Points created after the graph are
+    also updated as normal users.
+
+    The absolute positions of all points are evaluated level by level in
+    dependency order with vectorized operations, then written back in the
+    points, updating the items using them once. This replaces the recursive
+    propagation of moves through the users of the points.
+
+    The parameters can be modified directly in the arrays, for example to
+    animate many relative points at once, then applied with update(). When
+    the points are modified through their own functions instead, call
+    read_parameters() before update().
+    """
+
+    ROOT = 0
+    RELATIVE = 1
+    RADIAL = 2
+    RELATIVE_RADIAL = 3
+
+    def __init__(self, points: _List[point]) -> None:
+        """
+        Compiles the given points, with the points they depend on and
+        the points depending on them.
+        """
+        self.points: _List[point] = []
+        self._indices: _Dict[int, int] = {}
+
+        self._add_descendants(points)
+        self._sort_by_levels()
+
+        count = len(self.points)
+        self.positions = _np.array([(pt.x(), pt.y()) for pt in self.points], dtype=_np.float64).reshape(count, 2)
+        self.deltas = _np.zeros((count, 2))
+        self.radii = _np.zeros(count)
+        self.angles = _np.zeros(count)
+        self.read_parameters()
+
+        self._compiled = set(id(pt) for pt, kind in zip(self.points, self.kinds) if kind != point_graph.ROOT)
+
+    ########################################################################
+    #
+    # Compilation
+
+    @staticmethod
+    def _get_kind(pt: point) -> int:
+        point_type = type(pt)
+        if point_type is relative_point:
+            return point_graph.RELATIVE
+        if point_type is radial_point:
+            return point_graph.RADIAL
+        if point_type is relative_radial_point and type(pt.origin) is radial_point:
+            return point_graph.RELATIVE_RADIAL
+        return point_graph.ROOT
+
+    def _add_point(self, pt: point) -> bool:
+        """
+        Adds the point and the points it depends on. Returns True if it was added.
+        """
+        if id(pt) in self._indices:
+            return False
+        # Note: the chain of origins is followed in a loop, not recursively,
+        #       since hierarchies can be deeper than the Python stack.
+        chain = [pt]
+        while self._get_kind(chain[-1]) != point_graph.ROOT and id(chain[-1].origin) not in self._indices:
+            chain.append(chain[-1].origin)
+        for added in reversed(chain):
+            self._indices[id(added)] = len(self.points)
+            self.points.append(added)
+        return True
+
+    def _add_descendants(self, points: _List[point]) -> None:
+        to_visit = list(points)
+        while to_visit:
+            pt = to_visit.pop()
+            if not self._add_point(pt):
+                continue
+            # Note: points of unknown kinds are roots, so they must not
+            #       be evaluated from their users.
+            for user in pt._users:
+                if isinstance(user, point) and self._get_kind(user) != point_graph.ROOT:
+                    to_visit.append(user)
+
+    def _sort_by_levels(self) -> None:
+        """
+        Sorts the points so that each point comes after the points it depends on,
+        and finds the points of each level, where a level only depend on previous levels.
+        """
+        # Note: points are always added after their origin, see _add_point,
+        #       so the level of the origin is known when reaching a point.
+        levels = [0] * len(self.points)
+        for index, pt in enumerate(self.points):
+            if self._get_kind(pt) != point_graph.ROOT:
+                levels[index] = levels[self._indices[id(pt.origin)]] + 1
+
+        order = sorted(range(len(self.points)), key=lambda index: levels[index])
+        self.points = [self.points[index] for index in order]
+        self._indices = { id(pt): index for index, pt in enumerate(self.points) }
+        levels = [levels[index] for index in order]
+
+        self.kinds = _np.array([self._get_kind(pt) for pt in self.points], dtype=_np.int8)
+        self.origins = _np.array([
+            self._indices[id(pt.origin)] if kind != point_graph.ROOT else index
+            for index, (pt, kind) in enumerate(zip(self.points, self.kinds))], dtype=_np.int64)
+        self.roots = _np.flatnonzero(self.kinds == point_graph.ROOT)
+
+        levels = _np.array(levels, dtype=_np.int64)
+        self._levels = [
+            { kind: _np.flatnonzero((levels == level) & (self.kinds == kind)) for kind in (point_graph.RELATIVE, point_graph.RADIAL, point_graph.RELATIVE_RADIAL) }
+            for level in range(1, int(levels.max(initial=0)) + 1)]
+
+    def index(self, pt: point) -> int:
+        """
+        Returns the index of the point in the arrays of the graph.
+        """
+        return self._indices[id(pt)]
+
+    ########################################################################
+    #
+    # Parameters
+
+    def read_parameters(self) -> None:
+        """
+        Reads the parameters of the compiled points from the points themselves.
+        """
+        for index, (pt, kind) in enumerate(zip(self.points, self.kinds)):
+            if kind == point_graph.RELATIVE:
+                self.deltas[index] = (pt.delta.x(), pt.delta.y())
+            elif kind == point_graph.RADIAL:
+                self.radii[index] = pt.radius
+                self.angles[index] = pt.angle
+            elif kind == point_graph.RELATIVE_RADIAL:
+                self.radii[index] = pt.radius_delta
+                self.angles[index] = pt.angle_delta
+        self._written_deltas = self.deltas.copy()
+        self._written_radii = self.radii.copy()
+        self._written_angles = self.angles.copy()
+
+    def _write_parameters(self) -> None:
+        """
+        Writes the parameters that were modified in the arrays in the points.
+        """
+        changed = _np.flatnonzero(
+            (self.deltas != self._written_deltas).any(axis=1) |
+            (self.radii != self._written_radii) |
+            (self.angles != self._written_angles))
+        for index in changed.tolist():
+            pt = self.points[index]
+            kind = self.kinds[index]
+            if kind == point_graph.RELATIVE:
+                pt.delta = static_point(*self.deltas[index].tolist())
+            elif kind == point_graph.RADIAL:
+                pt.radius = float(self.radii[index])
+                pt.angle = float(self.angles[index])
+            elif kind == point_graph.RELATIVE_RADIAL:
+                pt.radius_delta = float(self.radii[index])
+                pt.angle_delta = float(self.angles[index])
+        self._written_deltas[changed] = self.deltas[changed]
+        self._written_radii[changed] = self.radii[changed]
+        self._written_angles[changed] = self.angles[changed]
+
+    ########################################################################
+    #
+    # Evaluation
+
+    def evaluate(self) -> _np.ndarray:
+        """
+        Evaluates the absolute positions of all points and returns them.
+        The points themselves are not modified.
+        """
+        positions = self.positions.copy()
+        roots = self.roots
+        positions[roots] = [(pt.x(), pt.y()) for pt in (self.points[index] for index in roots.tolist())]
+
+        origins = self.origins
+        for level in self._levels:
+            indices = level[point_graph.RELATIVE]
+            if len(indices):
+                positions[indices] = positions[origins[indices]] + self.deltas[indices]
+
+            indices = level[point_graph.RADIAL]
+            if len(indices):
+                angles = self.angles[indices]
+                radii = self.radii[indices]
+                positions[indices, 0] = positions[origins[indices], 0] + _np.cos(angles) * radii
+                positions[indices, 1] = positions[origins[indices], 1] + _np.sin(angles) * radii
+
+            indices = level[point_graph.RELATIVE_RADIAL]
+            if len(indices):
+                radial = origins[indices]
+                centers = origins[radial]
+                angles = self.angles[radial] + self.angles[indices]
+                radii = self.radii[radial] + self.radii[indices]
+                positions[indices, 0] = positions[centers, 0] + _np.cos(angles) * radii
+                positions[indices, 1] = positions[centers, 1] + _np.sin(angles) * radii
+
+        return positions
+
+    def update(self) -> None:
+        """
+        Evaluates the absolute positions of all points and writes them back
+        in the points. The items using the points that moved are updated once.
+        """
+        self._write_parameters()
+        positions = self.evaluate()
+        # Note: the roots are not written, their users were already
+        #       notified when they moved.
+        changed = _np.flatnonzero((positions != self.positions).any(axis=1) & (self.kinds != point_graph.ROOT))
+        self.positions = positions
+
+        with point_batch():
+            set_x = static_point.setX
+            set_y = static_point.setY
+            compiled = self._compiled
+            for index, (x, y) in zip(changed.tolist(), positions[changed].tolist()):
+                pt = self.points[index]
+                set_x(pt, x)
+                set_y(pt, y)
+                for user in pt._users:
+                    if id(user) in compiled:
+                        continue
+                    if isinstance(user, point):
+                        user._update_geometry()
+                    else:
+                        point_batch.defer_update(user)
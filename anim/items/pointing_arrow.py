@@ -49,6 +49,19 @@ class pointing_arrow(_QGraphicsPathItem, item):
         """
         return [self.head, self.tail]
 
+    def get_state(self) -> dict:
+        state = super().get_state()
+        state['head'] = self.head
+        state['tail'] = self.tail
+        return state
+
+    def set_state(self, state: dict):
+        if state['head'] is not self.head:
+            self.set_head(state['head'])
+        if state['tail'] is not self.tail:
+            self.set_tail(state['tail'])
+        return super().set_state(state)
+
     def scene_rect(self) -> static_rectangle:
         return self.sceneBoundingRect()        
 
@@ -103,3 +116,4 @@ class pointing_arrow(_QGraphicsPathItem, item):
         arrow_path.lineTo( arrow_tail + arrow_tail_target_dist)
 
         self.setPath(arrow_path)
+        self._geometry_changed()
@@ -59,3 +59,4 @@ class polygon(_QGraphicsPolygonItem, item):
         if current_poly != self.polygon():
             self.prepareGeometryChange()
             self.setPolygon(current_poly)
+            self._geometry_changed()
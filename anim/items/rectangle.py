@@ -38,6 +38,7 @@ class rectangle(_QGraphicsRectItem, item):
         if current_rect != self.rect():
             self.prepareGeometryChange()
             self.setRect(current_rect)
+            self._geometry_changed()
 
 class center_rectangle(_QGraphicsRectItem, item):
     """
@@ -69,3 +70,4 @@ class center_rectangle(_QGraphicsRectItem, item):
         if current_rect != self.rect():
             self.prepareGeometryChange()
             self.setRect(current_rect)
+            self._geometry_changed()
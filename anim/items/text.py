@@ -58,6 +58,7 @@ class scaling_text(_QGraphicsSimpleTextItem, item):
         font.setPointSizeF(max(0.5, font_size))
         font.setBold(is_bold)
         self.setFont(font)
+        self._geometry_changed()
         return self
 
     def get_font_size(self) -> float:
@@ -183,6 +184,34 @@ class scaling_text(_QGraphicsSimpleTextItem, item):
         if new_pos != self.scenePos():
             self.prepareGeometryChange()
             self.setPos(new_pos)
+            self._geometry_changed()
+
+    def setText(self, text: str) -> None:
+        super().setText(text)
+        self._geometry_changed()
+
+    def get_state(self) -> dict:
+        state = super().get_state()
+        state['text'] = self.text()
+        state['font'] = _QFont(self.font())
+        state['alignment'] = static_point(self.alignment)
+        return state
+
+    def set_state(self, state: dict):
+        changed = False
+        if state['font'] != self.font():
+            self.setFont(state['font'])
+            changed = True
+        if state['text'] != self.text():
+            self.setText(state['text'])
+            changed = True
+        if state['alignment'] != self.alignment:
+            self.alignment = static_point(state['alignment'])
+            changed = True
+        super().set_state(state)
+        if changed:
+            self._update_geometry()
+        return self
 
 class fixed_size_text(scaling_text):
     """
@@ -204,6 +233,22 @@ class fixed_size_text(scaling_text):
         super().set_font(font_name, font_size, is_bold)
         return self._update_letter_size()
 
+    def get_state(self) -> dict:
+        state = super().get_state()
+        state['rect'] = static_rectangle(self._real_rect)
+        return state
+
+    def set_state(self, state: dict):
+        if state['font'] != self.font():
+            self.setFont(state['font'])
+            self._update_letter_size()
+        super().set_state(state)
+        if state['rect'] != self._real_rect:
+            self.prepareGeometryChange()
+            self._real_rect.setRect(*state['rect'].getRect())
+            self._geometry_changed()
+        return self
+
     def _update_letter_size(self) -> scaling_text:
         self.letter_width = _QFontMetricsF(self.font()).averageCharWidth()
         self.letter_height = _QFontMetricsF(self.font()).height()
@@ -271,3 +316,4 @@ class fixed_size_text(scaling_text):
         letter_count = max([self.min_line_length] + [len(line) for line in lines])
 
         self._real_rect.setRect(0., 0., int(letter_width * letter_count), letter_height * lineCount)
+        self._geometry_changed()
@@ -0,0 +1,160 @@
+from collections import deque
+from time import perf_counter as _perf_counter
+from typing import Dict as _Dict, List as _List
+
+import json as _json
+
+
+class profiler:
+    """
+    Records where the time of each animation tick goes.
+
+    A tick is one update of the animated values of a shot. The time of
+    each tick is split in sections:
+
+        - interpolation: computing the new animated values.
+        - callbacks: calling the on_changed callbacks with these values.
+        - points: updating the items whose points moved, when the points
+                  moves are batched. Otherwise, it is part of the callbacks.
+        - finished: calling the on_finished callbacks of the ended animations.
+
+    The preparation of shots is recorded as a prepare section and the
+    painting of the view as a paint section, both attached to the latest tick.
+    A tick is painted once, so the following paints, for example while the
+    animation is stopped, are each recorded in a new tick without tracks.
+    The number of tracks still active at each tick is also recorded, as
+    are the lookups in the frame cache of the view and its size, if any.
+
+    Only the latest ticks are kept. They can be summarized, shown in the
+    view as a HUD and saved as a Chrome trace, viewable in chrome://tracing
+    or Perfetto.
+
+    Give the profiler to the animator and view with their set_profiler functions.
+    """
+
+    sections = ['prepare', 'interpolation', 'callbacks', 'points', 'finished', 'paint']
+
+    def __init__(self, max_ticks: int = 2000) -> None:
+        self.ticks = deque(maxlen=max_ticks)
+        self._mark = 0.
+
+    def clear(self) -> None:
+        """
+        Forgets all recorded ticks.
+        """
+        self.ticks.clear()
+
+
+    ########################################################################
+    #
+    # Recording
+
+    def begin_tick(self, active_tracks: int) -> None:
+        """
+        Starts recording a new tick with the given number of active tracks.
+        """
+        self._mark = _perf_counter()
+        self.ticks.append({ 'start': self._mark, 'tracks': active_tracks, 'spans': [] })
+
+    def record(self, section: str) -> None:
+        """
+        Records the time since the previous record of the tick in the given section.
+        """
+        now = _perf_counter()
+        self.record_span(section, self._mark, now)
+        self._mark = now
+
+    def record_span(self, section: str, start: float, end: float) -> None:
+        """
+        Records the span of time, in perf_counter seconds, in the given
+        section of the latest tick. A paint of an already painted tick is
+        recorded in a new tick.
+        """
+        if not self.ticks or (section == 'paint' and any(span[0] == 'paint' for span in self.ticks[-1]['spans'])):
+            self.ticks.append({ 'start': start, 'tracks': 0, 'spans': [] })
+        self.ticks[-1]['spans'].append((section, start, end))
+
+    def record_frame_cache(self, hit: bool, size_bytes: int, frames_count: int) -> None:
+        """
+        Records a lookup in the frame cache of the view, whether it found
+        the frame, and the size of the cache in the latest tick.
+        """
+        if not self.ticks:
+            self.ticks.append({ 'start': _perf_counter(), 'tracks': 0, 'spans': [] })
+        tick = self.ticks[-1]
+        hits, lookups, _, _ = tick.get('cache', (0, 0, 0, 0))
+        tick['cache'] = (hits + int(hit), lookups + 1, size_bytes, frames_count)
+
+
+    ########################################################################
+    #
+    # Reporting
+
+    def summary(self, last_ticks: int = None) -> _Dict[str, float]:
+        """
+        Returns the average milliseconds per tick spent in each section
+        over the given number of latest ticks, all by default, along with
+        the average total and number of active tracks.
+
+        When the frame cache of the view was used, the hit rate of its
+        lookups and its latest size, in megabytes and frames, are added.
+        """
+        ticks = list(self.ticks)
+        if last_ticks is not None:
+            ticks = ticks[-last_ticks:]
+        totals = { section: 0. for section in profiler.sections }
+        tracks = 0
+        cache_hits, cache_lookups, cache = 0, 0, None
+        for tick in ticks:
+            tracks += tick['tracks']
+            for section, start, end in tick['spans']:
+                totals[section] = totals.get(section, 0.) + (end - start) * 1000.
+            if 'cache' in tick:
+                cache = tick['cache']
+                cache_hits += cache[0]
+                cache_lookups += cache[1]
+        count = max(1, len(ticks))
+        summary = { section: total / count for section, total in totals.items() }
+        summary['total'] = sum(totals.values()) / count
+        summary['tracks'] = tracks / count
+        if cache_lookups:
+            summary['cache hit rate'] = cache_hits / cache_lookups
+            summary['cache MB'] = cache[2] / (1024. * 1024.)
+            summary['cache frames'] = cache[3]
+        return summary
+
+    def hud_lines(self, last_ticks: int = 30) -> _List[str]:
+        """
+        Returns the lines of text of the HUD shown in the view, averaged
+        over the given number of latest ticks.
+        """
+        summary = self.summary(last_ticks)
+        lines = [f"tick {summary['total']:7.2f} ms   tracks {summary['tracks']:.0f}"]
+        lines.extend(f"{section:<14}{summary[section]:7.2f} ms" for section in profiler.sections)
+        if 'cache hit rate' in summary:
+            lines.append(f"frame cache {summary['cache frames']:5d} frames {summary['cache MB']:7.1f} MB   hits {summary['cache hit rate'] * 100.:3.0f} %")
+        return lines
+
+    def to_chrome_trace(self) -> _Dict:
+        """
+        Returns the recorded ticks in the Chrome trace event format,
+        with complete events for the sections and a counter for the tracks.
+        """
+        events = []
+        for tick in self.ticks:
+            timestamp = tick['start'] * 1e6
+            events.append({ 'name': 'tracks', 'ph': 'C', 'ts': timestamp, 'pid': 1, 'tid': 1, 'args': { 'active': tick['tracks'] } })
+            if 'cache' in tick:
+                hits, lookups, size_bytes, frames_count = tick['cache']
+                events.append({ 'name': 'frame cache', 'ph': 'C', 'ts': timestamp, 'pid': 1, 'tid': 1,
+                                'args': { 'hits': hits, 'misses': lookups - hits, 'MB': size_bytes / (1024. * 1024.), 'frames': frames_count } })
+            for section, start, end in tick['spans']:
+                events.append({ 'name': section, 'cat': 'anim', 'ph': 'X', 'ts': start * 1e6, 'dur': (end - start) * 1e6, 'pid': 1, 'tid': 1 })
+        return { 'traceEvents': events, 'displayTimeUnit': 'ms' }
+
+    def save_chrome_trace(self, path: str) -> None:
+        """
+        Writes the recorded ticks as a Chrome trace JSON file.
+        """
+        with open(path, 'w') as trace_file:
+            _json.dump(self.to_chrome_trace(), trace_file)
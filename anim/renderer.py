@@ -0,0 +1,275 @@
+from .animation import animation
+from .animator import animator
+from .clock import virtual_clock
+from .scene import scene
+from .shot import shot
+from .items import color, white
+
+from PySide6.QtCore import Qt as _Qt, QRectF as _QRectF
+from PySide6.QtGui import QImage as _QImage, QPainter as _QPainter
+
+from time import perf_counter as _perf_counter
+from typing import Callable as _Callable, Dict as _Dict, Iterator as _Iterator, List as _List, Tuple as _Tuple
+import json as _json
+import multiprocessing as _multiprocessing
+import os as _os
+import shutil as _shutil
+
+
+class frame_renderer:
+    """
+    Renders an animation frame-by-frame into images without showing any window.
+
+    The animator uses a virtual clock advanced by a fixed amount for each
+    frame instead of following the wall-clock, so the frames produced are
+    the same no matter how fast the machine is.
+
+    A QApplication must exist, but its event loop does not need to run.
+    Use create_offscreen_app() to create one on machines without a display.
+
+    Shots are chained exactly as when playing in the app window, so looping
+    animations and repeating shots play forever unless a maximum number of
+    frames or shots is given.
+
+    Each shot starts at time zero on a frame boundary, so the frames of a
+    shot do not depend on the shots played before it. This is what allows
+    rendering ranges of shots separately, see render_in_parallel().
+
+    Since the shots are only played in order, the animation does not capture
+    a snapshot at the start of each shot, see animation.snapshot_shots. Set
+    the flag back to seek with the animation.
+    """
+
+    def __init__(self, anim: animation, width: int = 1280, height: int = 720, fps: float = 30., background: color = white) -> None:
+        """
+        Creates a renderer for the given animation producing images
+        of the given size at the given number of frames per second.
+        """
+        self.animation = anim
+        self.animation.snapshot_shots = False
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.background = background
+
+        self.scene = scene()
+        self.animator = animator(virtual_clock())
+        self._prepare_view()
+
+        self.played_shots: _List[_Tuple[str, int]] = []
+
+        self._shots_count = 0
+        self._first_shot = 0
+        self._max_shots = None
+        self._frame_count = 0
+
+    def _prepare_view(self) -> None:
+        """
+        Gives the view its final size so that the framing of the scene
+        matches the size of the rendered images.
+        """
+        view = self.scene.view
+        view.setAttribute(_Qt.WA_DontShowOnScreen)
+        view.show()
+        view.resize(self.width, self.height)
+
+    @property
+    def frame_duration(self) -> float:
+        """
+        The duration of a frame, in milliseconds.
+        """
+        return 1000. / self.fps
+
+
+    ########################################################################
+    #
+    # Rendering
+
+    def render_frame(self) -> _QImage:
+        """
+        Renders the current state of the scene into an image.
+        """
+        image = _QImage(self.width, self.height, _QImage.Format_ARGB32_Premultiplied)
+        image.fill(self.background)
+        painter = _QPainter(image)
+        painter.setRenderHints(_QPainter.Antialiasing | _QPainter.SmoothPixmapTransform)
+        view = self.scene.view
+        start = _perf_counter()
+        view.render(painter, _QRectF(0, 0, self.width, self.height), view.viewport().rect())
+        painter.end()
+        if self.animator.profiler:
+            self.animator.profiler.record_span('paint', start, _perf_counter())
+        return image
+
+    def frames(self, max_frames: int = None, max_shots: int = None, first_shot: int = 0) -> _Iterator[_QImage]:
+        """
+        Resets the animation, plays it and yields the image of each frame.
+
+        The given number of first shots are played without being rendered,
+        by jumping directly to their end.
+
+        Stops when the animation stops playing, after the given maximum
+        number of frames or when the given maximum number of shots have
+        been rendered.
+
+        The name and first frame of each rendered shot are kept in played_shots.
+        """
+        self.played_shots = []
+        self._first_shot = first_shot
+        self._max_shots = max_shots
+        self._shots_count = 0
+        self._frame_count = 0
+        self.animation.on_shot_changed.connect(self._on_shot_changed)
+        try:
+            self.animation.reset(self.scene, self.animator)
+            self.animation.play(self.scene, self.animator)
+            while self.animation.playing and self._shots_count <= first_shot:
+                self._skip_shot()
+            while self.animation.playing:
+                if max_frames is not None and self._frame_count >= max_frames:
+                    break
+                yield self.render_frame()
+                self._frame_count += 1
+                self._advance()
+        finally:
+            self.animation.on_shot_changed.disconnect(self._on_shot_changed)
+            self.animation.stop(self.scene, self.animator)
+
+    def render_to_folder(self, folder: str, max_frames: int = None, max_shots: int = None, first_shot: int = 0, name_format: str = 'frame_{:06d}.png') -> int:
+        """
+        Renders the animation as a numbered sequence of images in the given folder.
+        Returns the number of frames that were rendered.
+        """
+        _os.makedirs(folder, exist_ok=True)
+        frame_count = 0
+        for image in self.frames(max_frames, max_shots, first_shot):
+            image.save(_os.path.join(folder, name_format.format(frame_count)))
+            frame_count += 1
+        return frame_count
+
+    def count_shots(self) -> int:
+        """
+        Counts the shots played by the animation, without rendering them.
+
+        Repeating shots are counted once and looping animations are only
+        followed until they loop back.
+        """
+        previous_index = -1
+        shots_count = 0
+        def on_shot_changed(scene: scene, animator: animator, current_shot: shot):
+            nonlocal previous_index, shots_count
+            if self.animation.current_shot_index <= previous_index:
+                self.animation.stop(scene, animator)
+                return
+            previous_index = self.animation.current_shot_index
+            shots_count += 1
+            self._on_shot_changed(scene, animator, current_shot)
+
+        self._first_shot = 0
+        self._shots_count = 0
+        self.animation.on_shot_changed.connect(on_shot_changed)
+        try:
+            self.animation.reset(self.scene, self.animator)
+            self.animation.play(self.scene, self.animator)
+            while self.animation.playing:
+                self._skip_shot()
+        finally:
+            self.animation.on_shot_changed.disconnect(on_shot_changed)
+            self.animation.stop(self.scene, self.animator)
+        return shots_count
+
+
+    ########################################################################
+    #
+    # Time stepping
+
+    def _advance(self) -> None:
+        """
+        Advances the current shot by one frame. Reaching the end of the shot
+        triggers the next shot, which then starts at time zero.
+        """
+        self.animator.advance(self.frame_duration)
+        if self._max_shots is not None and self._shots_count > self._first_shot + self._max_shots:
+            self.animation.stop(self.scene, self.animator)
+
+    def _skip_shot(self) -> None:
+        """
+        Jumps to the end of the current shot, which triggers the next shot.
+        """
+        shots_count = self._shots_count
+        group = self.animator.anim_group
+        while self.animation.playing and self._shots_count == shots_count:
+            # Note: animations added when others finish extend the duration,
+            #       so loop until the shot really changes.
+            self.animator.set_current_time(group.totalDuration())
+
+    def _on_shot_changed(self, scene: scene, animator: animator, current_shot: shot) -> None:
+        self._shots_count += 1
+        if self._shots_count <= self._first_shot:
+            return
+        if self._max_shots is not None and self._shots_count > self._first_shot + self._max_shots:
+            return
+        self.played_shots.append((current_shot.name, self._frame_count))
+
+
+########################################################################
+#
+# Parallel rendering
+
+def _init_render_worker() -> None:
+    """
+    Creates the QApplication of a rendering worker process.
+    """
+    from .ui.ui import create_offscreen_app
+    global _render_worker_app
+    _render_worker_app = create_offscreen_app()
+
+def _count_shots_worker(anim_maker: _Callable, width: int, height: int, fps: float) -> int:
+    return frame_renderer(anim_maker(), width, height, fps).count_shots()
+
+def _render_shot_worker(anim_maker: _Callable, shot_index: int, folder: str, width: int, height: int, fps: float) -> _List[_Tuple[str, int]]:
+    renderer = frame_renderer(anim_maker(), width, height, fps)
+    renderer.render_to_folder(folder, max_shots=1, first_shot=shot_index)
+    return renderer.played_shots
+
+def render_in_parallel(anim_maker: _Callable, folder: str, shots_count: int = None, width: int = 1280, height: int = 720, fps: float = 30., processes: int = None, name_format: str = 'frame_{:06d}.png') -> _Dict:
+    """
+    Renders the shots of an animation in multiple processes and merges the
+    images in order into the given folder as a single numbered sequence.
+
+    Each worker process creates the animation by calling the given anim_maker,
+    which must thus be picklable, for example a module-level function or a
+    functools.partial of one. It then plays the earlier shots without
+    rendering them and renders a single shot.
+
+    When the number of shots to render is not given, the shots are counted
+    first, playing repeating shots once and looping animations a single time.
+
+    A manifest.json file listing the frames of each shot is written in the
+    folder. The manifest is also returned.
+    """
+    _os.makedirs(folder, exist_ok=True)
+    context = _multiprocessing.get_context('spawn')
+    with context.Pool(processes, initializer=_init_render_worker) as pool:
+        if shots_count is None:
+            shots_count = pool.apply(_count_shots_worker, (anim_maker, width, height, fps))
+        shot_folders = [_os.path.join(folder, f'shot_{index:06d}') for index in range(shots_count)]
+        results = pool.starmap(_render_shot_worker, [
+            (anim_maker, index, shot_folder, width, height, fps) for index, shot_folder in enumerate(shot_folders)])
+
+    manifest = { 'fps': fps, 'width': width, 'height': height, 'shots': [], 'frames': [] }
+    frame_count = 0
+    for index, (shot_folder, played_shots) in enumerate(zip(shot_folders, results)):
+        shot_frames = sorted(_os.listdir(shot_folder))
+        for name, first_frame in played_shots:
+            manifest['shots'].append({ 'index': index, 'name': name, 'first_frame': frame_count + first_frame })
+        for shot_frame in shot_frames:
+            frame_name = name_format.format(frame_count)
+            _os.replace(_os.path.join(shot_folder, shot_frame), _os.path.join(folder, frame_name))
+            manifest['frames'].append(frame_name)
+            frame_count += 1
+        _shutil.rmtree(shot_folder)
+
+    with open(_os.path.join(folder, 'manifest.json'), 'w') as manifest_file:
+        _json.dump(manifest, manifest_file, indent=2)
+    return manifest
@@ -1,11 +1,14 @@
 from .actor import actor
+from .bounds import items_bounds
 from .view import view
 from .items import create_pointing_arrow, point, item, static_point, static_rectangle, fixed_size_text
 
+from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont, QPen, QColor
 from PySide6.QtWidgets import QGraphicsScene, QGraphicsSimpleTextItem, QGraphicsRectItem
 
-from typing import Tuple
+from math import nextafter as _nextafter
+from typing import List as _List, Tuple
 
 class scene:
     """
@@ -18,7 +21,13 @@ class scene:
     to what is described.
 
     The scene tries to show all its item in the scene view by manipulating the
-    view transform.
+    view transform. The bounds of the items are maintained as their geometry
+    changes, so fitting them in the view does not go through all items.
+    The titles, description and pointing arrow are not part of these bounds.
+
+    The scene can index its items in a BSP tree to quickly find the items
+    to draw, which helps when zoomed-in on large scenes, but costs when items
+    move. See set_item_index().
     """
 
     def __init__(self, margin: int = 80) -> None:
@@ -27,6 +36,10 @@ class scene:
         """
         super().__init__()
         self.view = view(margin)
+        self.item_index = 'none'
+        self.bsp_depth = 0
+        self.auto_index_min_items = 500
+        self.auto_index_moved_ratio = 0.1
         self.remove_all_items()
 
     def reset(self) -> None:
@@ -49,6 +62,7 @@ class scene:
 
     def add_item(self, item: item) -> None:
         self.scene.addItem(item)
+        self.items_bounds.add_item(item)
 
     def add_actor(self, actor: actor) -> None:
         self.add_item(actor.item)
@@ -56,6 +70,7 @@ class scene:
     def remove_item(self, item: item) -> None:
         if item.scene() == self.scene:
             self.scene.removeItem(item)
+            self.items_bounds.remove_item(item)
 
     def remove_actor(self, actor: actor) -> None:
         self.remove_item(actor.item)
@@ -65,22 +80,128 @@ class scene:
         Removes all items from the scene.
         """
         self.scene = QGraphicsScene()
-        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        self._apply_item_index(self.item_index == 'bsp')
+        self.items_bounds = items_bounds()
         self.view.set_scene(self)
 
+        arrow = create_pointing_arrow(point(0., 0.), point(0., 0.))
+        self.pointing_arrow = actor("pointing arrow", "The arrow that points to what the description is talking about.", arrow)
+
         self.main_title = fixed_size_text('', point(0., 0.), 36, True).set_sans_font(36, True)
-        self.scene.addItem(self.main_title)
         self.subtitle = fixed_size_text('', point(0., 0.), 10)
-        self.scene.addItem(self.subtitle)
 
         self.title = fixed_size_text('', point(0., 0.), 24, True).set_sans_font(24, True)
-        self.scene.addItem(self.title)
         self.description = fixed_size_text('', point(0., 0.), 10)
-        self.scene.addItem(self.description)
 
-        arrow = create_pointing_arrow(point(0., 0.), point(0., 0.))
-        self.pointing_arrow = actor("pointing arrow", "The arrow that points to what the description is talking about.", arrow)
-        self.add_actor(self.pointing_arrow)
+        # Note: the titles and arrow are not part of the items bounds, since
+        #       they are placed around these bounds. They are drawn above the
+        #       items that have the default drawing order.
+        for other_item in [arrow, self.main_title, self.subtitle, self.title, self.description]:
+            other_item.set_z_order(_nextafter(0., 1.))
+            self.scene.addItem(other_item)
+
+
+    def get_all_items(self) -> _List[item]:
+        """
+        Retrieves all the items of the scene, including children, in the
+        order they were added, which does not depend on their state. The
+        titles and pointing arrow come first. Used when capturing a scene_state.
+        """
+        other_items = [self.pointing_arrow.item, self.main_title, self.subtitle, self.title, self.description]
+        other_ids = { id(i) for i in other_items }
+        all_items = other_items + [i for i in self.items_bounds.items() if id(i) not in other_ids]
+        return [i for i in all_items if isinstance(i, item) and i.scene() == self.scene]
+
+    def get_top_items(self) -> _List[item]:
+        """
+        Retrieves the top-level items of the Qt scene, from the bottom-most
+        to the top-most in drawing order. Used when capturing a snapshot.
+        """
+        # Note: Qt only sorts the items in drawing order with the BSP tree index.
+        #       Switching the index is cheap, the tree is built when first needed.
+        method = self.scene.itemIndexMethod()
+        bsp_method = QGraphicsScene.ItemIndexMethod.BspTreeIndex
+        if method != bsp_method:
+            self.scene.setItemIndexMethod(bsp_method)
+        top_items = [i for i in self.scene.items(Qt.AscendingOrder) if i.parentItem() is None]
+        if method != bsp_method:
+            self.scene.setItemIndexMethod(method)
+        return top_items
+
+    def restore_items(self, top_items: _List[item], rect: static_rectangle) -> None:
+        """
+        Restores the given top-level items, in the given stacking order,
+        and the rectangle of the Qt scene. Qt grows it to contain all the
+        items that were ever in the scene, but never shrinks it, so the
+        items are moved to a new Qt scene whose rectangle starts as the
+        given one and keeps growing from there. Used when restoring a snapshot.
+        """
+        kept = { id(i) for i in top_items }
+        for removed_item in [i for i in self.scene.items() if i.parentItem() is None and id(i) not in kept]:
+            self.remove_item(removed_item)
+
+        old_scene = self.scene
+        self.scene = QGraphicsScene()
+        self._apply_item_index(old_scene.itemIndexMethod() == QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+        for moved_item in top_items:
+            if moved_item.scene() == old_scene:
+                old_scene.removeItem(moved_item)
+                self.scene.addItem(moved_item)
+            else:
+                self.add_item(moved_item)
+
+        # Note: the rectangle grows to contain a temporary item covering it.
+        covering_item = QGraphicsRectItem(rect)
+        covering_item.setPen(QPen(Qt.NoPen))
+        self.scene.addItem(covering_item)
+        self.scene.sceneRect()
+        self.scene.removeItem(covering_item)
+        self.view.set_scene(self)
+
+
+    ########################################################################
+    #
+    # Item Index
+
+    def set_item_index(self, policy: str, bsp_depth: int = None) -> None:
+        """
+        Sets how the scene indexes its items to find the ones to draw:
+
+            - 'none': no index, all items are visited. Best when most items move.
+            - 'bsp': a BSP tree of the given depth, chosen by Qt when zero.
+                     Best when most items are static. The depth is kept
+                     when not given.
+            - 'auto': switches between the two at the start of each shot,
+                      using the BSP tree for scenes with many items when few
+                      of them moved during the previous shot.
+        """
+        self.item_index = policy
+        if bsp_depth is not None:
+            self.bsp_depth = bsp_depth
+        self.items_bounds.take_moved_count()
+        self._apply_item_index(policy == 'bsp')
+
+    def update_item_index(self) -> None:
+        """
+        Switches the index when the policy is automatic, based on the items
+        that moved since the last update.
+        """
+        moved_count = self.items_bounds.take_moved_count()
+        if self.item_index != 'auto':
+            return
+        item_count = self.items_bounds.item_count
+        use_bsp = item_count >= self.auto_index_min_items and moved_count <= item_count * self.auto_index_moved_ratio
+        self._apply_item_index(use_bsp)
+
+    def _apply_item_index(self, use_bsp: bool) -> None:
+        if use_bsp:
+            method = QGraphicsScene.ItemIndexMethod.BspTreeIndex
+        else:
+            method = QGraphicsScene.ItemIndexMethod.NoIndex
+        if self.scene.itemIndexMethod() != method:
+            self.scene.setItemIndexMethod(method)
+        if use_bsp and self.scene.bspTreeDepth() != self.bsp_depth:
+            self.scene.setBspTreeDepth(self.bsp_depth)
 
 
     ########################################################################
@@ -124,21 +245,13 @@ class scene:
         """
         Returns the boundary of non-title items and all items including title.
         """
-        self.scene.removeItem(self.main_title)
-        self.scene.removeItem(self.subtitle)
-        self.scene.removeItem(self.title)
-        self.scene.removeItem(self.description)
-        self.scene.removeItem(self.pointing_arrow.item)
-        # Note: we need to use itemsBoundingRect because sceneRect never shrink,
-        #       so removing the title and description would have no effect.
-        actors_rect = self.scene.itemsBoundingRect()
-
-        self.scene.addItem(self.pointing_arrow.item)
-        self.scene.addItem(self.main_title)
-        self.scene.addItem(self.subtitle)
-        self.scene.addItem(self.title)
-        self.scene.addItem(self.description)
-        scene_rect = self.scene.itemsBoundingRect()
+        # Note: we cannot use sceneRect because it never shrinks.
+        actors_rect = self.items_bounds.rect()
+
+        scene_rect = static_rectangle(actors_rect)
+        for other_item in [self.pointing_arrow.item, self.main_title, self.subtitle, self.title, self.description]:
+            if other_item.scene() == self.scene:
+                scene_rect = scene_rect.united(items_bounds.scene_bounding_rect(other_item))
 
         return actors_rect, scene_rect
 
@@ -14,10 +14,18 @@ class shot(named):
           The prepare_anim function adds animation to the animator.
 
         - A cleanup_anim function receiving the same shot, scene and animator.
+
+    When the shot is baked, the animated values added by its prepare_anim
+    functions are recorded in a timeline the first time it plays. Playing
+    it again replays the timeline without calling them, which is useful
+    for repeated shots and looping animations. Only shots whose prepare_anim
+    functions always add the same values and have no other effect can be
+    baked. Parts of a shot can be baked instead, see animator.animate_baked.
     """
-    def __init__(self, name: str, description: str, prep_anim: callable = None, cleanup_anim: callable = None, repeat = False):
+    def __init__(self, name: str, description: str, prep_anim: callable = None, cleanup_anim: callable = None, repeat = False, bake = False):
         super().__init__(name, description)
         self.repeat = repeat
+        self.bake = bake
         self.generated = False
         self.reset()
         self.add_anim(prep_anim, cleanup_anim)
@@ -29,6 +37,14 @@ class shot(named):
         self.prepare_anims = []
         self.cleanup_anims = []
         self.shown = True
+        self.clear_timelines()
+
+    def clear_timelines(self) -> None:
+        """
+        Forgets the recorded timelines of the shot, so that they get
+        recorded again the next time the shot plays.
+        """
+        self.timelines = {}
 
     def show(self, shown: bool) -> None:
         """
@@ -44,6 +60,7 @@ class shot(named):
         """
         if prep_anim:
             self.prepare_anims.append(prep_anim)
+            self.clear_timelines()
         if cleanup_anim:
             self.cleanup_anims.append(cleanup_anim)
 
@@ -4,7 +4,7 @@ from .animator import animator
 from .options import option
 from .scene import scene
 from .shot import shot
-from .algorithms import is_of_type
+from .algorithms import is_of_type, flatten
 
 from typing import Dict as _Dict, Any as _Any, List as _List, Tuple as _Tuple, Callable as _Callable
 
@@ -20,15 +20,24 @@ class anim_description:
         self.has_pointing_arrow: bool = True
         self.auto_framing = True
         self.frame_on_start = True
+        self.batch_point_moves = False
+        self.item_index = 'none'
+        self.background_generation = False
+        self.snapshot_shots = True
         self.shots: _List[shot] = []
         self.actors: _List[actor] = []
         self.options: _List[option] = []
+        self.custom_generate_geometry: _Callable = None
         self.custom_generate_actors: _Callable = None
+        self.custom_regenerate_actors: _Callable = None
         self.custom_generate_shots: _Callable = None
         self.custom_reset: _Callable = None
         self.custom_prepare_playing: _Callable = None
         self.custom_option_changed: _Callable = None
+        self.custom_option_previewed: _Callable = None
         self.custom_shot_ended: _Callable = None
+        self.custom_save_state: _Callable = None
+        self.custom_restore_state: _Callable = None
 
     def _scan_module(self, module_dict: _Dict[str, _Any]) -> _List[_Callable]:
         prep_shots: _List[_Callable] = []
@@ -51,8 +60,20 @@ class anim_description:
                 self.frame_on_start = var
             elif var_name == 'auto_framing':
                 self.auto_framing = var
+            elif var_name == 'batch_point_moves':
+                self.batch_point_moves = var
+            elif var_name == 'item_index':
+                self.item_index = var
+            elif var_name == 'background_generation':
+                self.background_generation = var
+            elif var_name == 'snapshot_shots':
+                self.snapshot_shots = var
+            elif var_name == 'generate_geometry':
+                self.custom_generate_geometry = var
             elif var_name == 'generate_actors':
                 self.custom_generate_actors = var
+            elif var_name == 'regenerate_actors':
+                self.custom_regenerate_actors = var
             elif var_name == 'generate_shots':
                 self.custom_generate_shots = var
             elif var_name == 'reset':
@@ -61,8 +82,14 @@ class anim_description:
                 self.custom_prepare_playing = var
             elif var_name == 'option_changed':
                 self.custom_option_changed = var
+            elif var_name == 'option_previewed':
+                self.custom_option_previewed = var
             elif var_name == 'shot_ended':
                 self.custom_shot_ended = var
+            elif var_name == 'save_state':
+                self.custom_save_state = var
+            elif var_name == 'restore_state':
+                self.custom_restore_state = var
             elif callable(var) and var_name.endswith('_shot'):
                 prep_shots.append(var)
             elif is_of_type(var, shot):
@@ -129,16 +156,27 @@ class simple_animation(animation, anim_description):
             - reset_on_change: should the animation reset when options change. Defaults to True.
             - has_pointing_arrow: does the animation uses the pointing arrow. Default to True.
             - auto_framing: frame all contents at the start of each shot.
+            - batch_point_moves: update items once per animation tick when their points move. Defaults to False.
+            - item_index: how the scene indexes its items, 'none', 'bsp' or 'auto'. Defaults to 'none'.
+            - background_generation: generate the geometry in a worker thread when options change. Defaults to False.
+            - snapshot_shots: capture a snapshot at the start of each shot to seek to any shot. Defaults to True.
             - *_shot: the anim-preparation function of a shot, a shot will be created with the first
                       line of the function doc as the name and the rest as its description.
             - Variables that are instances of the shot class.
             - Variables that are instances of the actor class.
             - Variables that are instances of the option class.
+            - generate_geometry: a function that returns the pure geometry, kept in the animation geometry.
             - generate_actors: a function that generates actors.
-            - generate_shots: a function that generates shots.
+            - regenerate_actors: a function that regenerates only the actors with the given names,
+                                 when an option that declares it affects them changes.
+            - generate_shots: a function that generates shots. It can be a generator
+                              to generate the shots lazily, while they play.
             - reset: a function to reset the animation.
             - option_changed: a function that reacts to changing options.
+            - option_previewed: a function giving quick feedback while options are being changed.
             - shot_ended: a function called when an animation shot ends.
+            - save_state: a function returning the state changed by the shots, apart from the scene items.
+            - restore_state: a function restoring the state returned by save_state, when seeking.
 
         Only name, description and either shots or generate_shots are
         required. The others are optional.
@@ -160,27 +198,50 @@ class simple_animation(animation, anim_description):
         self.has_pointing_arrow = desc.has_pointing_arrow
         self.auto_framing = desc.auto_framing
         self.frame_on_start = desc.frame_on_start
+        self.batch_point_moves = desc.batch_point_moves
+        self.item_index = desc.item_index
+        self.background_generation = desc.background_generation
+        self.snapshot_shots = desc.snapshot_shots
         self.custom_shots = desc.shots
         self.custom_actors = desc.actors
+        self.custom_generate_geometry = desc.custom_generate_geometry
         self.custom_generate_actors = desc.custom_generate_actors
+        self.custom_regenerate_actors = desc.custom_regenerate_actors
         self.custom_generate_shots = desc.custom_generate_shots
         self.custom_reset = desc.custom_reset
         self.custom_prepare_playing = desc.custom_prepare_playing
         self.custom_option_changed = desc.custom_option_changed
+        self.custom_option_previewed = desc.custom_option_previewed
         self.custom_shot_ended = desc.custom_shot_ended
+        self.custom_save_state = desc.custom_save_state
+        self.custom_restore_state = desc.custom_restore_state
         self.add_options(desc.options)
 
+    def generate_geometry(self):
+        if self.custom_generate_geometry:
+            return self.custom_generate_geometry(self)
+        return super().generate_geometry()
+
     def generate_actors(self, scene: scene) -> None:
         super().generate_actors(scene)
         self.add_actors(self.custom_actors, scene)
         if self.custom_generate_actors:
             self.custom_generate_actors(self, scene)
 
+    def regenerate_actors(self, scene: scene, actor_names) -> bool:
+        if not self.custom_regenerate_actors:
+            return super().regenerate_actors(scene, actor_names)
+        self.add_actors([actor for actor in flatten(self.custom_actors) if actor.name in actor_names], scene)
+        self.custom_regenerate_actors(self, scene, actor_names)
+        return True
+
     def generate_shots(self) -> None:
         super().generate_shots()
         self.add_shots(self.custom_shots)
         if self.custom_generate_shots:
-            self.custom_generate_shots(self)
+            shots = self.custom_generate_shots(self)
+            if shots is not None:
+                self.add_shots(shots)
 
     def reset(self, scene: scene, animator: animator) -> None:
         super().reset(scene, animator)
@@ -199,8 +260,23 @@ class simple_animation(animation, anim_description):
         if self.custom_option_changed:
             self.custom_option_changed(self, scene, animator, option)
 
+    def option_previewed(self, scene: scene, animator: animator, option: option) -> None:
+        super().option_previewed(scene, animator, option)
+        if self.custom_option_previewed:
+            self.custom_option_previewed(self, scene, animator, option)
+
     def shot_ended(self, ended_shot: shot, ended_scene: scene, ended_animator: animator):
         super().shot_ended(ended_shot, ended_scene, ended_animator)
         if self.custom_shot_ended:
             self.custom_shot_ended(self, ended_shot, ended_scene, ended_animator)
-    
\ No newline at end of file
+    
+
+    def save_state(self):
+        if self.custom_save_state:
+            return self.custom_save_state(self)
+        return super().save_state()
+
+    def restore_state(self, state) -> None:
+        super().restore_state(state)
+        if self.custom_restore_state:
+            self.custom_restore_state(self, state)
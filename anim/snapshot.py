@@ -0,0 +1,313 @@
+from .items import circle, item, point, static_point
+from .scene import scene
+
+from PySide6.QtGui import QBrush as _QBrush, QColor as _QColor, QPen as _QPen, QTransform as _QTransform
+
+from typing import Iterator as _Iterator, List as _List, Tuple as _Tuple
+
+import numpy as _np
+
+
+class snapshot:
+    """
+    Compact state of the items of a scene, captured at the start of a shot
+    to later seek to that shot without playing all the previous shots.
+
+    It keeps the state of each item given by its get_state function, like
+    its opacity, pen and brush, and the state of all its points and of the
+    points they depend on, given by their get_state function. It also keeps
+    which items were in the scene, the rectangle of the scene and the
+    transform of the view, since they affect how the scene is framed in
+    the view. It optionally keeps the actors, the shots and the state of the
+    animation.
+
+    Restoring the snapshot restores the state of all items and points, then
+    puts back the items that were removed from the scene since and removes
+    the items that were added, keeping their captured stacking order.
+    """
+
+    def __init__(self, scene: scene, actors = (), state = None, shots = ()) -> None:
+        """
+        Captures the state of the items of the scene. The actors, the
+        state and the shots of the animation are kept as given.
+        """
+        self.top_items = scene.get_top_items()
+        self.items = [(i, i.get_state()) for i in scene.scene.items() if isinstance(i, item)]
+        self.points = [(pt, pt.get_state()) for pt in snapshot._get_all_points([i for i, _ in self.items])]
+        # Note: asking for the Qt scene rectangle would grow it, changing how the
+        #       animation is framed, so the bounding rectangle of the items is kept.
+        self.scene_rect = scene.scene.itemsBoundingRect()
+        self.transform = _QTransform(scene.view.transform())
+        self.actors = set(actors)
+        self.state = state
+        self.shots = list(shots)
+
+    @staticmethod
+    def _get_all_points(items: _List[item]) -> _List[point]:
+        """
+        Retrieves all the points of the items and all the points they depend on.
+        """
+        found = {}
+        todo = [pt for i in items for pt in i.get_all_points()]
+        while todo:
+            pt = todo.pop()
+            if id(pt) in found:
+                continue
+            found[id(pt)] = pt
+            todo.extend(pt.get_origins())
+        return list(found.values())
+
+    def restore(self, scene: scene) -> None:
+        """
+        Restores the captured items of the scene in their captured state
+        and stacking order, the rectangle of the scene and the transform
+        of the view.
+        """
+        # Note: items ignoring the transformations depend on the view transform.
+        scene.view.setTransform(self.transform)
+
+        # Note: the points are all restored before the items are updated,
+        #       since the captured positions are consistent with each other.
+        #       Only the items that changed are updated, the others are kept
+        #       exactly as they were, even if they were not up-to-date.
+        changed_points = set()
+        for pt, state in self.points:
+            if pt.get_state() != state:
+                pt.set_state(state)
+                changed_points.add(id(pt))
+        changed_items = []
+        for i, state in self.items:
+            if i.get_state() != state or any(id(pt) in changed_points for pt in i.get_all_points()):
+                i.set_state(state)
+                changed_items.append(i)
+        for i in changed_items:
+            if hasattr(i, '_update_geometry'):
+                i._update_geometry()
+
+        scene.restore_items(self.top_items, self.scene_rect)
+        scene.view.setTransform(self.transform)
+
+
+#################################################################
+#
+# Scene state
+
+# Note: the numbers of the items that are not points nor colors are the
+#       radius of a circle and the start and span angles of an ellipse,
+#       in sixteenths of a degree, zero for the items without them.
+_ITEM_PARAMS = 3
+
+_ITEM_DTYPE = _np.dtype([
+    ('opacity', _np.float64),
+    ('z', _np.float64),
+    ('pen_color', _np.uint32),
+    ('pen_width', _np.float64),
+    ('brush_color', _np.uint32),
+    ('params', _np.float64, (_ITEM_PARAMS,)),
+])
+
+def _get_item_params(i: item) -> _List[float]:
+    """
+    Retrieves the numbers of the item that animations change apart from its points and colors.
+    """
+    radius = float(i.radius) if isinstance(i, circle) else 0.
+    if hasattr(i, 'startAngle'):
+        return [radius, float(i.startAngle()), float(i.spanAngle())]
+    return [radius, 0., 0.]
+
+def _set_item_params(i: item, params) -> None:
+    """
+    Restores the numbers of the item retrieved with _get_item_params.
+    """
+    if isinstance(i, circle):
+        i.radius = float(params[0])
+    if hasattr(i, 'startAngle'):
+        i.setStartAngle(int(params[1]))
+        i.setSpanAngle(int(params[2]))
+
+# Note: the state of the points is their position followed by at most
+#       two numbers, like the delta of a relative point or the radius
+#       and angle of a radial point.
+_POINT_PARAMS = 2
+
+_POINT_DTYPE = _np.dtype([
+    ('x', _np.float64),
+    ('y', _np.float64),
+    ('params', _np.float64, (_POINT_PARAMS,)),
+])
+
+def _flatten_point_state(state) -> _List[float]:
+    """
+    Flattens the state returned by the get_state function of a point
+    into its numbers, its position coming first.
+    """
+    if isinstance(state, static_point):
+        return [state.x(), state.y()]
+    if isinstance(state, tuple):
+        return [value for sub_state in state for value in _flatten_point_state(sub_state)]
+    return [float(state)]
+
+def _unflatten_point_state(template, values: _Iterator[float]):
+    """
+    Rebuilds a point state with the same structure as the given one from the flattened numbers.
+    """
+    if isinstance(template, static_point):
+        return static_point(next(values), next(values))
+    if isinstance(template, tuple):
+        return tuple(_unflatten_point_state(sub_state, values) for sub_state in template)
+    return next(values)
+
+
+class scene_state:
+    """
+    State of all the items of a scene in compact structured NumPy arrays:
+    the position of every point, and the opacity, drawing order, outline,
+    fill, radius and angles of every item. Unlike a snapshot, it holds no reference to
+    the items, so it can be saved to a file and compared to other states.
+
+    The items are those of the scene in the order they were added, see
+    scene.get_all_items(), and the points are those they use, including
+    the points they depend on. The state can thus only be restored in a
+    scene with the same items, as created by the same animation with the
+    same options, which is verified through the number of items and points.
+
+    The text of text items, which points the items use and the visibility
+    of the items, which the user chooses, are not part of it. A snapshot
+    keeps them.
+
+    A saved state is a single NumPy file, which is memory-mapped when loaded,
+    so only the parts that are restored or compared are read from the disk.
+    """
+
+    def __init__(self, items: _np.ndarray, points: _np.ndarray) -> None:
+        """
+        Creates the state from the given item and point arrays.
+        Use capture() or load() to create one.
+        """
+        self.items = items
+        self.points = points
+
+    @staticmethod
+    def capture(scene: scene) -> 'scene_state':
+        """
+        Captures the state of all the items of the scene and of their points.
+        """
+        scene_items = scene.get_all_items()
+        scene_points = snapshot._get_all_points(scene_items)
+
+        items = _np.zeros(len(scene_items), dtype=_ITEM_DTYPE)
+        items['opacity'] = [i.opacity() for i in scene_items]
+        items['z'] = [i.zValue() for i in scene_items]
+        items['pen_color'] = [i.pen().color().rgba() if hasattr(i, 'pen') else 0 for i in scene_items]
+        items['pen_width'] = [i.pen().widthF() if hasattr(i, 'pen') else 0. for i in scene_items]
+        items['brush_color'] = [i.brush().color().rgba() if hasattr(i, 'brush') else 0 for i in scene_items]
+        if len(scene_items):
+            items['params'] = [_get_item_params(i) for i in scene_items]
+
+        points = _np.zeros(len(scene_points), dtype=_POINT_DTYPE)
+        for index, pt in enumerate(scene_points):
+            values = _flatten_point_state(pt.get_state())
+            params = values[2:]
+            if len(params) > _POINT_PARAMS:
+                raise ValueError(f"The state of a {type(pt).__name__} has too many values to be captured.")
+            points[index] = (values[0], values[1], params + [0.] * (_POINT_PARAMS - len(params)))
+
+        return scene_state(items, points)
+
+    def restore(self, scene: scene) -> None:
+        """
+        Restores the state of all the items of the scene and of their points.
+        Only the items and points that differ from the current state are
+        modified, then the items whose points moved are updated.
+        """
+        scene_items = scene.get_all_items()
+        scene_points = snapshot._get_all_points(scene_items)
+        if len(scene_items) != len(self.items) or len(scene_points) != len(self.points):
+            raise ValueError(
+                f"The scene has {len(scene_items)} items and {len(scene_points)} points "
+                f"but the state has {len(self.items)} items and {len(self.points)} points.")
+
+        current = scene_state.capture(scene)
+
+        changed_points = set()
+        for index in _np.flatnonzero(current.points != self.points):
+            pt = scene_points[index]
+            record = self.points[index]
+            values = iter([float(record['x']), float(record['y'])] + [float(value) for value in record['params']])
+            pt.set_state(_unflatten_point_state(pt.get_state(), values))
+            changed_points.add(id(pt))
+
+        changed_items = { id(i): i for i in scene_items if any(id(pt) in changed_points for pt in i.get_all_points()) }
+
+        for index in _np.flatnonzero(current.items != self.items):
+            i = scene_items[index]
+            record = self.items[index]
+            i.setOpacity(float(record['opacity']))
+            i.setZValue(float(record['z']))
+            if hasattr(i, 'pen'):
+                new_pen = _QPen(i.pen())
+                new_pen.setColor(_QColor.fromRgba(int(record['pen_color'])))
+                new_pen.setWidthF(float(record['pen_width']))
+                i.setPen(new_pen)
+            if hasattr(i, 'brush'):
+                new_brush = _QBrush(i.brush())
+                new_brush.setColor(_QColor.fromRgba(int(record['brush_color'])))
+                i.setBrush(new_brush)
+            _set_item_params(i, record['params'])
+            changed_items[id(i)] = i
+
+        for i in changed_items.values():
+            if hasattr(i, '_update_geometry'):
+                i._update_geometry()
+            i._geometry_changed()
+
+    def differences(self, other: 'scene_state', tolerance: float = 0.) -> _Tuple[_np.ndarray, _np.ndarray]:
+        """
+        Compares with another state of the same scene. Returns the indexes
+        of the items and of the points that differ by more than the given
+        tolerance. The colors must be equal.
+        """
+        if len(self.items) != len(other.items) or len(self.points) != len(other.points):
+            raise ValueError("The states are not of the same scene.")
+
+        def far(values: _np.ndarray, other_values: _np.ndarray) -> _np.ndarray:
+            distance = _np.abs(values - other_values)
+            if distance.ndim > 1:
+                distance = distance.max(axis=1)
+            return distance > tolerance
+
+        items, other_items = self.items, other.items
+        changed_items = (far(items['opacity'], other_items['opacity'])
+                         | far(items['z'], other_items['z'])
+                         | far(items['pen_width'], other_items['pen_width'])
+                         | (items['pen_color'] != other_items['pen_color'])
+                         | (items['brush_color'] != other_items['brush_color'])
+                         | far(items['params'], other_items['params']))
+
+        points, other_points = self.points, other.points
+        changed_points = (far(points['x'], other_points['x'])
+                          | far(points['y'], other_points['y'])
+                          | far(points['params'], other_points['params']))
+
+        return _np.flatnonzero(changed_items), _np.flatnonzero(changed_points)
+
+    def save(self, file_name: str) -> None:
+        """
+        Saves the state in the given NumPy file.
+        """
+        dtype = _np.dtype([
+            ('items', _ITEM_DTYPE, (len(self.items),)),
+            ('points', _POINT_DTYPE, (len(self.points),)),
+        ])
+        record = _np.zeros((), dtype=dtype)
+        record['items'] = self.items
+        record['points'] = self.points
+        _np.save(file_name, record)
+
+    @staticmethod
+    def load(file_name: str) -> 'scene_state':
+        """
+        Loads a state saved in the given NumPy file. The file is memory-mapped.
+        """
+        record = _np.load(file_name, mmap_mode='r')
+        return scene_state(record['items'], record['points'])
@@ -0,0 +1,36 @@
+from .tracks import _copy_value
+
+from typing import List as _List, Tuple as _Tuple
+
+
+class timeline:
+    """
+    Recording of the animated values added to an animator, to replay
+    them later without calling the code that computed them again.
+
+    Each recorded track keeps its timed key values, its duration in seconds
+    and its on_changed and on_finished callbacks. The duration is converted
+    with the animation speedup of the animator when replayed.
+
+    Animations given directly as Qt animations cannot be replayed, since
+    the animator owns them once they played. A timeline where some were
+    added is not replayable.
+    """
+
+    def __init__(self) -> None:
+        self.tracks: _List[_Tuple[_List, float, callable, callable]] = []
+        self.replayable = True
+
+    def record(self, timed_values: _List, duration: float, on_changed = None, on_finished = None) -> None:
+        """
+        Records a track of timed key values.
+        """
+        timed_values = [(step, _copy_value(value)) for step, value in timed_values]
+        self.tracks.append((timed_values, duration, on_changed, on_finished))
+
+    def replay(self, animator) -> None:
+        """
+        Adds all the recorded tracks to the animator, in the order they were recorded.
+        """
+        for timed_values, duration, on_changed, on_finished in self.tracks:
+            animator.animate_timed_value(timed_values, duration, on_changed, on_finished)
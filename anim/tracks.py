@@ -0,0 +1,386 @@
+from .items.point import point_batch
+
+from PySide6.QtCore import QAbstractAnimation as _QAbstractAnimation, QPointF as _QPointF
+from PySide6.QtGui import QColor as _QColor
+
+from bisect import bisect_left as _bisect_left
+from typing import Dict as _Dict, List as _List, Tuple as _Tuple
+
+import numpy as _np
+
+
+#################################################################
+#
+# Interpolation
+
+_OTHER = 0
+_FLOAT = 1
+_INT = 2
+_POINT = 3
+_COLOR = 4
+
+def _value_kind(value) -> int:
+    if isinstance(value, bool):
+        return _OTHER
+    if isinstance(value, int):
+        return _INT
+    if isinstance(value, float):
+        return _FLOAT
+    if isinstance(value, _QPointF):
+        return _POINT
+    if isinstance(value, _QColor):
+        return _COLOR
+    return _OTHER
+
+def _copy_value(value):
+    """
+    Copies the point and color key values, so that later changes
+    to the given values do not affect the animation.
+    """
+    if isinstance(value, _QPointF):
+        return _QPointF(value)
+    if isinstance(value, _QColor):
+        return _QColor(value)
+    return value
+
+def _interpolate(kind: int, start, end, ratio: float):
+    """
+    Interpolates between two key values the same way QVariantAnimation does.
+    """
+    if kind == _FLOAT:
+        return start + (end - start) * ratio
+    if kind == _POINT:
+        return _QPointF(start.x() + (end.x() - start.x()) * ratio, start.y() + (end.y() - start.y()) * ratio)
+    if kind == _COLOR:
+        return _QColor(
+            int(start.red()   + (end.red()   - start.red())   * ratio),
+            int(start.green() + (end.green() - start.green()) * ratio),
+            int(start.blue()  + (end.blue()  - start.blue())  * ratio),
+            int(start.alpha() + (end.alpha() - start.alpha()) * ratio))
+    if kind == _INT:
+        return int(start + (end - start) * ratio)
+    return start if ratio < 1. else end
+
+
+#################################################################
+#
+# Vectorized tracks
+
+class _track_batch:
+    """
+    Tracks of floats or points with the same number of key values,
+    interpolated together with NumPy arrays.
+
+    Float tracks are kept in arrays of shape (N, keys) and point tracks
+    in arrays of shape (N, keys, 2). New tracks are kept aside until the
+    next update, where they are appended to the arrays in one go.
+    """
+
+    def __init__(self, kind: int) -> None:
+        self.kind = kind
+        self.indices = _np.zeros(0, dtype=_np.int64)
+        self.durations = None
+        self.steps = None
+        self.values = None
+        self.current_values = None
+        self.active = _np.zeros(0, dtype=bool)
+        self._pending = []
+
+    def add_track(self, index: int, duration: int, steps: _List[float], values: _List, current_value) -> None:
+        if self.kind == _POINT:
+            values = [(value.x(), value.y()) for value in values]
+            current_value = (current_value.x(), current_value.y())
+        self._pending.append((index, duration, steps, values, current_value))
+
+    def _append_pending(self) -> None:
+        indices, durations, steps, values, current_values = zip(*self._pending)
+        self._pending = []
+        new_arrays = [
+            _np.array(indices, dtype=_np.int64),
+            _np.array(durations, dtype=_np.float64),
+            _np.array(steps, dtype=_np.float64),
+            _np.array(values, dtype=_np.float64),
+            _np.array(current_values, dtype=_np.float64),
+            _np.ones(len(indices), dtype=bool),
+        ]
+        if self.durations is None:
+            self.indices, self.durations, self.steps, self.values, self.current_values, self.active = new_arrays
+        else:
+            old_arrays = [self.indices, self.durations, self.steps, self.values, self.current_values, self.active]
+            self.indices, self.durations, self.steps, self.values, self.current_values, self.active = [
+                _np.concatenate([old, new]) for old, new in zip(old_arrays, new_arrays)]
+
+    def update(self, current_time: int) -> _Tuple[_np.ndarray, _List, _np.ndarray]:
+        """
+        Interpolates the active tracks at the given time.
+
+        Returns the indices of the tracks whose value changed, their new
+        values and the indices of the tracks that ended.
+        """
+        if self._pending:
+            self._append_pending()
+
+        rows = _np.flatnonzero(self.active)
+        if not len(rows):
+            return rows, [], rows
+
+        durations = self.durations[rows]
+        steps = self.steps[rows]
+        values = self.values[rows]
+        progress = _np.minimum(float(current_time), durations) / durations
+
+        # Note: same as bisect_left, clamped to find the ends of the segment.
+        count = steps.shape[1]
+        ends = _np.clip((steps < progress[:, None]).sum(axis=1), 1, count - 1)
+        starts = ends - 1
+        row_range = _np.arange(len(rows))
+        start_steps = steps[row_range, starts]
+        end_steps = steps[row_range, ends]
+        spans = end_steps - start_steps
+        ratios = _np.ones(len(rows))
+        _np.divide(progress - start_steps, spans, out=ratios, where=spans > 0.)
+
+        start_values = values[row_range, starts]
+        end_values = values[row_range, ends]
+        if self.kind == _POINT:
+            ratios = ratios[:, None]
+        new_values = start_values + (end_values - start_values) * ratios
+
+        changed = new_values != self.current_values[rows]
+        if self.kind == _POINT:
+            changed = changed.any(axis=1)
+        changed_rows = rows[changed]
+        new_values = new_values[changed]
+        self.current_values[changed_rows] = new_values
+        if self.kind == _POINT:
+            new_values = [_QPointF(x, y) for x, y in new_values.tolist()]
+        else:
+            new_values = new_values.tolist()
+
+        ended_rows = rows[current_time >= durations]
+        self.active[ended_rows] = False
+
+        return self.indices[changed_rows], new_values, self.indices[ended_rows]
+
+    def rewind(self, current_time: int) -> None:
+        """
+        Reactivates the tracks that end after the given time, when going back in time.
+        """
+        if self._pending:
+            self._append_pending()
+        if self.durations is not None:
+            self.active |= self.durations > float(current_time)
+
+
+#################################################################
+#
+# Track engine
+
+class track_engine(_QAbstractAnimation):
+    """
+    Animation evaluating many keyframe tracks in a single update.
+
+    Each track animates a value through timed key values over a duration
+    and calls its setter with the interpolated value, like a QVariantAnimation
+    would, but without creating a Qt object nor connecting signals per track.
+
+    The tracks are kept in flat lists indexed by track number. Tracks of
+    floats and of points are interpolated all at once with NumPy, grouped
+    by number of key values. Other tracks are interpolated one by one.
+
+    Only the tracks that have not yet ended are evaluated. Going back in
+    time reactivates the tracks that end after the new time. As with
+    QVariantAnimation, the setter is only called when the value differs
+    from the previous one, starting from the first key value. Setters are
+    called in the order the tracks were added.
+
+    When batching points, the setters are called within a point_batch so
+    that items are updated once per update even when many of their points
+    move.
+
+    The optional on_finished callback of a track is called once the time
+    reaches the end of the track.
+
+    The duration of the engine is the duration of its longest track, so
+    the engine finishes when all its tracks have ended. Tracks can be added
+    while the engine is running, but not once it has finished.
+
+    When given a profiler, each update is recorded as a tick.
+    """
+
+    def __init__(self, batch_points: bool = False, parent = None, profiler = None) -> None:
+        super().__init__(parent)
+        self.batch_points = batch_points
+        self.profiler = profiler
+        self._duration = 0
+        self._durations: _List[int] = []
+        self._steps: _List[_List[float]] = []
+        self._values: _List[_List] = []
+        self._kinds: _List[int] = []
+        self._setters: _List[callable] = []
+        self._on_finished: _List[callable] = []
+        self._current_values: _Dict[int, object] = {}
+        self._active: _List[int] = []
+        self._others: _List[int] = []
+        self._last_time = 0
+        self._batches: _Dict[_Tuple[int, int], _track_batch] = {}
+
+    def add_track(self, timed_values: _List[_Tuple[float, object]], duration: int, setter = None, on_finished = None) -> int:
+        """
+        Adds a track animating through the given list of (step, value) pairs
+        over the given duration, in milliseconds. The steps go from zero to one.
+
+        The optional setter receives the interpolated value. The optional
+        on_finished is called when the track ends.
+
+        Returns the track number.
+        """
+        index = len(self._durations)
+        duration = max(1, int(duration))
+        steps = [float(step) for step, _ in timed_values]
+        values = [_copy_value(value) for _, value in timed_values]
+        kind = self._find_kind(values)
+        self._durations.append(duration)
+        self._steps.append(steps)
+        self._values.append(values)
+        self._kinds.append(kind)
+        self._setters.append(setter)
+        self._on_finished.append(on_finished)
+        current_value = self._value_at(index, 0.)
+        if kind in (_FLOAT, _POINT) and len(values) > 1:
+            key = (kind, len(values))
+            if key not in self._batches:
+                self._batches[key] = _track_batch(kind)
+            self._batches[key].add_track(index, duration, steps, values, current_value)
+        else:
+            self._current_values[index] = current_value
+            self._active.append(index)
+            self._others.append(index)
+        self._duration = max(self._duration, duration)
+        return index
+
+    @staticmethod
+    def _find_kind(values: _List) -> int:
+        kinds = set(_value_kind(value) for value in values)
+        if kinds == { _INT, _FLOAT }:
+            return _FLOAT
+        if len(kinds) == 1:
+            return kinds.pop()
+        return _OTHER
+
+    @property
+    def track_count(self) -> int:
+        """
+        The number of tracks that were added.
+        """
+        return len(self._durations)
+
+    def duration(self) -> int:
+        return self._duration
+
+    @property
+    def active_track_count(self) -> int:
+        """
+        The number of tracks that have not yet ended.
+        """
+        return len(self._active) + sum(int(batch.active.sum()) + len(batch._pending) for batch in self._batches.values())
+
+    def updateCurrentTime(self, current_time: int) -> None:
+        profiler = self.profiler
+        if profiler:
+            profiler.begin_tick(self.active_track_count)
+
+        if current_time < self._last_time:
+            self._rewind(current_time)
+        self._last_time = current_time
+
+        changed_indices = []
+        changed_values = []
+        ended_indices = []
+
+        for batch in self._batches.values():
+            indices, values, ended = batch.update(current_time)
+            changed_indices.append(indices)
+            changed_values.extend(values)
+            ended_indices.append(ended)
+
+        indices, values, ended = self._update_other_tracks(current_time)
+        changed_indices.append(indices)
+        changed_values.extend(values)
+        ended_indices.append(ended)
+
+        setters = self._setters
+        changed_indices = _np.concatenate(changed_indices)
+        if profiler:
+            profiler.record('interpolation')
+        if self.batch_points:
+            point_batch.begin()
+        try:
+            for order in _np.argsort(changed_indices, kind='stable').tolist():
+                setter = setters[changed_indices[order]]
+                if setter:
+                    setter(changed_values[order])
+        finally:
+            if profiler:
+                profiler.record('callbacks')
+            if self.batch_points:
+                point_batch.end()
+                if profiler:
+                    profiler.record('points')
+
+        # Note: callbacks are called once all tracks have been updated and
+        #       the active tracks have been updated, since they might add
+        #       new tracks.
+        for index in _np.sort(_np.concatenate(ended_indices)).tolist():
+            on_finished = self._on_finished[index]
+            if on_finished:
+                on_finished()
+        if profiler:
+            profiler.record('finished')
+
+    def _rewind(self, current_time: int) -> None:
+        """
+        Reactivates the tracks that end after the given time, when going back in time.
+        """
+        for batch in self._batches.values():
+            batch.rewind(current_time)
+        durations = self._durations
+        self._active = [index for index in self._others if durations[index] > current_time]
+
+    def _update_other_tracks(self, current_time: int) -> _Tuple[_np.ndarray, _List, _np.ndarray]:
+        """
+        Interpolates the active tracks that are not vectorized, one by one.
+        """
+        changed_indices = []
+        changed_values = []
+        ended = []
+        still_active = []
+        current_values = self._current_values
+        for index in self._active:
+            duration = self._durations[index]
+            if current_time >= duration:
+                ended.append(index)
+            else:
+                still_active.append(index)
+            value = self._value_at(index, min(current_time, duration) / duration)
+            if value != current_values[index]:
+                current_values[index] = value
+                changed_indices.append(index)
+                changed_values.append(value)
+        self._active = still_active
+        return _np.array(changed_indices, dtype=_np.int64), changed_values, _np.array(ended, dtype=_np.int64)
+
+    def _value_at(self, index: int, progress: float):
+        steps = self._steps[index]
+        values = self._values[index]
+        count = len(steps)
+        if count == 1:
+            return values[0]
+        pos = min(max(1, _bisect_left(steps, progress)), count - 1)
+        start_step = steps[pos - 1]
+        end_step = steps[pos]
+        if end_step > start_step:
+            ratio = (progress - start_step) / (end_step - start_step)
+        else:
+            ratio = 1.
+        return _interpolate(self._kinds[index], values[pos - 1], values[pos], ratio)
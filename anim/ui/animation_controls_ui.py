@@ -2,6 +2,8 @@ from .ui import *
 
 from ..animation import animation
 from ..animator import animator
+from ..frame_cache import frame_cache
+from ..profiler import profiler
 from ..scene import scene
 
 from typing import Tuple
@@ -16,9 +18,12 @@ def _fill_animation_controls_ui(animation: animation, scene: scene, animator: an
     add_button_shortcut(layout.stop_button, Qt.Key_Escape)
     layout.reset_button = create_button("Reset", buttons_layout)
     add_button_shortcut(layout.reset_button, Qt.Key_Backspace)
+    layout.shot_box = create_number_slider("Shot", 0, max(0, len(animation.shots) - 1), 0, layout)
     layout.current_time_box = create_number_slider("Current time", 0, 1000, 0, layout)
     layout.animation_speed_box = create_number_slider("Speed", 1, 100, 20, layout)
     layout.zoom_box = create_number_slider("Zoom", 10, 200, 10, layout)
+    layout.profile_box = create_checkbox("Show profiling", layout, False)
+    layout.frame_cache_box = create_checkbox("Cache frames", layout, False)
     add_stretch(layout)
 
 
@@ -44,12 +49,26 @@ def _connect_animation_controls_ui(animation: animation, scene: scene, animator:
             animation.play(scene, animator)
     connect_auto_signal(layout.reset_button, layout.reset_button.clicked, on_reset)
 
+    def on_shot_box_changed(value):
+        animation.seek(scene, animator, int(value))
+    connect_auto_signal(layout.shot_box, layout.shot_box.valueChanged, on_shot_box_changed)
+
+    def update_shot_box():
+        # Note: do not seek again when following the playing shot.
+        blocked = layout.shot_box.blockSignals(True)
+        layout.shot_box.setMaximum(max(0, len(animation.shots) - 1))
+        layout.shot_box.setValue(max(0, animation.current_shot_index))
+        layout.shot_box.blockSignals(blocked)
+    connect_auto_signal(layout.shot_box, animation.on_shot_changed, lambda scene, animator, shot: update_shot_box())
+    update_shot_box()
+
     def on_current_time_changed(value):
         animator.set_current_time_fraction(int(value) / 1000.)
     connect_auto_signal(layout.current_time_box, layout.current_time_box.valueChanged, on_current_time_changed)
 
     def on_anim_current_time_changed(value: float):
         layout.current_time_box.setValue(int(round(1000 * value)))
+        scene.view.update_profiler_hud()
     connect_auto_signal(animator.anim_group, animator.anim_group.current_time_changed, on_anim_current_time_changed)
 
     def on_anim_speed_changed(value: float):
@@ -62,15 +81,35 @@ def _connect_animation_controls_ui(animation: animation, scene: scene, animator:
         scene.view.fit_rectangle(scene.scene.sceneRect())
     connect_auto_signal(layout.zoom_box, layout.zoom_box.valueChanged, on_zoom_changed)
 
+    def on_profile_changed(state):
+        new_profiler = profiler() if state else None
+        animator.set_profiler(new_profiler)
+        scene.view.set_profiler(new_profiler)
+    connect_auto_signal(layout.profile_box, layout.profile_box.stateChanged, on_profile_changed)
+    if layout.profile_box.isChecked():
+        on_profile_changed(True)
+
+    def on_frame_cache_changed(state):
+        if state:
+            scene.view.set_frame_cache(frame_cache(), lambda: animation.get_frame_key(animator))
+        else:
+            scene.view.set_frame_cache(None)
+    connect_auto_signal(layout.frame_cache_box, layout.frame_cache_box.stateChanged, on_frame_cache_changed)
+    if layout.frame_cache_box.isChecked():
+        on_frame_cache_changed(True)
+
 
 def _disconnect_animation_controls_ui(animation: animation, scene: scene, animator: animator, layout: QVBoxLayout) -> None:
     disconnect_auto_signals(layout.play_button)
     disconnect_auto_signals(layout.step_button)
     disconnect_auto_signals(layout.stop_button)
     disconnect_auto_signals(layout.reset_button)
+    disconnect_auto_signals(layout.shot_box)
     disconnect_auto_signals(layout.current_time_box)
     disconnect_auto_signals(layout.animation_speed_box)
     disconnect_auto_signals(layout.zoom_box)
+    disconnect_auto_signals(layout.profile_box)
+    disconnect_auto_signals(layout.frame_cache_box)
     disconnect_auto_signals(animator.anim_group)
 
 
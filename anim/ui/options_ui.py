@@ -6,7 +6,7 @@ from ..scene import scene
 
 from PySide6.QtWidgets import *
 
-from typing import Tuple
+from typing import List, Tuple
 
 def _add_ui_description(ui: QWidget, option: option) -> None:
     """
@@ -16,64 +16,109 @@ def _add_ui_description(ui: QWidget, option: option) -> None:
         return
     ui.setToolTip(option.description)
     
-def _create_int_ui(option: option, scene: scene, animation: animation, animator: animator, layout: QLayout) -> None:
+class option_changes:
+    """
+    Coalesces the changes of the animation options made through the UI.
+
+    Changing an option, for example while dragging a slider, only records
+    it and restarts a short timer. The animation reacts to the recorded
+    options once the user pauses, so a burst of changes rebuilds the
+    animation once instead of once per value.
+
+    The animation can still give quick feedback during the burst in its
+    option_previewed function, which is called on every change.
+    """
+
+    def __init__(self, scene: scene, animation: animation, animator: animator, delay: int = 200) -> None:
+        self.scene = scene
+        self.animation = animation
+        self.animator = animator
+        self.pending: List[option] = []
+        self.timer = create_timer(delay)
+        self.timer.setSingleShot(True)
+
+    def changed(self, option: option, immediate: bool = False) -> None:
+        """
+        Records the change of the option and previews it. The animation reacts
+        to it after the delay, unless immediate, which applies all changes now.
+        """
+        # Note: the cached frames do not know about the options.
+        self.scene.view.clear_frame_cache()
+        self.animation.option_previewed(self.scene, self.animator, option)
+        if not any(option is other for other in self.pending):
+            self.pending.append(option)
+        if immediate:
+            self.apply()
+        else:
+            self.timer.start()
+
+    def apply(self) -> None:
+        """
+        Makes the animation react to all the recorded option changes at once.
+        """
+        self.timer.stop()
+        options, self.pending = self.pending, []
+        if not options:
+            return
+        try:
+            self.scene.view.preserve_transform()
+            self.animation.options_changed(self.scene, self.animator, options)
+        except:
+            pass
+
+def _create_int_ui(option: option, changes: option_changes, layout: QLayout) -> None:
     ui = create_number_range_slider(option.name, option.low_value, option.high_value, option.value, layout)
     _add_ui_description(ui, option)
 
     def on_changed(value):
         try:
             option.value = int(value)
-            scene.view.preserve_transform()
-            animation.option_changed(scene, animator, option)
+            changes.changed(option)
         except:
             pass
     connect_auto_signal(ui, ui.valueChanged, on_changed)
 
-def _create_float_ui(option: option, scene: scene, animation: animation, animator: animator, layout: QLayout) -> None:
+def _create_float_ui(option: option, changes: option_changes, layout: QLayout) -> None:
     ui = create_number_text(option.name, option.low_value, option.high_value, option.value, layout)
     _add_ui_description(ui, option)
     def on_changed(value):
         try:
             option.value = float(value)
-            scene.view.preserve_transform()
-            animation.option_changed(scene, animator, option)
+            changes.changed(option)
         except:
             pass
     connect_auto_signal(ui, ui.textChanged, on_changed)
 
-def _create_bool_ui(option: option, scene: scene, animation: animation, animator: animator, layout: QLayout) -> None:
+def _create_bool_ui(option: option, changes: option_changes, layout: QLayout) -> None:
     ui = create_checkbox(option.name, layout, option.value)
     _add_ui_description(ui, option)
     def on_changed(state):
         try:
             option.value = bool(state)
-            scene.view.preserve_transform()
-            animation.option_changed(scene, animator, option)
+            changes.changed(option, True)
         except:
             pass
     connect_auto_signal(ui, ui.stateChanged, on_changed)
 
-def _create_list_ui(option: option, scene: scene, animation: animation, animator: animator, layout: QLayout) -> None:
+def _create_list_ui(option: option, changes: option_changes, layout: QLayout) -> None:
     items = [(name, "") for name in option.low_value]
     ui = create_list(option.name, items, layout)
     _add_ui_description(ui, option)
     def on_changed(value):
         try:
             option.value = str(value)
-            scene.view.preserve_transform()
-            animation.option_changed(scene, animator, option)
+            changes.changed(option, True)
         except:
             pass
     connect_auto_signal(ui, ui.currentTextChanged, on_changed)
 
-def _create_text_ui(option: option, scene: scene, animation: animation, animator: animator, layout: QLayout) -> None:
+def _create_text_ui(option: option, changes: option_changes, layout: QLayout) -> None:
     ui = create_text(option.name, option.description, option.value, layout)
     _add_ui_description(ui, option)
     def on_changed(value):
         try:
             option.value = str(value)
-            scene.view.preserve_transform()
-            animation.option_changed(scene, animator, option)
+            changes.changed(option)
         except:
             pass
     connect_auto_signal(ui, ui.textChanged, on_changed)
@@ -86,19 +131,25 @@ _ui_makers = {
     str: _create_text_ui,
 }
 
-def create_option_ui(option: option, scene: scene, animation: animation, animator: animator, layout) -> None:
+def create_option_ui(option: option, scene: scene, animation: animation, animator: animator, layout, changes: option_changes = None) -> None:
     """
-    Create the UI for a single option.
+    Create the UI for a single option. The changes of options sharing
+    the given option changes are coalesced together.
     """
     try:
         maker = _ui_makers[type(option.low_value if option.low_value else option.value)]
     except:
         return None
-    return maker(option, scene, animation, animator, layout)
+    if changes is None:
+        changes = option_changes(scene, animation, animator)
+        connect_auto_signal(layout, changes.timer.timeout, changes.apply)
+    return maker(option, changes, layout)
 
 def _fill_options_ui(scene: scene, animation: animation, animator: animator, layout: QVBoxLayout) -> None:
+    layout.option_changes = option_changes(scene, animation, animator)
+    connect_auto_signal(layout, layout.option_changes.timer.timeout, layout.option_changes.apply)
     for option in animation.options:
-        create_option_ui(option, scene, animation, animator, layout)
+        create_option_ui(option, scene, animation, animator, layout, layout.option_changes)
     add_stretch(layout)
 
 def create_options_ui(scene: scene, animation: animation, animator: animator) -> Tuple[QDockWidget, QVBoxLayout]:
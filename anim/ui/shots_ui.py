@@ -9,6 +9,11 @@ def _fill_shots_ui(animation: animation, layout: QVBoxLayout) -> None:
     ui = create_named_list("Steps", animation.shots, layout, False)
     
     def on_shot_changed(scene, animator, shot):
+        # Note: lazily generated shots are added to the list as they appear.
+        for new_shot in animation.shots[ui.count():]:
+            ui.addItem(new_shot.name)
+            if new_shot.description:
+                ui.item(ui.count() - 1).setToolTip(new_shot.description)
         select_in_list(shot.name, ui)
     connect_auto_signal(animation, animation.on_shot_changed, on_shot_changed)
 
@@ -21,6 +21,15 @@ def create_app() -> QApplication:
     import sys
     return QApplication(sys.argv)
 
+def create_offscreen_app() -> QApplication:
+    """
+    Creates and returns the QApplication using the offscreen platform,
+    so that scenes can be rendered on machines without a display.
+    """
+    import os
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return create_app()
+
 def start_app(app: QApplication, window: QMainWindow) -> None:
     """
     Starts the given application with the given main window.
@@ -53,6 +62,7 @@ def create_dock(title: str) -> Tuple[QDockWidget, QVBoxLayout]:
     return dock, layout
 
 def disconnect_dock(dock: QDockWidget, layout: QVBoxLayout) -> None:
+    disconnect_auto_signals(layout)
     for i in range(layout.count()):
         item = layout.itemAt(i)
         ui = item.widget()
@@ -1,10 +1,11 @@
 from .items import static_point, static_rectangle
 
-from PySide6.QtGui import QPainter
+from PySide6.QtGui import QPainter, QColor as _QColor, QFont as _QFont, QImage as _QImage
 from PySide6.QtWidgets import QGraphicsView
-from PySide6.QtCore import Qt as _Qt, QMarginsF as _QMarginsF, QRect as _QRect, QPoint as _QPoint, QSize as _QSize
+from PySide6.QtCore import Signal as _Signal, Qt as _Qt, QMarginsF as _QMarginsF, QRect as _QRect, QRectF as _QRectF, QPoint as _QPoint, QSize as _QSize
 
 from math import floor as _floor, ceil as _ceil
+from time import perf_counter as _perf_counter
 
 
 class view(QGraphicsView):
@@ -12,8 +13,18 @@ class view(QGraphicsView):
     View of a scene, using Qt graphics view.
 
     The view can be zoomed and panned using the view transform.
+    The transform_changed signal is emitted when the transform is applied,
+    for example to adapt the level of details of items to the zoom.
+
+    A profiler can record the time spent painting and be shown as a HUD
+    over the scene, see set_profiler().
+
+    The painted frames can be kept in a frame cache and replayed when the
+    view shows the same thing again, see set_frame_cache().
     """
 
+    transform_changed = _Signal()
+
     def __init__(self, margin: int = 80) -> None:
         """
         Creates the scene (QGraphicsScene) and the view (QGraphicsView).
@@ -24,6 +35,12 @@ class view(QGraphicsView):
         self.margin = margin
         self.zoom = 1.
         self._prev_delta = None
+        self.profiler = None
+        self.show_profiler_hud = False
+        self._hud_rect = _QRect()
+        self.frame_cache = None
+        self.frame_key = None
+        self._caching_frame = False
 
         self.setInteractive(False)
         self.setResizeAnchor(QGraphicsView.AnchorViewCenter)
@@ -52,6 +69,139 @@ class view(QGraphicsView):
         return self
 
 
+    ########################################################################
+    #
+    # Profiling
+
+    def set_profiler(self, profiler, show_hud: bool = True):
+        """
+        Sets the profiler recording the time spent painting, None to stop
+        profiling. The profiler summary can be shown over the scene.
+        """
+        self.profiler = profiler
+        self.show_profiler_hud = show_hud and profiler is not None
+        self.viewport().update()
+        return self
+
+    def update_profiler_hud(self) -> None:
+        """
+        Repaints the profiler HUD, if shown. Call it on each animation tick,
+        since the parts of the view that did not change are not repainted.
+        """
+        if self.show_profiler_hud and not self._hud_rect.isEmpty():
+            self.viewport().update(self._hud_rect)
+
+    def paintEvent(self, event) -> None:
+        if not self.profiler:
+            return self._paint(event)
+        start = _perf_counter()
+        self._paint(event)
+        self.profiler.record_span('paint', start, _perf_counter())
+
+    def drawForeground(self, painter: QPainter, rect) -> None:
+        # Note: the HUD changes all the time, so it is not part of the cached frames.
+        if not self._caching_frame:
+            self._draw_profiler_hud(painter)
+
+    def _draw_profiler_hud(self, painter: QPainter) -> None:
+        if not self.show_profiler_hud or not self.profiler:
+            return
+        painter.save()
+        painter.resetTransform()
+        painter.setFont(_QFont('Monospace', 9))
+        lines = self.profiler.hud_lines()
+        line_height = painter.fontMetrics().height()
+        width = max(painter.fontMetrics().horizontalAdvance(line) for line in lines)
+        self._hud_rect = _QRect(4, 4, width + 12, line_height * len(lines) + 8)
+        painter.fillRect(self._hud_rect, _QColor(0, 0, 0, 160))
+        painter.setPen(_QColor(255, 255, 255))
+        for i, line in enumerate(lines):
+            painter.drawText(10, 8 + line_height * i + painter.fontMetrics().ascent(), line)
+        painter.restore()
+
+
+    ########################################################################
+    #
+    # Frame cache
+
+    def set_frame_cache(self, cache, frame_key = None):
+        """
+        Sets the cache of the painted frames, None to always paint the scene.
+
+        The given frame_key function, taking no argument, returns a key
+        identifying what the scene shows, or None when the frame must be
+        painted, for example because it will not be shown again. The view
+        transform, zoom, scrolling and size are added to the key.
+        """
+        self.frame_cache = cache
+        self.frame_key = frame_key
+        self.viewport().update()
+        return self
+
+    def clear_frame_cache(self) -> None:
+        """
+        Forgets the cached frames, when the scene changed in a way the frame key does not tell.
+        """
+        if self.frame_cache is not None:
+            self.frame_cache.clear()
+
+    def _get_frame_key(self):
+        if self.frame_cache is None or self.frame_key is None:
+            return None
+        scene_key = self.frame_key()
+        if scene_key is None:
+            return None
+        trf = self.transform()
+        size = self.viewport().size()
+        return (scene_key,
+                (trf.m11(), trf.m12(), trf.m13(), trf.m21(), trf.m22(), trf.m23(), trf.m31(), trf.m32(), trf.m33()),
+                self.zoom, self.horizontalScrollBar().value(), self.verticalScrollBar().value(),
+                size.width(), size.height(), self.devicePixelRatioF())
+
+    def _paint(self, event) -> None:
+        """
+        Paints the frame from the frame cache when possible, otherwise
+        paints the scene, keeping the frame in the cache when it has a key.
+        """
+        key = self._get_frame_key()
+        if key is None:
+            return super().paintEvent(event)
+
+        image = self.frame_cache.get(key)
+        hit = image is not None
+        if not hit:
+            image = self._render_frame()
+            self.frame_cache.put(key, image)
+
+        painter = QPainter(self.viewport())
+        painter.drawImage(0, 0, image)
+        self._draw_profiler_hud(painter)
+        painter.end()
+
+        if self.profiler:
+            self.profiler.record_frame_cache(hit, self.frame_cache.size_bytes, len(self.frame_cache))
+
+    def _render_frame(self) -> _QImage:
+        """
+        Renders the whole viewport into an image, as the view paints it.
+        """
+        viewport = self.viewport()
+        ratio = self.devicePixelRatioF()
+        size = viewport.size()
+        image = _QImage(int(size.width() * ratio), int(size.height() * ratio), _QImage.Format_RGB32)
+        image.setDevicePixelRatio(ratio)
+        image.fill(viewport.palette().color(viewport.backgroundRole()))
+        painter = QPainter(image)
+        painter.setRenderHints(self.renderHints())
+        self._caching_frame = True
+        try:
+            self.render(painter, _QRectF(0, 0, size.width(), size.height()), viewport.rect())
+        finally:
+            self._caching_frame = False
+            painter.end()
+        return image
+
+
     ########################################################################
     #
     # View zoom and panning
@@ -85,6 +235,7 @@ class view(QGraphicsView):
         if trf:
             trf = trf.scale(self.zoom, self.zoom)
             self.setTransform(trf)
+            self.transform_changed.emit()
         if self._prev_delta and self.zoom > 1.:
             self.horizontalScrollBar().setValue(self._prev_delta.x())
             self.verticalScrollBar().setValue(self._prev_delta.y())
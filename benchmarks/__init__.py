@@ -0,0 +1 @@
+from .benchmark import benchmark_case, default_cases, timed_animator, run_case, run_benchmarks, compare_results
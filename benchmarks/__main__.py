@@ -0,0 +1,55 @@
+import anim.ui
+
+from argparse import ArgumentParser
+import json
+import sys
+
+
+def parse_args():
+    parser = ArgumentParser(prog="python -m benchmarks", description="Benchmark the example animations, played with a virtual clock without rendering.")
+    parser.add_argument("--output", default=None, help="The JSON file where the results are written. Printed when not given.")
+    parser.add_argument("--filter", default=None, help="Only run the cases whose name contains this text, ignoring case.")
+    parser.add_argument("--fps", type=float, default=30., help="The number of frames per second, which gives the duration of a tick.")
+    parser.add_argument("--max-frames", type=int, default=600, help="The number of frames played by cases without their own limits.")
+    parser.add_argument("--baseline", default=None, help="A JSON file of previous results to compare with.")
+    parser.add_argument("--threshold", type=float, default=1.2, help="The slowdown factor reported as a regression when comparing.")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    app = anim.ui.create_offscreen_app()
+
+    from benchmarks import default_cases, run_benchmarks, compare_results
+
+    cases = default_cases()
+    if args.filter:
+        cases = [case for case in cases if args.filter.lower() in case.name.lower()]
+
+    def print_case(case_results):
+        ticks = case_results['ticks']
+        print(f"{case_results['name']}: reset {case_results['reset'] * 1000.:.1f}ms, "
+              f"tick median {ticks['median'] * 1000.:.3f}ms, max {ticks['max'] * 1000.:.3f}ms, "
+              f"playback {case_results['playback']:.3f}s for {case_results['frames']} frames", file=sys.stderr)
+
+    results = run_benchmarks(cases, args.fps, args.max_frames, print_case)
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(results, output_file, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare_results(baseline, results, args.threshold)
+        for regression in regressions:
+            print(regression, file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
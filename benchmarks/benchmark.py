@@ -0,0 +1,224 @@
+import anim
+
+from time import perf_counter as _perf_counter
+from typing import Any as _Any, Dict as _Dict, List as _List, Tuple as _Tuple
+import statistics as _statistics
+
+
+#################################################################
+#
+# Cases
+
+class benchmark_case:
+    """
+    An example animation to benchmark, with the option values to use
+    and how much of it to play.
+
+    When neither a maximum number of frames nor of shots is given,
+    the default maximum number of frames of the benchmark run is used.
+    """
+
+    def __init__(self, animation: str, options: _Dict[str, _Any] = None, max_frames: int = None, max_shots: int = None) -> None:
+        self.animation = animation
+        self.options = options or {}
+        self.max_frames = max_frames
+        self.max_shots = max_shots
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the case: the animation name followed by its options and limits.
+        """
+        details = [f'{name}={value}' for name, value in self.options.items()]
+        if self.max_shots is not None:
+            details.append(f'shots={self.max_shots}')
+        if details:
+            return f'{self.animation} [{", ".join(details)}]'
+        return self.animation
+
+
+def default_cases() -> _List[benchmark_case]:
+    """
+    Returns the cases benchmarking each example animation, some of them
+    at multiple sizes.
+    """
+    return [
+        benchmark_case("Nicomachu's Gem"),
+        benchmark_case("Pythagora with Three triangles"),
+        benchmark_case("Lonely Runner - Simplified"),
+        benchmark_case("Lonely Runner - Simplified", { 'Runner speeds': '0 1 3 4 5 9 11 14' }),
+        benchmark_case("Lonely Runner"),
+        benchmark_case("Lonely Runner", { 'Runner speeds': '0 1 3 4 5 9 11 14' }),
+        benchmark_case("Pentagramaths"),
+        benchmark_case("Pentagramaths", { 'Number of branches': '11' }),
+        benchmark_case("Three Bisectors Meet"),
+        benchmark_case("Vortex Maths"),
+        benchmark_case("Vortex Maths", { 'Number of points': 100 }),
+        benchmark_case("Vortex Maths", { 'Number of points': 1000 }),
+        benchmark_case("Quarter Geometric Sum"),
+        benchmark_case("Aztec Circle", max_shots=20),
+        benchmark_case("Aztec Circle", max_shots=60),
+        benchmark_case("Aztec Circle", max_shots=120),
+        benchmark_case("Rotating Stars"),
+        benchmark_case("Rotating Stars", { 'Number of branches': 13 }),
+        benchmark_case("Rotating Stars", { 'Number of branches': 20 }),
+    ]
+
+
+#################################################################
+#
+# Measurements
+
+class timed_animator(anim.animator):
+    """
+    Animator using a virtual clock that measures the time taken to start
+    each shot, which includes preparing its animations.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(anim.virtual_clock())
+        self.prepare_times: _List[_Tuple[str, float]] = []
+
+    def play(self, shot: anim.shot, animation: anim.animation, scene: anim.scene) -> None:
+        start = _perf_counter()
+        super().play(shot, animation, scene)
+        self.prepare_times.append((shot.name, _perf_counter() - start))
+
+
+def _time_stats(times: _List[float]) -> _Dict[str, float]:
+    if not times:
+        return { 'count': 0, 'total': 0., 'mean': 0., 'median': 0., 'p95': 0., 'max': 0. }
+    ordered = sorted(times)
+    return {
+        'count': len(times),
+        'total': sum(times),
+        'mean': _statistics.fmean(times),
+        'median': _statistics.median(ordered),
+        'p95': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        'max': ordered[-1],
+    }
+
+
+def _set_options(animation: anim.animation, option_values: _Dict[str, _Any]) -> None:
+    options_by_names = { option.name: option for option in animation.options }
+    for name, value in option_values.items():
+        if name not in options_by_names:
+            raise ValueError(f"Unknown option of {animation.name}: {name}")
+        options_by_names[name].value = value
+
+
+def run_case(case: benchmark_case, fps: float = 30., default_max_frames: int = 600) -> _Dict[str, _Any]:
+    """
+    Plays the animation of the case with a virtual clock, without rendering,
+    and returns the measured times, in seconds:
+
+        - reset: the time to reset the animation, creating its actors and shots.
+        - shots: the name and time to prepare of each shot played.
+        - ticks: statistics of the time to advance by one frame, not
+                 counting the time to prepare the shots started during it.
+        - playback: the total time to play, including preparing the shots.
+    """
+    from examples import find_animation
+
+    anim_type = find_animation(case.animation)
+    if not anim_type:
+        raise ValueError(f"Unknown animation: {case.animation}")
+
+    max_frames = case.max_frames
+    if max_frames is None and case.max_shots is None:
+        max_frames = default_max_frames
+
+    animation = anim_type()
+    # Note: the shots are only played in order, they need no snapshot to seek.
+    animation.snapshot_shots = False
+    scene = anim.scene()
+    animator = timed_animator()
+    frame_duration = 1000. / fps
+
+    shots_count = 0
+    def on_shot_changed(*_):
+        nonlocal shots_count
+        shots_count += 1
+
+    _set_options(animation, case.options)
+    animation.on_shot_changed.connect(on_shot_changed)
+    try:
+        start = _perf_counter()
+        animation.reset(scene, animator)
+        reset_time = _perf_counter() - start
+
+        tick_times = []
+        start = _perf_counter()
+        animation.play(scene, animator)
+        while animation.playing:
+            if max_frames is not None and len(tick_times) >= max_frames:
+                break
+            if case.max_shots is not None and shots_count > case.max_shots:
+                break
+            prepare_count = len(animator.prepare_times)
+            tick_start = _perf_counter()
+            animator.advance(frame_duration)
+            tick_time = _perf_counter() - tick_start
+            tick_time -= sum(time for _, time in animator.prepare_times[prepare_count:])
+            tick_times.append(tick_time)
+        playback_time = _perf_counter() - start
+    finally:
+        animation.on_shot_changed.disconnect(on_shot_changed)
+        animation.stop(scene, animator)
+        # Note: the options of simple animations are module globals,
+        #       so they must be restored for the following cases.
+        for option in animation.options:
+            option.reset()
+
+    return {
+        'name': case.name,
+        'animation': case.animation,
+        'options': case.options,
+        'frames': len(tick_times),
+        'virtual_time': len(tick_times) * frame_duration / 1000.,
+        'reset': reset_time,
+        'shots': [{ 'name': name, 'prepare': time } for name, time in animator.prepare_times],
+        'ticks': _time_stats(tick_times),
+        'playback': playback_time,
+    }
+
+
+def run_benchmarks(cases: _List[benchmark_case], fps: float = 30., default_max_frames: int = 600, on_case_done = None) -> _Dict[str, _Any]:
+    """
+    Runs all the cases and returns the results, ready to be saved as JSON.
+
+    The optional on_case_done is called with the results of each case.
+    """
+    results = { 'fps': fps, 'cases': [] }
+    for case in cases:
+        case_results = run_case(case, fps, default_max_frames)
+        results['cases'].append(case_results)
+        if on_case_done:
+            on_case_done(case_results)
+    return results
+
+
+#################################################################
+#
+# Comparisons
+
+def compare_results(baseline: _Dict[str, _Any], results: _Dict[str, _Any], threshold: float = 1.2) -> _List[str]:
+    """
+    Compares results to baseline results of the same cases.
+
+    Returns a description of the reset, tick and playback times that are
+    slower than the baseline by at least the given factor.
+    """
+    baseline_cases = { case['name']: case for case in baseline['cases'] }
+    regressions = []
+    for case in results['cases']:
+        old_case = baseline_cases.get(case['name'])
+        if not old_case:
+            continue
+        for label, old_time, new_time in [
+                ('reset', old_case['reset'], case['reset']),
+                ('tick median', old_case['ticks']['median'], case['ticks']['median']),
+                ('playback', old_case['playback'], case['playback'])]:
+            if old_time > 0. and new_time >= old_time * threshold:
+                regressions.append(f"{case['name']}: {label} went from {old_time * 1000.:.2f}ms to {new_time * 1000.:.2f}ms")
+    return regressions
@@ -1 +1,56 @@
+from typing import Callable as _Callable, List as _List
 
+
+def all_animations() -> _List[_Callable]:
+    """
+    Returns the functions creating each example animation, in the order
+    they are listed in the app window.
+
+    The examples are imported on demand, so a QApplication must already
+    exist since some of them create scene items when imported.
+    """
+    from .aztec_circle.aztec_circle import aztec_circle
+    from .rotating_stars.rotating_stars import rotating_stars
+    from .quarter_geometric_sum.quarter_geometric_sum import quarter_geometric_sum
+    from .vortex_maths.vortex_maths import vortex_maths
+    from .three_bisectors.three_bisectors import three_bisectors
+    from .pentagramaths.pentagramaths import pentagramaths
+    from .lonely_runner.lonely_runner import lonely_runner
+    from .lonely_runner.lonely_runner_simplified import lonely_runner_simplified
+    from .three_pythagora.three_pythagora import three_pythagora
+    from .nicomachu_sums.nicomachu_sums import nicomachu_sums
+
+    return [
+        nicomachu_sums,
+        three_pythagora,
+        lonely_runner_simplified,
+        lonely_runner,
+        pentagramaths,
+        three_bisectors,
+        vortex_maths,
+        quarter_geometric_sum,
+        aztec_circle,
+        rotating_stars,
+    ]
+
+def find_animation(name: str) -> _Callable:
+    """
+    Returns the function creating the example animation with the given name.
+    The name comparison ignores case. Returns None if not found.
+    """
+    for anim_type in all_animations():
+        if anim_type().name.lower() == name.lower():
+            return anim_type
+    return None
+
+def create_animation(name: str):
+    """
+    Creates the example animation with the given name.
+
+    Being a module-level function, it can be sent to other processes,
+    for example with functools.partial(create_animation, name).
+    """
+    anim_type = find_animation(name)
+    if not anim_type:
+        raise ValueError(f"Unknown animation: {name}")
+    return anim_type()
@@ -0,0 +1,115 @@
+from .numpy_aztec import numpy_aztec, no_reactor, PRESENT, HORIZONTAL, POSITIVE, FROZEN
+from .tile_generator import random_tile_generator
+
+from argparse import ArgumentParser
+import multiprocessing as _multiprocessing
+import os as _os
+
+import numpy as np
+
+
+#################################################################
+#
+# Single tiling
+
+def grow_tiling(size: int, seed: int) -> tuple:
+    """
+    Grow a random aztec diamond of the given size and return its frozen
+    tile counts by type and a map of the frozen tile type of each square.
+
+    The map covers the square containing the diamond, indexed by x then y.
+    Squares without a frozen tile are -1, otherwise they contain the type:
+    0 to 3 for yellow, red, blue and green.
+    """
+    az = numpy_aztec(size, random_tile_generator(seed), no_reactor())
+    origin = az.center() - size
+    codes = az.tiles()[origin:origin + size * 2, origin:origin + size * 2]
+    types = (codes & HORIZONTAL) // HORIZONTAL * 2 + (codes & POSITIVE) // POSITIVE
+    frozen = (codes & (PRESENT | FROZEN)) == (PRESENT | FROZEN)
+    return az.count_frozen_tiles_by_type(), np.where(frozen, types, -1).astype(np.int8)
+
+
+def _grow_tiling_worker(args: tuple) -> tuple:
+    return grow_tiling(*args)
+
+
+#################################################################
+#
+# Many tilings
+
+def arctic_statistics(size: int, seeds: list, processes: int = None) -> dict:
+    """
+    Grow a random aztec diamond of the given size for each seed and
+    aggregate their frozen tiles. Returns a dictionary of NumPy arrays:
+
+        - seeds: the seeds, in the order of the counts.
+        - frozen_counts: the frozen tile counts of each tiling by type,
+                         in the order yellow, red, blue, green.
+        - frozen_probabilities: for each type, the probability of each
+                                square to contain a frozen tile of that type.
+
+    The tilings are grown in parallel in the given number of processes,
+    all available processors by default. With a single process, they are
+    grown in the calling process.
+    """
+    seeds = list(seeds)
+    counts = np.zeros((len(seeds), 4), dtype=np.int64)
+    sums = np.zeros((4, size * 2, size * 2), dtype=np.int64)
+
+    def add_tiling(index: int, tiling: tuple) -> None:
+        tiling_counts, frozen_types = tiling
+        counts[index] = tiling_counts
+        for type_index in range(4):
+            sums[type_index] += frozen_types == type_index
+
+    work = [(size, seed) for seed in seeds]
+    if processes == 1:
+        for index, args in enumerate(work):
+            add_tiling(index, _grow_tiling_worker(args))
+    else:
+        context = _multiprocessing.get_context('spawn')
+        with context.Pool(processes) as pool:
+            for index, tiling in enumerate(pool.imap(_grow_tiling_worker, work)):
+                add_tiling(index, tiling)
+
+    return {
+        'seeds': np.array(seeds, dtype=np.int64),
+        'frozen_counts': counts,
+        'frozen_probabilities': sums / max(1, len(seeds)),
+    }
+
+
+def save_statistics(statistics: dict, folder: str) -> list:
+    """
+    Write each array of the statistics as a .npy file in the folder.
+    Returns the paths of the written files.
+    """
+    _os.makedirs(folder, exist_ok=True)
+    paths = []
+    for name, values in statistics.items():
+        path = _os.path.join(folder, f'{name}.npy')
+        np.save(path, values)
+        paths.append(path)
+    return paths
+
+
+#################################################################
+#
+# Command line
+
+def main():
+    parser = ArgumentParser(description="Grow many random aztec diamonds and write their frozen tiles statistics as .npy files.")
+    parser.add_argument("size", type=int, help="The size of the aztec diamonds.")
+    parser.add_argument("folder", help="The folder where the statistics are written.")
+    parser.add_argument("--seeds", type=int, default=100, help="The number of random tilings to grow.")
+    parser.add_argument("--first-seed", type=int, default=0, help="The seed of the first tiling, the others following it.")
+    parser.add_argument("--processes", type=int, default=None, help="The number of processes growing tilings in parallel.")
+    args = parser.parse_args()
+
+    statistics = arctic_statistics(args.size, range(args.first_seed, args.first_seed + args.seeds), args.processes)
+    for path in save_statistics(statistics, args.folder):
+        print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
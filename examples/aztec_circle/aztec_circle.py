@@ -1,7 +1,9 @@
 import anim
 
 from .aztec import aztec
+from .numpy_aztec import numpy_aztec, no_reactor, code_to_tile, FIRST_PART
 from .tile_generator import sequence_tile_generator
+from .tiles_image import tiles_image
 
 import math
 
@@ -11,20 +13,30 @@ class aztec_circle(anim.animation):
         
         self.tiles_sequence_option = anim.option("Tiles sequence", "The sequence of tiles generated, a sequence of h, v and r.", "r", "", "")
         self.seed_option = anim.option("Random seed", "The seed used in the random number generator.", 1771, 1000, 100000000)
-        self.animate_limit_option = anim.option("Animate until generation", "Animate only until this generation.", 60, 1, 100)
+        self.animate_limit_option = anim.option("Animated generations", "Animate only this many generations after the start generation.", 60, 1, 2000)
+        self.start_size_option = anim.option("Start at generation", "Grow the diamond to this generation without animating before starting.", 0, 0, 2000)
 
         self.add_options([
             self.tiles_sequence_option,
             self.seed_option,
             self.animate_limit_option,
+            self.start_size_option,
         ])
         
         self.loop = True
         self.reset_on_change = False
         self.auto_framing = False
+        self.batch_point_moves = True
+        self.item_index = 'auto'
+        self.snapshot_shots = False
+
+        # Note: when the tiles are smaller than this number of pixels,
+        #       they are drawn as a single image instead of one item each.
+        self.image_tile_pixels = 2.
 
         self.scene: anim.scene = None
         self.animator: anim.animator = None
+        self._lod_view: anim.view = None
 
     def reset(self, scene: anim.scene, animator: anim.animator):
         self.scene: anim.scene = scene
@@ -36,10 +48,42 @@ class aztec_circle(anim.animation):
         self.new_items = []
         self.cross = None
         self.arrow = None
-        self.az = aztec(0, sequence_tile_generator(self.seed, self.tiles_sequence), self)
+        self.image = None
+        self.az = numpy_aztec(0, sequence_tile_generator(self.seed, self.tiles_sequence), self)
         super().reset(scene, animator)
         self.remove_pointing_arrow(scene)
 
+        if self._lod_view is not scene.view:
+            if self._lod_view:
+                self._lod_view.transform_changed.disconnect(self._update_level_of_detail)
+            self._lod_view = scene.view
+            self._lod_view.transform_changed.connect(self._update_level_of_detail)
+
+        self._fast_forward(self.start_size)
+
+    def _fast_forward(self, size: int) -> None:
+        """
+        Grow the diamond to the given size without any animation nor scene items,
+        then show the resulting tiles.
+        """
+        if size <= self.az.size():
+            return
+
+        self.az.reactor = no_reactor()
+        self.az.grow_to_size(size)
+        self.az.reactor = self
+
+        amount = len(self.az.tiles())
+        self.items = []
+        self.new_items = []
+        self.reallocate(self.az, 0, amount)
+        self.increase_size(self.az, self.center - size, size)
+
+        # Note: start with the image, which is cheap to create. Fitting
+        #       the view then switches to items if the tiles are large enough.
+        self._switch_to_image()
+        self.scene.ensure_all_contents_fit()
+
 
     ########################################################################
     #
@@ -53,9 +97,17 @@ class aztec_circle(anim.animation):
     def seed(self) -> int:
         return self.seed_option.value
 
+    @property
+    def start_size(self) -> int:
+        return self.start_size_option.value
+
     @property
     def skip_animations(self) -> bool:
-        return self.size > self.animate_limit_option.value
+        return self.size > self.start_size + self.animate_limit_option.value
+
+    @property
+    def show_image(self) -> bool:
+        return self.image is not None
 
     def option_changed(self, scene: anim.scene, animator: anim.animator, option: anim.option) -> None:
         """
@@ -118,6 +170,68 @@ class aztec_circle(anim.animation):
         return item
 
 
+    #################################################################
+    #
+    # Level of details
+
+    def _update_level_of_detail(self) -> None:
+        """
+        Switch between drawing the tiles as items or as an image
+        depending on how many pixels the tiles cover.
+        """
+        if not self.scene:
+            return
+        tile_pixels = self.scene.view.transform().m11() * anim.tile_size
+        if tile_pixels < self.image_tile_pixels:
+            if not self.show_image:
+                self._switch_to_image()
+        elif self.show_image:
+            self._switch_to_items()
+
+    def _switch_to_image(self) -> None:
+        """
+        Replace the tile items by an image of the tiles.
+        """
+        for items in (self.items, self.new_items):
+            for column in items:
+                for item in column:
+                    if item:
+                        self.scene.remove_item(item)
+        amount = len(self.items)
+        self.items = [[None] * amount for _ in range(amount)]
+        self.new_items = [[None] * amount for _ in range(amount)]
+        self.image = tiles_image(aztec_circle.tile_colors)
+        self.scene.add_item(self.image)
+        self._update_image()
+
+    def _switch_to_items(self) -> None:
+        """
+        Replace the image of the tiles by one item per tile.
+
+        Note: this can happen in the middle of a generation, so the items
+              are put both in the current and the new items.
+        """
+        self.scene.remove_item(self.image)
+        self.image = None
+        self._create_tile_items()
+
+    def _create_tile_items(self) -> None:
+        """
+        Create the items of all the tiles of the diamond.
+        """
+        center = self.center
+        xs, ys = (self.az.tiles() & FIRST_PART).nonzero()
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            item = self.create_scene_tile(x - center, y - center, code_to_tile(self.az.tiles()[x, y]))
+            item.set_opacity(1.)
+            self.items[x][y] = item
+            self.new_items[x][y] = item
+
+    def _update_image(self) -> None:
+        if self.show_image:
+            self.image.set_tiles(self.az.tiles(), self.center - self.size, self.center)
+
+
     #################################################################
     #
     # Shots
@@ -195,11 +309,18 @@ class aztec_circle(anim.animation):
     def increase_size(self, az, origin, size):
         coord = anim.tile_size * (origin - self.center) - 8
         width = anim.tile_size * size * 2 + 16
-        self.boundary.item.setRect(coord, coord, width, width)
+        self.boundary.item.p1.set_point(anim.static_point(coord, coord))
+        self.boundary.item.p2.set_point(anim.static_point(coord + width, coord + width))
         self.size = size
         self.anim_duration = 1. / math.sqrt(size / 4)
 
-    def collision(self, az, x, y):
+    def collisions(self, az, xs, ys, tiles):
+        if self.show_image:
+            return
+        for x, y, code in zip(xs.tolist(), ys.tolist(), tiles.tolist()):
+            self.collision(x, y, code_to_tile(code))
+
+    def collision(self, x, y, tile):
         if self.skip_animations:
             item = self.items[x][y]
             if item:
@@ -207,7 +328,6 @@ class aztec_circle(anim.animation):
             return
 
         center = self.center
-        tile = az.tiles()[x][y] if az else None
         origin = anim.point(*self.middle_pos_to_scene(x - center, y - center, tile))
         cross = self.create_cross(origin)
         self.scene.add_item(cross)
@@ -225,9 +345,16 @@ class aztec_circle(anim.animation):
             lambda: self.scene.remove_item(item))
 
     def collisions_done(self, az):
+        self._update_image()
         self.animator.check_all_anims_done()
 
-    def move(self, az, x1, y1, x2, y2):
+    def moves(self, az, xs, ys, new_xs, new_ys, tiles):
+        if self.show_image:
+            return
+        for x1, y1, x2, y2, code in zip(xs.tolist(), ys.tolist(), new_xs.tolist(), new_ys.tolist(), tiles.tolist()):
+            self.move(x1, y1, x2, y2, code_to_tile(code))
+
+    def move(self, x1, y1, x2, y2, tile):
         center = self.center
         item = self.items[x1][y1]
         if not item:
@@ -239,7 +366,6 @@ class aztec_circle(anim.animation):
             return
 
         if self.arrow.shown:
-            tile = az.tiles()[x1][y1] if az else None
             origin = anim.point(*self.middle_pos_to_scene(x1 - center, y1 - center, tile))
             arrow = self.create_arrow_for_tile(origin, tile)
             arrow.set_opacity(1.)
@@ -259,13 +385,20 @@ class aztec_circle(anim.animation):
             anim.anims.move_point(item.p1)
         )
 
-        tile = az.tiles()[x2][y2] if az else None
-
     def moves_done(self, az):
+        self._update_image()
         self.animator.check_all_anims_done()
         self.scene.ensure_all_contents_fit()
 
-    def fill(self, az, x, y, tile):
+    def fills(self, az, xs, ys, tiles):
+        if self.show_image:
+            # Note: the shot must last at least a frame, as when filling with items.
+            self.animator.animate_value([1., 1.], 0.001, anim.anims.reveal_item(self.image))
+            return
+        for x, y, code in zip(xs.tolist(), ys.tolist(), tiles.tolist()):
+            self.fill(x, y, code_to_tile(code))
+
+    def fill(self, x, y, tile):
         center = self.center
         item = self.create_scene_tile(x - center, y - center, tile)
         self.new_items[x][y] = item
@@ -278,5 +411,7 @@ class aztec_circle(anim.animation):
             self.animator.animate_value([0., 1.], self.anim_duration, anim.anims.reveal_item(item))
 
     def fills_done(self, az):
-        self.items, self.new_items = self.new_items, self.items
+        if not self.show_image:
+            self.items, self.new_items = self.new_items, self.items
+        self._update_image()
         self.scene.ensure_all_contents_fit()
@@ -0,0 +1,398 @@
+from .half_tile import half_tile
+
+import numpy as np
+
+
+#################################################################
+#
+# Tile codes
+#
+# The tiles are kept as int8 codes, zero meaning no tile.
+
+PRESENT    = 1
+HORIZONTAL = 2
+POSITIVE   = 4
+FIRST_PART = 8
+FROZEN     = 16
+
+_TYPE = PRESENT | HORIZONTAL | POSITIVE
+
+def tile_to_code(tile: half_tile) -> int:
+    """
+    Return the code of a half-tile.
+    """
+    if not tile:
+        return 0
+    return (PRESENT
+        | (HORIZONTAL if tile.is_horizontal else 0)
+        | (POSITIVE if tile.is_positive else 0)
+        | (FIRST_PART if tile.is_first_part else 0)
+        | (FROZEN if tile.is_frozen else 0))
+
+def code_to_tile(code: int) -> half_tile:
+    """
+    Return a half-tile corresponding to a code, None for no tile.
+    """
+    if not code:
+        return None
+    return half_tile(bool(code & HORIZONTAL), bool(code & POSITIVE), bool(code & FIRST_PART), bool(code & FROZEN))
+
+def _movements(codes: np.ndarray) -> tuple:
+    """
+    Return the x and y movements of tiles in their desired direction.
+    """
+    sign = np.where(codes & POSITIVE, 1, -1)
+    horizontal = (codes & HORIZONTAL) != 0
+    return np.where(horizontal, 0, sign), np.where(horizontal, sign, 0)
+
+#                   vertical                          horizontal
+#            down              up              down              up
+#         1st     2nd     1st     2nd      1st     2nd      1st     2nd
+_placements = np.array([
+    [ [ (0, 1), (0, 0) ], [ (1, 1), (1, 0) ] ],
+    [ [ (1, 0), (0, 0) ], [ (1, 1), (0, 1) ] ] ])
+
+
+class no_reactor:
+    """
+    Reactor ignoring all the numpy_aztec callbacks, to grow diamonds
+    when only the resulting tiling is needed.
+    """
+    def _ignore(self, *args):
+        pass
+
+    reallocate = increase_size = _ignore
+    collisions = collisions_done = _ignore
+    moves = moves_done = _ignore
+    fills = fills_done = _ignore
+
+
+class numpy_aztec:
+    """
+    Aztec artic circle tiling kept in NumPy arrays of tile codes.
+
+    This produces the same tiling as the aztec class, with the same
+    coordinates and the same tile generator calls, but each step of the
+    algorithm is done on the whole diamond at once. This allows growing
+    diamonds to sizes in the thousands.
+
+    The reactor receives the same increase_size, reallocate and *_done
+    callbacks. The per-tile callbacks are batched into a single call per step,
+    receiving arrays of coordinates and tile codes in the order the aztec
+    class would have called them:
+
+        - collisions(az, xs, ys, tiles)
+        - moves(az, xs, ys, new_xs, new_ys, tiles)
+        - fills(az, xs, ys, tiles)
+
+    Use code_to_tile() to convert a code to a half-tile.
+    """
+
+    #################################################################
+    #
+    # Initialization
+    #
+
+    def __init__(self, target_size: int, tile_generator, react):
+        """
+        Create a filled aztec diamond of the given size.
+        """
+        self._size = 0
+        self.frozen_counts = [[0, 0], [0, 0]]
+
+        self.tile_generator = tile_generator
+        self.reactor = react
+
+        self._squares = np.zeros((0, 0), dtype=np.int8)
+        self._origin = 0
+        self._allocate_tiles(100)
+
+        self.grow_to_size(target_size)
+
+    def _allocate_tiles(self, amount: int):
+        """
+        Allocate the 2D tile array. Over-allocate it to avoid copying large
+        arrays too often.
+        """
+        if amount % 2:
+            amount += 1
+
+        old_amount = len(self._squares)
+        if amount < old_amount:
+            return
+
+        skip = (amount - old_amount) // 2
+        self._squares = np.pad(self._squares, skip)
+        self._origin += skip
+        self.reactor.reallocate(self, old_amount, amount)
+
+    #################################################################
+    #
+    # Informations
+    #
+
+    def size(self) -> int:
+        """
+        Return the size of the aztec diamond.
+        """
+        return self._size
+
+    def center(self) -> int:
+        """
+        Return the coordinate of the center of the diamond.
+        """
+        return len(self._squares) // 2
+
+    def count_squares(self) -> int:
+        """
+        Return the number of squares in the aztec diamond.
+        """
+        size = self._size
+        double_size = size * 2
+        return double_size * double_size - (size * (size-1) * 2)
+
+    def count_tiles(self) -> int:
+        """
+        Return the number of tiles in the aztec diamond.
+        """
+        return self.count_squares() // 2
+
+    def count_frozen_tiles_by_type(self) -> int:
+        """
+        Return the number of frozen tiles in the aztec diamond by tile type/color.
+        Returned in the order: yellow, red, blue, green
+        """
+        counts = self.frozen_counts
+        return counts[0][0], counts[0][1], counts[1][0], counts[1][1]
+
+    def count_frozen_tiles(self) -> int:
+        """
+        Return the number of frozen tiles in the aztec diamond.
+        """
+        return sum(self.count_frozen_tiles_by_type())
+
+    def tiles(self) -> np.ndarray:
+        """
+        Return the tile codes of the aztec diamond, indexed by x then y.
+        """
+        return self._squares
+
+    def _window(self) -> tuple:
+        """
+        Return the first coordinate and the view of the square containing
+        the diamond, with a margin of one square all around.
+        """
+        first = self._origin - 1
+        last = self._origin + self._size * 2 + 1
+        return first, self._squares[first:last, first:last]
+
+    def _inside(self) -> np.ndarray:
+        """
+        Return which squares of the window are inside the diamond.
+        """
+        size = self._size
+        coords = np.abs(np.arange(-1, size * 2 + 1) * 2 - size * 2 + 1)
+        return (coords[:, None] + coords[None, :]) <= size * 2
+
+    @staticmethod
+    def _scan_order(xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """
+        Return the order in which the aztec class visits the given squares.
+        """
+        return np.lexsort((xs, ys))
+
+    #################################################################
+    #
+    # Algorithm
+    #
+
+    def grow_to_size(self, target_size: int):
+        """
+        Grow the aztec diamond to the given size.
+        Does nothing if the target size is smaller.
+        """
+        while self._size < target_size:
+            self.grow()
+
+    def grow(self):
+        """
+        Grow the aztec diamond size by one.
+        """
+        self.increase_size()
+        self.remove_collisions()
+        self.move_tiles()
+        self.fill_holes()
+
+    def increase_size(self):
+        """
+        Increase the logical size of diamond and move the origin.
+        """
+        self._size += 1
+        self._origin -= 1
+        if self._origin < 2:
+            self._allocate_tiles(len(self._squares) * 2)
+
+        self.reactor.increase_size(self, self._origin, self._size)
+
+    def remove_collisions(self):
+        """
+        Find and remove the tiles about to collide.
+
+        Colliding tiles are pairs of tiles of the same orientation moving
+        toward each other. The positive one comes first.
+        """
+        first, squares = self._window()
+        types = squares & _TYPE
+        vertical_up = PRESENT | POSITIVE
+        horizontal_up = PRESENT | HORIZONTAL | POSITIVE
+        vertical = (types[:-1, :] == vertical_up) & (types[1:, :] == PRESENT)
+        horizontal = (types[:, :-1] == horizontal_up) & (types[:, 1:] == PRESENT | HORIZONTAL)
+
+        vxs, vys = np.nonzero(vertical)
+        hxs, hys = np.nonzero(horizontal)
+        xs = np.concatenate([vxs, hxs])
+        ys = np.concatenate([vys, hys])
+        other_xs = np.concatenate([vxs + 1, hxs])
+        other_ys = np.concatenate([vys, hys + 1])
+        order = self._scan_order(xs, ys)
+        xs, ys, other_xs, other_ys = xs[order], ys[order], other_xs[order], other_ys[order]
+
+        codes = squares[xs, ys]
+        other_codes = squares[other_xs, other_ys]
+        squares[xs, ys] = 0
+        squares[other_xs, other_ys] = 0
+
+        # Note: the pairs are reported when the first tile found is a first part.
+        reported = (codes & FIRST_PART) != 0
+        report_xs = np.stack([xs[reported], other_xs[reported]], axis=1).ravel() + first
+        report_ys = np.stack([ys[reported], other_ys[reported]], axis=1).ravel() + first
+        report_codes = np.stack([codes[reported], other_codes[reported]], axis=1).ravel()
+        self.reactor.collisions(self, report_xs, report_ys, report_codes)
+        self.reactor.collisions_done(self)
+
+    def move_tiles(self):
+        """
+        Move the tiles in their desired direction.
+        """
+        first, squares = self._window()
+        ys, xs = np.nonzero(squares.T)
+        codes = squares[xs, ys]
+        dxs, dys = _movements(codes)
+        new_xs = xs + dxs
+        new_ys = ys + dys
+        squares[xs, ys] = 0
+        squares[new_xs, new_ys] = codes
+
+        reported = (codes & FIRST_PART) != 0
+        self.reactor.moves(self, xs[reported] + first, ys[reported] + first,
+                           new_xs[reported] + first, new_ys[reported] + first, codes[reported])
+        self.reactor.moves_done(self)
+
+    def fill_holes(self):
+        """
+        Fill holes of the diamond with new tiles as specified by the tile generator.
+        (A typical tile generator will produce a random sequence of horizontal and vertical.)
+        """
+        first, squares = self._window()
+        inside = self._inside()
+
+        hole_xs, hole_ys = self._find_holes(squares, inside)
+        horizontals = np.array(self.tile_generator.next_horizontals(len(hole_xs)), dtype=np.int64).reshape(-1)
+
+        # Note: the four half-tiles of a hole are placed in the same order
+        #       as the available tiles: positive then negative, first part
+        #       then second part.
+        positives = np.tile([1, 1, 0, 0], len(hole_xs))
+        first_parts = np.tile([1, 0, 1, 0], len(hole_xs))
+        holes = np.repeat(np.arange(len(hole_xs)), 4)
+        horizontals = np.repeat(horizontals, 4)
+        placements = _placements[horizontals, positives, first_parts]
+        xs = hole_xs[holes] + placements[:, 0]
+        ys = hole_ys[holes] + placements[:, 1]
+        codes = (PRESENT + HORIZONTAL * horizontals + POSITIVE * positives + FIRST_PART * first_parts).astype(np.int8)
+        squares[xs, ys] = codes
+
+        frozen = self._find_frozen(squares, inside, xs, ys, codes, holes)
+        codes[frozen] |= FROZEN
+        squares[xs, ys] = codes
+        frozen_first = frozen & (first_parts == 1)
+        for horizontal in (0, 1):
+            for positive in (0, 1):
+                self.frozen_counts[horizontal][positive] += int(np.count_nonzero(
+                    frozen_first & (horizontals == horizontal) & (positives == positive)))
+
+        reported = first_parts == 1
+        self.reactor.fills(self, xs[reported] + first, ys[reported] + first, codes[reported])
+        self.reactor.fills_done(self)
+
+    def _find_holes(self, squares: np.ndarray, inside: np.ndarray) -> tuple:
+        """
+        Find the 2x2 holes, in the order the aztec class would fill them.
+
+        The holes always have their corner on the same parity, so the only
+        overlaps are diagonal. The earlier hole wins, so a hole is filled when
+        none of the holes diagonally before it are filled.
+        """
+        size = self._size
+        empty = (squares == 0) & inside
+        candidates = empty[:-1, :-1] & empty[1:, :-1] & empty[:-1, 1:] & empty[1:, 1:]
+        coords = np.arange(-1, size * 2)
+        candidates &= ((coords[:, None] + coords[None, :] + size) % 2) == 1
+
+        ys, xs = np.nonzero(candidates.T)
+        count = len(xs)
+        indices = np.full(candidates.shape, -1, dtype=np.int64)
+        indices[xs, ys] = np.arange(count)
+        before = np.stack([
+            np.where((xs > 0) & (ys > 0), indices[np.maximum(xs - 1, 0), np.maximum(ys - 1, 0)], -1),
+            np.where(ys > 0, indices[np.minimum(xs + 1, len(indices) - 1), np.maximum(ys - 1, 0)], -1),
+        ], axis=1)
+
+        # Note: a hole is filled if no hole before it overlaps it and is filled.
+        #       Resolved in waves: a hole is decided once all holes before it are.
+        filled = np.zeros(count, dtype=bool)
+        decided = np.zeros(count, dtype=bool)
+        has_before = before >= 0
+        safe_before = np.maximum(before, 0)
+        while not decided.all():
+            before_decided = ~has_before | decided[safe_before]
+            before_filled = has_before & filled[safe_before]
+            now = ~decided & before_decided.all(axis=1)
+            filled[now] = ~before_filled[now].any(axis=1)
+            decided |= now
+
+        return xs[filled], ys[filled]
+
+    def _find_frozen(self, squares: np.ndarray, inside: np.ndarray, xs: np.ndarray, ys: np.ndarray, codes: np.ndarray, holes: np.ndarray) -> np.ndarray:
+        """
+        Find which new half-tiles are frozen.
+
+        A tile is frozen if it would move out of the diamond or onto a frozen
+        tile of the same type. As in the aztec class, new tiles of holes that
+        are filled later do not count.
+        """
+        dxs, dys = _movements(codes)
+        future_xs = xs + dxs
+        future_ys = ys + dys
+        outside = ~inside[future_xs, future_ys]
+
+        new_indices = np.full(squares.shape, -1, dtype=np.int64)
+        new_indices[xs, ys] = np.arange(len(xs))
+        targets = new_indices[future_xs, future_ys]
+        target_codes = squares[future_xs, future_ys]
+        same_type = (target_codes & _TYPE) == (codes & _TYPE)
+
+        old_frozen = (targets < 0) & same_type & ((target_codes & FROZEN) != 0)
+        frozen = outside | old_frozen
+        follows = (targets >= 0) & same_type & ~frozen
+        follows[follows] = holes[targets[follows]] < holes[follows]
+
+        # Note: a tile following an earlier new tile is frozen if that tile is.
+        #       Follow the chains by pointer jumping.
+        nexts = np.where(follows, targets, np.arange(len(xs)))
+        while True:
+            jumped = nexts[nexts]
+            if np.array_equal(jumped, nexts):
+                break
+            nexts = jumped
+        return frozen[nexts]
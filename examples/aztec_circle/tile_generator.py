@@ -1,5 +1,7 @@
 from random import Random
 
+import numpy as np
+
 class tile_generator:
     """
     A generator of tile orientation.
@@ -11,6 +13,12 @@ class tile_generator:
         """
         return True
 
+    def next_horizontals(self, count: int) -> list:
+        """
+        Generates the next given number of tile orientations.
+        """
+        return [self.is_next_horizontal() for _ in range(count)]
+
     def reset(self):
         """
         Reset the generator to its initial state.
@@ -28,18 +36,41 @@ class random_tile_generator(tile_generator):
         """
         self.random_seed = random_seed
         self._rnd = Random(random_seed)
+        self._pending = []
 
     def is_next_horizontal(self) -> bool:
         """
         Generates the next random tile orientation.
         """
+        if self._pending:
+            return self._pending.pop(0)
         return self._rnd.randrange(2) == 1
 
+    def next_horizontals(self, count: int) -> list:
+        """
+        Generates the next given number of random tile orientations.
+
+        Note: randrange(2) draws 32 bits words until one has its top bit
+              clear, then uses the following bit. Drawing the words in bulk
+              and doing the same gives the same orientations. The ones not
+              yet needed are kept for the next calls.
+        """
+        pending = self._pending
+        while len(pending) < count:
+            words_count = 2 * (count - len(pending)) + 64
+            words = np.frombuffer(self._rnd.getrandbits(32 * words_count).to_bytes(4 * words_count, 'little'), dtype='<u4')
+            accepted = words[words < 0x80000000]
+            pending.extend(((accepted >> 30) == 1).tolist())
+        horizontals = pending[:count]
+        del pending[:count]
+        return horizontals
+
     def reset(self):
         """
         Rewind the random generator to the start.
         """
         self._rnd = Random(self.random_seed)
+        self._pending = []
 
 
 class sequence_tile_generator(random_tile_generator):
@@ -86,6 +117,20 @@ class sequence_tile_generator(random_tile_generator):
         else:
             return letter == 'h'
 
+    def next_horizontals(self, count: int) -> list:
+        """
+        Generates the next given number of tile orientations.
+        """
+        sequence = np.array(list(self._clean_sequence))
+        indices = (self._next_in_sequence + np.arange(count)) % len(sequence)
+        self._next_in_sequence = (self._next_in_sequence + count) % len(sequence)
+
+        letters = sequence[indices]
+        horizontals = letters == 'h'
+        randoms = letters == 'r'
+        horizontals[randoms] = super(sequence_tile_generator, self).next_horizontals(int(np.count_nonzero(randoms)))
+        return horizontals.tolist()
+
     def reset(self):
         """
         Rewind the sequence generator to the start of the sequence.
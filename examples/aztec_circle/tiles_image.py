@@ -0,0 +1,57 @@
+import anim
+
+from .numpy_aztec import PRESENT, HORIZONTAL, POSITIVE, _TYPE
+
+from PySide6.QtGui import QImage as _QImage
+from PySide6.QtCore import QRectF as _QRectF
+from PySide6.QtWidgets import QGraphicsItem as _QGraphicsItem
+
+import numpy as np
+
+
+class tiles_image(_QGraphicsItem, anim.item):
+    """
+    Item drawing the tiles of an aztec diamond as a single image,
+    with one pixel per square colored by the type of its tile.
+
+    Used instead of one item per tile when the tiles are so small
+    that their outline and the arrows and crosses cannot be seen.
+    """
+
+    def __init__(self, tile_colors: list) -> None:
+        super().__init__()
+        self._palette = np.zeros(_TYPE + 1, dtype=np.uint32)
+        for is_horizontal in (0, 1):
+            for is_positive in (0, 1):
+                code = PRESENT | (HORIZONTAL * is_horizontal) | (POSITIVE * is_positive)
+                self._palette[code] = tile_colors[is_horizontal][is_positive].rgba()
+        self._image = _QImage()
+        self._rect = _QRectF()
+
+    def set_tiles(self, codes: np.ndarray, first: int, center: int) -> None:
+        """
+        Draws the given tile codes, indexed by x then y, in the image.
+        Only the square starting at the first coordinate and large enough
+        to contain the diamond is kept, placed in the scene relative to
+        the center coordinate.
+        """
+        last = len(codes) - first
+        pixels = np.ascontiguousarray(self._palette[codes[first:last, first:last].T & _TYPE])
+        height, width = pixels.shape
+        self._image = _QImage(pixels.tobytes(), width, height, width * 4, _QImage.Format_ARGB32).copy()
+
+        rect = _QRectF((first - center) * anim.tile_size, (first - center) * anim.tile_size, width * anim.tile_size, height * anim.tile_size)
+        if rect != self._rect:
+            self.prepareGeometryChange()
+            self._rect = rect
+            self._geometry_changed()
+        self.update()
+
+    def boundingRect(self) -> _QRectF:
+        return self._rect
+
+    def scene_rect(self) -> _QRectF:
+        return self._rect
+
+    def paint(self, painter, option, widget=None) -> None:
+        painter.drawImage(self._rect, self._image)
@@ -0,0 +1,104 @@
+from .runners_allowed_intervals import generate_running_runners, runners_solution
+
+from fractions import Fraction as _Fraction
+from math import lcm as _lcm
+from typing import List as _List, Tuple as _Tuple
+
+import numpy as np
+
+
+def runners_denominator(runners: _List[int], runners_count: int) -> int:
+    '''
+    Return the common denominator of all the times where the runners enter
+    or leave the exclusion zone: the least common multiple of their speeds
+    times the runner count.
+
+    Runner r leaves the zone at times (i + 1/n) / r and comes back at times
+    (i + 1 - 1/n) / r, which are all multiples of 1 / (r * n).
+    '''
+    return _lcm(*runners) * runners_count if runners else runners_count
+
+
+def _numerators_type(denominator: int):
+    '''
+    Return the NumPy type holding the time numerators: 64-bits integers
+    when they fit, otherwise Python integers, which are slower but still exact.
+    '''
+    return np.int64 if denominator < 2**62 else object
+
+
+def generate_one_runner_exact_intervals(runner: int, runners_count: int, denominator: int) -> np.ndarray:
+    '''
+    Generate the time intervals when the runner is outside of the exclusion zone,
+    as an array of (start, end) numerators over the given common denominator.
+
+    See generate_one_runner_allowed_time_intervals for the details.
+    '''
+    if runner != int(runner) or runner <= 0:
+        raise ValueError(f'Exact intervals need positive integer speeds, not {runner}')
+    runner = int(runner)
+    time_for_cycle = denominator // runner
+    time_for_away = time_for_cycle // runners_count
+    cycle_times = np.arange(runner, dtype=_numerators_type(denominator)) * time_for_cycle
+    return np.stack([cycle_times + time_for_away, cycle_times + (time_for_cycle - time_for_away)], axis=1)
+
+
+def intersect_all_exact_intervals(all_intervals: _List[np.ndarray], denominator: int) -> np.ndarray:
+    '''
+    Intersect many lists of time intervals at once, creating a new array
+    of time intervals.
+
+    All the starts and ends are merged in a single sorted sequence, starts
+    before ends at equal times since the intervals are closed. A time is in
+    the intersection where all lists have an interval started and not ended.
+    '''
+    if not all_intervals:
+        return np.array([[0, denominator]], dtype=_numerators_type(denominator))
+
+    times = np.concatenate([intervals.ravel() for intervals in all_intervals])
+    changes = np.tile(np.array([1, -1], dtype=np.int64), len(times) // 2)
+    order = np.lexsort((-changes, times))
+    times = times[order]
+    inside_counts = np.cumsum(changes[order])
+
+    # Note: the count can only reach the number of lists at a start,
+    #       and the intersection then ends at the next event, an end.
+    starts = np.flatnonzero(inside_counts == len(all_intervals))
+    return np.stack([times[starts], times[starts + 1]], axis=1)
+
+
+def generate_all_exact_intervals(runners: _List[int], runners_count: int) -> _Tuple[np.ndarray, int]:
+    '''
+    Generate all time intervals where all runners are simultaneously outside
+    of the exclusion zone. Return them as an array of (start, end) numerators
+    and their common denominator.
+    '''
+    denominator = runners_denominator(runners, runners_count)
+    all_intervals = [generate_one_runner_exact_intervals(r, runners_count, denominator) for r in runners]
+    return intersect_all_exact_intervals(all_intervals, denominator), denominator
+
+
+def exact_intervals_to_fractions(intervals: np.ndarray, denominator: int) -> _List[_Tuple[_Fraction, _Fraction]]:
+    '''
+    Convert exact intervals to a list of pairs of fractions.
+    '''
+    return [(_Fraction(int(start), denominator), _Fraction(int(end), denominator)) for start, end in intervals.tolist()]
+
+
+class exact_runners_solution(runners_solution):
+    '''
+    Runners solution computed with exact time intervals.
+
+    The intervals are kept as numerators over a common denominator, the
+    earliest solution time as a fraction. The intervals and the statistics
+    of the base class are computed from them.
+    '''
+    def __init__(self, runners: _List[int], lonely_runner_index: int) -> None:
+        self.runners = runners
+        self.lonely_runner_index = lonely_runner_index
+        running_runners = generate_running_runners(runners, lonely_runner_index)
+        runners_count = len(runners)
+        self.exact_intervals, self.denominator = generate_all_exact_intervals(running_runners, runners_count)
+        self.intervals = [(start / self.denominator, end / self.denominator) for start, end in self.exact_intervals.tolist()]
+        self.earliest_solution_fraction = _Fraction(int(self.exact_intervals[0][0]), self.denominator) if len(self.exact_intervals) else _Fraction(0)
+        self.generate_stats()
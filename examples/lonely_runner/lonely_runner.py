@@ -12,6 +12,7 @@ description = 'https://en.wikipedia.org/wiki/Lonely_runner_conjecture'
 loop = False
 reset_on_change = True
 has_pointing_arrow = True
+background_generation = True
 
 
 #################################################################
@@ -39,17 +40,27 @@ def reset(animation: anim.animation, scene: anim.scene, animator: anim.animator)
 # Lonely runner solver
 
 class lonely_solver:
-    def __init__(self):
+    def __init__(self, speeds: _List[float], lonely_index: int):
+        # Note: all intervals are solved up-front, so the solver can be
+        #       created in a worker thread, see generate_geometry.
+        self.normalized_running_runners = generate_running_runners(speeds, lonely_index)
+        self.all_runner_allowed_time_intervals = []
+        self.all_allowed_time_intervals = []
+        allowed_time_intervals = [(0.0, 1.0)]
+        for running_runner in self.normalized_running_runners:
+            runner_allowed_time_intervals = generate_one_runner_allowed_time_intervals(running_runner, len(speeds))
+            allowed_time_intervals = intersect_time_intervals(runner_allowed_time_intervals, allowed_time_intervals)
+            self.all_runner_allowed_time_intervals.append(runner_allowed_time_intervals)
+            self.all_allowed_time_intervals.append(allowed_time_intervals)
         self.reset()
 
     def reset(self):
-        self.normalized_running_runners = generate_running_runners(runners_speeds(), lonely_runner_index())
         self.allowed_time_intervals = [(0.0, 1.0)]
         self.next_runner_to_solve = 0
 
     def gen_runner_allowed_time_intervals(self, which: int) -> _List[_List[float]]:
-        self.runner_allowed_time_intervals = generate_one_runner_allowed_time_intervals(self.normalized_running_runners[which], runner.runners_count)
-        self.allowed_time_intervals = intersect_time_intervals(self.runner_allowed_time_intervals, self.allowed_time_intervals)
+        self.runner_allowed_time_intervals = self.all_runner_allowed_time_intervals[which]
+        self.allowed_time_intervals = self.all_allowed_time_intervals[which]
         return self.runner_allowed_time_intervals
 
     def get_next_runner_intervals_index(self) -> int:
@@ -254,9 +265,13 @@ timeline: timeline_geometries = None
 #
 # Actors
 
+def generate_geometry(animation: anim.animation):
+    # Note: the points hold no Qt graphics items, so they can be created in
+    #       a worker thread, unlike the geometries made from them.
+    return lonely_solver(runners_speeds(), lonely_runner_index()), points()
+
 def generate_actors(animation: anim.animation, scene: anim.scene):
-    global solver;   solver = lonely_solver()
-    global pts;      pts = points()
+    global solver, pts; solver, pts = animation.geometry
     global geo;      geo = geometries(pts)
     global timeline; timeline = timeline_geometries(pts, animation, scene)
 
@@ -300,6 +315,27 @@ def prepare_playing(animation: anim.animation, scene: anim.scene, animator: anim
 def reset(animation: anim.animation, scene: anim.scene, animator: anim.animator) -> None:
     prepare_playing(animation, scene, animator)
 
+def save_state(animation: anim.animation) -> dict:
+    return {
+        'next_runner_to_introduce': next_runner_to_introduce,
+        'always_colored': runner.always_colored,
+        'next_runner_to_solve': solver.next_runner_to_solve,
+        'allowed_time_intervals': solver.allowed_time_intervals,
+        'last_runner_intervals_graphs': timeline.last_runner_intervals_graphs[:],
+        'last_overal_intervals_graphs': timeline.last_overal_intervals_graphs[:],
+        'next_to_last_overal_intervals_graphs': timeline.next_to_last_overal_intervals_graphs[:],
+    }
+
+def restore_state(animation: anim.animation, state: dict) -> None:
+    global next_runner_to_introduce
+    next_runner_to_introduce = state['next_runner_to_introduce']
+    runner.always_colored = state['always_colored']
+    solver.next_runner_to_solve = state['next_runner_to_solve']
+    solver.allowed_time_intervals = state['allowed_time_intervals']
+    timeline.last_runner_intervals_graphs = state['last_runner_intervals_graphs'][:]
+    timeline.last_overal_intervals_graphs = state['last_overal_intervals_graphs'][:]
+    timeline.next_to_last_overal_intervals_graphs = state['next_to_last_overal_intervals_graphs'][:]
+
 
 #################################################################
 #
@@ -131,6 +131,28 @@ class runner(anim.circle):
         self._update_lonely_status()
         return self
 
+    def get_state(self) -> dict:
+        '''
+        Retrieves the state of the runner, including its lap fraction and colored flag.
+        '''
+        state = super().get_state()
+        state['lap_fraction'] = self.lap_fraction
+        state['colored'] = self.colored
+        return state
+
+    def set_state(self, state: dict) -> anim.circle:
+        '''
+        Restores the state of the runner retrieved with get_state.
+        '''
+        self.lap_fraction = state['lap_fraction']
+        self.colored = state['colored']
+        super().set_state(state)
+        # Note: the label is centered on the runner using its current geometry,
+        #       so it must follow its restored position first.
+        if self.label:
+            self.label._update_geometry()
+        return self
+
     def _update_lonely_status(self) -> anim.circle:
         '''
         Updates the color of this runner based on the colored flags and the
@@ -0,0 +1,192 @@
+from .runners_allowed_intervals import generate_running_runners
+from .exact_runners_intervals import generate_all_exact_intervals
+
+from argparse import ArgumentParser
+from fractions import Fraction as _Fraction
+from itertools import combinations as _combinations, islice as _islice
+from typing import Dict as _Dict, Iterator as _Iterator, List as _List, Tuple as _Tuple
+import json as _json
+import multiprocessing as _multiprocessing
+import os as _os
+
+import numpy as np
+
+
+#################################################################
+#
+# Single speed set
+
+def loneliness(speeds: _List[int]) -> _Fraction:
+    '''
+    Return the largest distance the immobile runner can get from all the
+    given running runners at once: the maximum over time of the minimum
+    distance between any runner and zero, on a circle of circumference one.
+
+    The minimum distance is piecewise linear in time, so its maximum is at
+    a time where a runner is half-way around the circle or where two runners
+    are at the same distance from zero. These times are all multiples of
+    one over twice a speed, the sum of two speeds or the difference of two
+    speeds. All of them are evaluated exactly with integers.
+    '''
+    speeds = np.array(speeds, dtype=np.int64)
+    if not len(speeds):
+        return _Fraction(1, 2)
+    first, second = np.triu_indices(len(speeds), 1)
+    denominators = np.unique(np.concatenate([2 * speeds, speeds[first] + speeds[second], np.abs(speeds[second] - speeds[first])]))
+    denominators = denominators[denominators > 0]
+
+    counts = denominators + 1
+    times_denominators = np.repeat(denominators, counts)
+    times_numerators = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+
+    remainders = (times_numerators[:, None] * speeds[None, :]) % times_denominators[:, None]
+    distances = np.minimum(remainders, times_denominators[:, None] - remainders).min(axis=1)
+
+    # Note: compare with floats, then exactly among the nearly best ones.
+    values = distances / times_denominators
+    best = np.flatnonzero(values >= values.max() - 1e-9)
+    return max(_Fraction(int(distances[index]), int(times_denominators[index])) for index in best)
+
+
+def evaluate_speeds(speeds: _Tuple[int]) -> _Dict:
+    '''
+    Evaluate a set of runner speeds, the first runner being the lonely one.
+
+    Return the speeds, the loneliness of the lonely runner, the gap between
+    it and the one over the number of runners the conjecture promises, and
+    the earliest time the lonely runner is that far from all other runners.
+    The fractions are written as strings, to be saved exactly as JSON.
+    '''
+    speeds = list(speeds)
+    runners_count = len(speeds)
+    running_runners = generate_running_runners(speeds, 0)
+    lonely = loneliness(running_runners)
+    intervals, denominator = generate_all_exact_intervals(running_runners, runners_count)
+    earliest = _Fraction(int(intervals[0][0]), denominator) if len(intervals) else None
+    return {
+        'speeds': speeds,
+        'loneliness': str(lonely),
+        'gap': str(lonely - _Fraction(1, runners_count)),
+        'earliest_time': str(earliest) if earliest is not None else None,
+    }
+
+
+def _evaluate_speeds_worker(all_speeds: _List[_Tuple[int]]) -> _List[_Dict]:
+    return [evaluate_speeds(speeds) for speeds in all_speeds]
+
+
+#################################################################
+#
+# Search
+
+def generate_speeds(runners_count: int, max_speed: int) -> _Iterator[_Tuple[int]]:
+    '''
+    Generate all sets of distinct runner speeds up to the maximum speed,
+    the first runner being immobile.
+    '''
+    for speeds in _combinations(range(1, max_speed + 1), runners_count - 1):
+        yield (0,) + speeds
+
+
+def read_results(path: str) -> _List[_Dict]:
+    '''
+    Read the results saved by a search, ignoring a last incomplete line
+    left by an interrupted search.
+    '''
+    return _read_results(path)[0]
+
+
+def _read_results(path: str) -> _Tuple[_List[_Dict], int]:
+    '''
+    Read the results saved by a search and return them with the size
+    in bytes of the complete lines, which excludes a last incomplete line.
+    '''
+    results = []
+    valid_size = 0
+    if not _os.path.exists(path):
+        return results, valid_size
+    with open(path, 'rb') as results_file:
+        for line in results_file:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                results.append(_json.loads(line))
+            except ValueError:
+                break
+            valid_size += len(line)
+    return results, valid_size
+
+
+def search_speeds(runners_count: int, max_speed: int, path: str, processes: int = None, chunk_size: int = 500) -> _List[_Dict]:
+    '''
+    Evaluate all sets of runner speeds up to the maximum speed and append
+    each result to the given file as a line of JSON.
+
+    The file is also the checkpoint of the search: when it already contains
+    results, their speeds are not evaluated again. The search can thus be
+    interrupted and resumed.
+
+    The speeds are evaluated in chunks in parallel in the given number of
+    processes, all available processors by default. With a single process,
+    they are evaluated in the calling process.
+
+    Return all results, including the previous ones, sorted by gap.
+    '''
+    results, valid_size = _read_results(path)
+    done = set(tuple(result['speeds']) for result in results)
+    all_speeds = (speeds for speeds in generate_speeds(runners_count, max_speed) if speeds not in done)
+
+    def chunks() -> _Iterator[_List[_Tuple[int]]]:
+        while True:
+            chunk = list(_islice(all_speeds, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    # Note: only drop an incomplete last line and append after the valid
+    #       results, so that they are never lost if interrupted again.
+    if _os.path.exists(path):
+        with open(path, 'r+b') as results_file:
+            results_file.truncate(valid_size)
+
+    with open(path, 'a') as results_file:
+        def save(chunk_results: _List[_Dict]) -> None:
+            for result in chunk_results:
+                results_file.write(_json.dumps(result) + '\n')
+            results_file.flush()
+            results.extend(chunk_results)
+
+        if processes == 1:
+            for chunk in chunks():
+                save(_evaluate_speeds_worker(chunk))
+        else:
+            context = _multiprocessing.get_context('spawn')
+            with context.Pool(processes) as pool:
+                for chunk_results in pool.imap_unordered(_evaluate_speeds_worker, chunks()):
+                    save(chunk_results)
+
+    return sorted(results, key=lambda result: (_Fraction(result['gap']), result['speeds']))
+
+
+#################################################################
+#
+# Command line
+
+def main():
+    parser = ArgumentParser(description="Search the loneliness of all sets of lonely runner speeds up to a maximum speed.")
+    parser.add_argument("runners", type=int, help="The number of runners, including the immobile lonely runner.")
+    parser.add_argument("max_speed", type=int, help="The maximum speed of the runners.")
+    parser.add_argument("output", help="The JSON lines file where the results are written. An interrupted search resumes from it.")
+    parser.add_argument("--processes", type=int, default=None, help="The number of processes evaluating speeds in parallel.")
+    parser.add_argument("--chunk-size", type=int, default=500, help="The number of speed sets evaluated at once by a process.")
+    parser.add_argument("--top", type=int, default=10, help="The number of tightest speed sets to print.")
+    args = parser.parse_args()
+
+    results = search_speeds(args.runners, args.max_speed, args.output, args.processes, args.chunk_size)
+    print(f"Evaluated {len(results)} speed sets, the tightest are:")
+    for result in results[:args.top]:
+        print(f"    {' '.join(str(speed) for speed in result['speeds'])}: loneliness {result['loneliness']}, gap {result['gap']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,8 @@ loop = False
 reset_on_change = False
 has_pointing_arrow = False
 auto_framing = False
+batch_point_moves = True
+item_index = 'auto'
 
 duration = 2.
 short_duration = duration / 2.
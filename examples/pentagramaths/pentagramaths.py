@@ -10,6 +10,7 @@ description = 'Mathologer video: https://www.youtube.com/watch?v=w4AUOgfW9NI'
 loop = False
 reset_on_change = True
 has_pointing_arrow = False
+batch_point_moves = True
 
 
 #################################################################
@@ -133,6 +134,7 @@ def prepare_playing(animation: anim.animation, scene: anim.scene, animator: anim
 duration = 1.
 
 def generate_shots(animation: anim.animation):
+    # Note: generate the shots of each duo only when they are about to play.
     def rotate_star_to_horizontal_shot(shot: anim.shot, animation: anim.animation, scene: anim.scene, animator: anim.animator):
         angle = anim.line_angle(geo.lines[- (skip() // 2)])
         center = anim.center_of(pts.tips)
@@ -146,6 +148,7 @@ def generate_shots(animation: anim.animation):
             _gen_slide_duo(which, animation)
         else:
             _gen_flip_duo(which, animation)
+        yield
 
 def _gen_flip_duo(which: int, animation: anim.animation):
     def flip_left_branch_shot(shot: anim.shot, animation: anim.animation, scene: anim.scene, animator: anim.animator):
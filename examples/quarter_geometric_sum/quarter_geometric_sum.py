@@ -10,6 +10,7 @@ name = "Quarter Geometric Sum"
 description = "Mathologer video: https://www.youtube.com/watch?v=SOBz-aFOH2I"
 loop = False
 reset_on_change = False
+batch_point_moves = True
 
 
 #################################################################
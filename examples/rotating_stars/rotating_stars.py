@@ -12,8 +12,10 @@ description = "Mathologer 3-4-7 Miracle: rotating interlinked polygons following
 
 sides_option = anim.option("Number of branches", "Number of branches on the star that the dots follows.", 7, 2, 20)
 skip_option = anim.option("Star branch skip", "How many branches are skipped to go from one branch to the next.", 3, 1, 100)
-ratio_option = anim.option("Percent of radius", "The position of the dots as a percentage of the radius of the circle they are on.", 90, 0, 100)
+ratio_option = anim.option("Percent of radius", "The position of the dots as a percentage of the radius of the circle they are on.", 90, 0, 100,
+                           ["star", "inner circle dot", "inner polygon", "outer polygon"])
 reset_on_change = True
+batch_point_moves = True
 
 def sides():
     return sides_option.value
@@ -50,6 +52,15 @@ class points:
         self.outer_radius   = anim.outer_size
         self.inner_radius   = self.outer_radius * inner_circle_ratio()
         self.inner_centers  = anim.create_relative_points_around_center(self.outer_center, self.outer_radius - self.inner_radius, inner_count())
+        self.inner_dots_pos = []
+        self.gen_dots()
+
+    def gen_dots(self):
+        # Note: detach the previous dots from the inner centers, otherwise
+        #       moving the centers would keep updating them after regenerating.
+        for dots in self.inner_dots_pos:
+            for dot in dots:
+                dot.origin.remove_user(dot)
         self.dot_radius     = self.inner_radius * inner_circle_dot_ratio()
         self.inner_dots_pos = [anim.create_relative_points_around_center(center, self.dot_radius, skip()) for center in self.inner_centers]
 
@@ -71,6 +82,13 @@ class geometries(anim.geometries):
         self._gen_inter_polygons(pts)
         self._set_z_orders()
 
+    def gen_dots(self, pts):
+        self._gen_star(pts)
+        self._gen_inner_dots(pts)
+        self._gen_inner_polygons(pts)
+        self._gen_inter_polygons(pts)
+        self._set_z_orders()
+
     def _gen_star(self, pts):
         pts = anim.create_roll_circle_in_circle_points(pts.inner_radius, pts.outer_radius, skip(), 240, inner_circle_dot_ratio())
         self.star = anim.create_polygon(pts).outline(anim.dark_gray).thickness(5.)
@@ -115,15 +133,29 @@ def generate_actors(animation: anim.animation, scene: anim.scene):
     animation.add_actor(anim.actor("star", "The star that the dots on the inner circle follow.", geo.star), scene)
     animation.add_actor(anim.actor("outer circle", "", geo.outer_circle), scene)
     animation.add_actors([anim.actor("inner circle", "", circle) for circle in geo.inner_circles], scene)
+    _add_dots_actors(animation, scene)
+
+    rect_radius =  pts.outer_radius * 1.2
+    scene.add_item(anim.create_invisible_rect(-rect_radius, -rect_radius, rect_radius * 2, rect_radius * 2))
+
+def regenerate_actors(animation: anim.animation, scene: anim.scene, actor_names):
+    # Note: only the ratio option regenerates actors, the dots and what is made from them.
+    pts.gen_dots()
+    geo.gen_dots(pts)
+
+    animation.add_actor(anim.actor("star", "The star that the dots on the inner circle follow.", geo.star), scene)
+    _add_dots_actors(animation, scene)
+
+    # Note: keep the star drawn below the outer circle, as when all actors are generated.
+    geo.star.stackBefore(geo.outer_circle)
+
+def _add_dots_actors(animation: anim.animation, scene: anim.scene):
     animation.add_actors([
         [anim.actor("inner circle dot", "", dot) for dot in dots]
             for dots in geo.inner_dots], scene)
     animation.add_actors([anim.actor("inner polygon", "", poly) for poly in geo.inner_polygons], scene)
     animation.add_actors([anim.actor("outer polygon", "", poly) for poly in geo.inter_polygons], scene)
 
-    rect_radius =  pts.outer_radius * 1.2
-    scene.add_item(anim.create_invisible_rect(-rect_radius, -rect_radius, rect_radius * 2, rect_radius * 2))
-
 
 #################################################################
 #
@@ -282,11 +314,16 @@ def rotate_all_shot(shot: anim.shot, animation: anim.animation, scene: anim.scen
     """
     shot.repeat = True
 
-    for which_inner in range(inner_count()):
-        anim.roll_points_on_circle_in_circle(animator, 2. * animation_speedup(),
-            geo.inner_circles[which_inner],
-            geo.outer_circle, skip(),
-            pts.inner_dots_pos[which_inner])
+    def roll_all():
+        for which_inner in range(inner_count()):
+            anim.roll_points_on_circle_in_circle(animator, 2. * animation_speedup(),
+                geo.inner_circles[which_inner],
+                geo.outer_circle, skip(),
+                pts.inner_dots_pos[which_inner])
+
+    # Note: the rolls are the same on each repeat, so they are only prepared once.
+    #       The pointing arrow is not baked: it moves from where it is.
+    animator.animate_baked(shot, 'roll', roll_all)
 
     animation.anim_pointing_arrow(geo.outer_circle.get_circumference_point(-math.pi / 4), reveal_duration, scene, animator)
 
@@ -10,6 +10,7 @@ description = 'Mathologer video: https://www.youtube.com/watch?v=XOS73mTomPY'
 loop = False
 reset_on_change = False
 has_pointing_arrow = False
+batch_point_moves = True
 
 
 #################################################################
@@ -11,6 +11,7 @@ description = 'Mathologer video: https://www.youtube.com/watch?v=r4gOlttnJ_E'
 loop = False
 reset_on_change = False
 has_pointing_arrow = False
+batch_point_moves = True
 
 duration = 2.
 short_duration = duration / 2.
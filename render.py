@@ -0,0 +1,53 @@
+import anim.ui
+
+from argparse import ArgumentParser
+from functools import partial
+
+
+def parse_args():
+    parser = ArgumentParser(description="Render an example animation as a numbered sequence of PNG images.")
+    parser.add_argument("animation", help="The name of the animation to render, for example 'Rotating Stars'.")
+    parser.add_argument("folder", help="The folder where the images are written.")
+    parser.add_argument("--fps", type=float, default=30., help="The number of frames per second.")
+    parser.add_argument("--width", type=int, default=1280, help="The width of the images.")
+    parser.add_argument("--height", type=int, default=720, help="The height of the images.")
+    parser.add_argument("--max-frames", type=int, default=None, help="Stop after rendering this many frames.")
+    parser.add_argument("--max-shots", type=int, default=None, help="Stop after playing this many shots.")
+    parser.add_argument("--processes", type=int, default=None,
+        help="Render the shots in parallel in this many processes. A manifest of the frames is also written.")
+    parser.add_argument("--trace", default=None,
+        help="Profile the rendering and write it to this Chrome trace JSON file.")
+    return parser, parser.parse_args()
+
+
+def main():
+    parser, args = parse_args()
+
+    app = anim.ui.create_offscreen_app()
+
+    from examples import find_animation, create_animation
+
+    anim_type = find_animation(args.animation)
+    if not anim_type:
+        parser.error(f"Unknown animation: {args.animation}")
+
+    if args.processes:
+        if args.max_frames is not None:
+            parser.error("The maximum number of frames is not supported when rendering in parallel.")
+        if args.trace:
+            parser.error("Profiling is not supported when rendering in parallel.")
+        anim_maker = partial(create_animation, args.animation)
+        manifest = anim.render_in_parallel(anim_maker, args.folder, args.max_shots, args.width, args.height, args.fps, args.processes)
+        count = len(manifest['frames'])
+    else:
+        renderer = anim.frame_renderer(anim_type(), args.width, args.height, args.fps)
+        if args.trace:
+            renderer.animator.set_profiler(anim.profiler(max_ticks=None))
+        count = renderer.render_to_folder(args.folder, args.max_frames, args.max_shots)
+        if args.trace:
+            renderer.animator.profiler.save_chrome_trace(args.trace)
+    print(f"Rendered {count} frames in {args.folder}")
+
+
+if __name__ == "__main__":
+    main()
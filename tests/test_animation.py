@@ -0,0 +1,122 @@
+import contextlib
+import io
+import threading
+import unittest
+
+from anim import *
+from anim.animation import _get_geometry_executor
+from anim.ui.ui import create_offscreen_app
+
+from PySide6.QtWidgets import QApplication
+
+class animation_test(unittest.TestCase):
+
+    def test_lazy_shots(self):
+        pulled = []
+        def make_shot(name):
+            return shot(name, name, lambda shot, animation, scene, animator: None)
+
+        def generate(anim):
+            for name in ('b', 'c'):
+                pulled.append(name)
+                yield make_shot(name)
+            pulled.append('d')
+            anim.add_shots([make_shot('d'), make_shot('e')])
+            yield
+
+        a = animation("test", "test")
+        a.add_shots(make_shot('a'))
+        a.add_shots(generate(a))
+        a.add_shots(make_shot('f'))
+        self.assertListEqual(['a'], [s.name for s in a.shots])
+        self.assertListEqual([], pulled)
+
+        self.assertTrue(a.generate_shots_until(1))
+        self.assertListEqual(['a', 'b'], [s.name for s in a.shots])
+        self.assertListEqual(['b'], pulled)
+
+        self.assertTrue(a.generate_shots_until(3))
+        self.assertListEqual(['a', 'b', 'c', 'd', 'e'], [s.name for s in a.shots])
+
+        self.assertFalse(a.generate_shots_until(10))
+        self.assertListEqual(['a', 'b', 'c', 'd', 'e', 'f'], [s.name for s in a.shots])
+
+class geometry_animation(animation):
+    def __init__(self):
+        super().__init__("geometry", "geometry")
+        self.background_generation = True
+        self.generated = 0
+        self.failing = False
+
+    def generate_geometry(self):
+        if self.failing:
+            raise ValueError("failing geometry")
+        self.generated += 1
+        return self.generated
+
+    def generate_shots(self):
+        self.add_shots(shot("a", "a", lambda shot, animation, scene, animator: None))
+
+class background_generation_test(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or create_offscreen_app()
+
+    def _wait_for_worker(self):
+        _get_geometry_executor().submit(lambda: None).result()
+        self.app.processEvents()
+
+    def test_only_latest_geometry_is_used(self):
+        a, sc, anims = geometry_animation(), scene(), animator(virtual_clock())
+        a.reset(sc, anims)
+        self.assertEqual(1, a.geometry)
+
+        # Note: block the worker so the outdated request is still queued.
+        release = threading.Event()
+        _get_geometry_executor().submit(release.wait)
+        a.reset_play(sc, anims)
+        a.reset_play(sc, anims)
+        self.assertEqual(1, a.geometry)
+        release.set()
+        self._wait_for_worker()
+        self.assertEqual(2, a.generated)
+        self.assertEqual(2, a.geometry)
+
+    def test_outdated_geometry_is_dropped(self):
+        a, sc, anims = geometry_animation(), scene(), animator(virtual_clock())
+        a.reset(sc, anims)
+
+        release = threading.Event()
+        _get_geometry_executor().submit(release.wait)
+        a.reset_play(sc, anims)
+        generation = a._generation
+        a._on_geometry_generated(generation - 1, 'outdated', None)
+        self.assertEqual(1, a.geometry)
+
+        # Note: a reset meanwhile makes the result in the worker outdated.
+        a.reset(sc, anims)
+        self.assertEqual(2, a.geometry)
+        release.set()
+        self._wait_for_worker()
+        self.assertEqual(2, a.generated)
+        a._on_geometry_generated(generation, 'late', None)
+        self.assertEqual(2, a.geometry)
+
+    def test_failed_geometry_keeps_scene(self):
+        a, sc, anims = geometry_animation(), scene(), animator(virtual_clock())
+        a.reset(sc, anims)
+        items = sc.get_all_items()
+
+        a.failing = True
+        errors = io.StringIO()
+        with contextlib.redirect_stderr(errors):
+            a.reset_play(sc, anims)
+            self._wait_for_worker()
+        self.assertIn("failing geometry", errors.getvalue())
+        self.assertEqual(1, a.geometry)
+        self.assertEqual(items, sc.get_all_items())
+        self.assertIsNone(a._background_target)
+
+if __name__ == '__main__':
+    unittest.main()
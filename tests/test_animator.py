@@ -0,0 +1,53 @@
+import unittest
+
+from anim import *
+
+class animator_test(unittest.TestCase):
+
+    def test_virtual_clock(self):
+        values = []
+        finished = []
+        def prep(shot, animation, scene, animator):
+            animator.animate_value([0., 1.], 1., values.append, lambda: finished.append(True))
+
+        a = animator(virtual_clock())
+        s = shot("test", "test", prep)
+        a.play(s, None, None)
+
+        a.advance(250.)
+        self.assertAlmostEqual(values[-1], 0.25)
+        self.assertFalse(finished)
+
+        a.advance(500.)
+        self.assertAlmostEqual(values[-1], 0.75)
+        self.assertFalse(finished)
+
+        a.advance(250.)
+        self.assertAlmostEqual(values[-1], 1.)
+        self.assertListEqual(finished, [True])
+
+        a.reset()
+        self.assertListEqual(finished, [True])
+
+    def test_baked_shot(self):
+        values = []
+        prepared = []
+        def prep(shot, animation, scene, animator):
+            prepared.append(True)
+            animator.animate_value([0., 1.], 1., values.append)
+
+        a = animator(virtual_clock())
+        s = shot("test", "test", prep, bake=True)
+        a.play(s, None, None)
+        a.advance(500.)
+        self.assertAlmostEqual(values[-1], 0.5)
+
+        a.anim_speedup = 2.
+        a.play(s, None, None)
+        a.advance(250.)
+        self.assertAlmostEqual(values[-1], 0.5)
+        self.assertEqual(len(prepared), 1)
+
+        s.clear_timelines()
+        a.play(s, None, None)
+        self.assertEqual(len(prepared), 2)
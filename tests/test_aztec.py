@@ -0,0 +1,98 @@
+import unittest
+
+import numpy as np
+
+from examples.aztec_circle.aztec import aztec
+from examples.aztec_circle.aztec_circle import aztec_circle
+from examples.aztec_circle.arctic_statistics import arctic_statistics, grow_tiling
+from examples.aztec_circle.numpy_aztec import numpy_aztec, tile_to_code, code_to_tile
+from examples.aztec_circle.tile_generator import sequence_tile_generator
+
+class list_reactor:
+    def __init__(self):
+        self.log = []
+
+    def reallocate(self, az, old_amount, new_amount):
+        self.log.append(('reallocate', old_amount, new_amount))
+
+    def increase_size(self, az, origin, size):
+        self.log.append(('size', origin, size))
+
+    def collision(self, az, x, y):
+        self.log.append(('collision', x, y, tile_to_code(az.tiles()[x][y])))
+
+    def collisions_done(self, az):
+        self.log.append(('collisions_done',))
+
+    def move(self, az, x1, y1, x2, y2):
+        self.log.append(('move', x1, y1, x2, y2, tile_to_code(az.tiles()[x1][y1])))
+
+    def moves_done(self, az):
+        self.log.append(('moves_done',))
+
+    def fill(self, az, x, y, tile):
+        self.log.append(('fill', x, y, tile_to_code(tile)))
+
+    def fills_done(self, az):
+        self.log.append(('fills_done',))
+
+class numpy_reactor(list_reactor):
+    def collisions(self, az, xs, ys, codes):
+        for x, y, code in zip(xs.tolist(), ys.tolist(), codes.tolist()):
+            self.log.append(('collision', x, y, code))
+
+    def moves(self, az, xs, ys, new_xs, new_ys, codes):
+        for move in zip(xs.tolist(), ys.tolist(), new_xs.tolist(), new_ys.tolist(), codes.tolist()):
+            self.log.append(('move',) + move)
+
+    def fills(self, az, xs, ys, codes):
+        for x, y, code in zip(xs.tolist(), ys.tolist(), codes.tolist()):
+            self.log.append(('fill', x, y, code))
+
+class numpy_aztec_test(unittest.TestCase):
+
+    def test_tile_codes(self):
+        self.assertIsNone(code_to_tile(0))
+        self.assertEqual(0, tile_to_code(None))
+        for code in range(1, 32, 2):
+            self.assertEqual(code, tile_to_code(code_to_tile(code)))
+
+    def test_same_as_aztec(self):
+        for seed in (1771, 1772, 1773):
+            for sequence in ('r', 'hv', 'hhvr'):
+                list_react = list_reactor()
+                numpy_react = numpy_reactor()
+                list_az = aztec(0, sequence_tile_generator(seed, sequence), list_react)
+                numpy_az = numpy_aztec(0, sequence_tile_generator(seed, sequence), numpy_react)
+                for _ in range(24):
+                    list_az.grow()
+                    numpy_az.grow()
+                    codes = np.array([[tile_to_code(tile) for tile in column] for column in list_az.tiles()], dtype=np.int8)
+                    self.assertTrue(np.array_equal(codes, numpy_az.tiles()))
+                    self.assertEqual(list_react.log, numpy_react.log)
+                    self.assertEqual(list_az.count_frozen_tiles_by_type(), numpy_az.count_frozen_tiles_by_type())
+
+    def test_arctic_statistics(self):
+        counts, frozen_types = grow_tiling(12, 1771)
+        self.assertEqual((24, 24), frozen_types.shape)
+        for type_index in range(4):
+            self.assertEqual(counts[type_index] * 2, np.count_nonzero(frozen_types == type_index))
+
+        statistics = arctic_statistics(12, [1771, 1772], processes=1)
+        self.assertEqual(list(counts), list(statistics['frozen_counts'][0]))
+        self.assertEqual((4, 24, 24), statistics['frozen_probabilities'].shape)
+        self.assertTrue((statistics['frozen_probabilities'].sum(axis=0) <= 1.).all())
+
+    def test_animate_after_start_size(self):
+        circle = aztec_circle()
+        circle.animate_limit_option.value = 60
+        circle.start_size_option.value = 200
+        circle.size = 201
+        self.assertFalse(circle.skip_animations)
+        circle.size = 260
+        self.assertFalse(circle.skip_animations)
+        circle.size = 261
+        self.assertTrue(circle.skip_animations)
+
+if __name__ == '__main__':
+    unittest.main()
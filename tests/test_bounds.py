@@ -0,0 +1,77 @@
+import unittest
+
+from anim import *
+from anim.bounds import items_bounds
+
+class items_bounds_test(unittest.TestCase):
+
+    def _assert_same_rect(self, rect1, rect2):
+        self.assertAlmostEqual(rect1.left(), rect2.left())
+        self.assertAlmostEqual(rect1.top(), rect2.top())
+        self.assertAlmostEqual(rect1.right(), rect2.right())
+        self.assertAlmostEqual(rect1.bottom(), rect2.bottom())
+
+    def test_grow_and_shrink(self):
+        bounds = items_bounds()
+        self.assertTrue(bounds.rect().isNull())
+
+        p1 = point(0., 0.)
+        p2 = point(10., 10.)
+        p3 = point(-5., 20.)
+        l1 = line(p1, p2).thickness(0.)
+        l2 = line(p2, p3).thickness(0.)
+        bounds.add_item(l1)
+        bounds.add_item(l2)
+        self._assert_same_rect(bounds.rect(), static_rectangle(-5., 0., 15., 20.))
+
+        p2.set_point(point(30., 5.))
+        self._assert_same_rect(bounds.rect(), static_rectangle(-5., 0., 35., 20.))
+
+        p2.set_point(point(1., 1.))
+        self._assert_same_rect(bounds.rect(), static_rectangle(-5., 0., 6., 20.))
+
+        bounds.remove_item(l2)
+        self._assert_same_rect(bounds.rect(), static_rectangle(0., 0., 1., 1.))
+
+        p3.set_point(point(-50., 50.))
+        self._assert_same_rect(bounds.rect(), static_rectangle(0., 0., 1., 1.))
+
+    def test_group(self):
+        bounds = items_bounds()
+        p1 = point(0., 0.)
+        p2 = point(4., 2.)
+        r1 = rectangle(p1, p2).thickness(0.)
+        g = group([r1])
+        bounds.add_item(g)
+        self._assert_same_rect(bounds.rect(), static_rectangle(0., 0., 4., 2.))
+
+        r2 = rectangle(point(-3., 1.), point(0., 8.)).thickness(0.)
+        g.set_items([r1, r2])
+        self._assert_same_rect(bounds.rect(), static_rectangle(-3., 0., 7., 8.))
+
+    def test_moved_count(self):
+        bounds = items_bounds()
+        p1 = point(0., 0.)
+        p2 = point(10., 10.)
+        p3 = point(-5., 20.)
+        l1 = line(p1, p2)
+        l2 = line(p2, p3)
+        bounds.add_item(l1)
+        bounds.add_item(l2)
+        self.assertEqual(bounds.item_count, 2)
+        self.assertEqual(bounds.take_moved_count(), 0)
+
+        p1.set_point(point(1., 1.))
+        p1.set_point(point(2., 1.))
+        self.assertEqual(bounds.take_moved_count(), 1)
+
+        p2.set_point(point(1., 1.))
+        self.assertEqual(bounds.take_moved_count(), 2)
+        self.assertEqual(bounds.take_moved_count(), 0)
+
+        bounds.remove_item(l2)
+        p2.set_point(point(3., 1.))
+        self.assertEqual(bounds.take_moved_count(), 1)
+
+if __name__ == '__main__':
+    unittest.main()
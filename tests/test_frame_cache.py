@@ -0,0 +1,103 @@
+import unittest
+
+from anim import *
+from anim.ui.ui import create_offscreen_app
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage
+from PySide6.QtWidgets import QApplication
+
+class frame_cache_test(unittest.TestCase):
+
+    def _image(self):
+        return QImage(10, 10, QImage.Format_RGB32)
+
+    def test_lru_eviction(self):
+        image_bytes = self._image().sizeInBytes()
+        cache = frame_cache(max_bytes=image_bytes * 2)
+
+        cache.put('a', self._image())
+        cache.put('b', self._image())
+        self.assertEqual(len(cache), 2)
+        self.assertIsNotNone(cache.get('a'))
+
+        cache.put('c', self._image())
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.size_bytes, image_bytes * 2)
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNotNone(cache.get('c'))
+        self.assertEqual(cache.hits, 3)
+        self.assertEqual(cache.misses, 1)
+        self.assertAlmostEqual(cache.hit_rate, 0.75)
+
+        cache.put('big', QImage(100, 100, QImage.Format_RGB32))
+        self.assertIsNone(cache.get('big'))
+        self.assertEqual(len(cache), 2)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.size_bytes, 0)
+
+class view_frame_cache_test(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or create_offscreen_app()
+
+    def _create_repeating_animation(self):
+        # Note: like an item left out of a baked timeline, the disk
+        #       moves each time the shot is played, without animating.
+        class repeating_animation(animation):
+            def generate_actors(self, scene):
+                self.disk = circle(point(0., 0.), 10.).fill(red)
+                self.plays = 0
+                self.add_actors(actor("disk", "", self.disk), scene)
+
+            def generate_shots(self):
+                repeated = shot("a", "a", self.prepare)
+                repeated.repeat = True
+                self.add_shots(repeated)
+
+            def prepare(self, shot, animation, scene, animator):
+                self.plays += 1
+                self.disk.center.set_point(point(self.plays * 30. - 60., 0.))
+                animator.animate_value([0., 1.], 1., lambda value: None)
+
+        a = repeating_animation("repeat", "repeat")
+        a.frame_on_start = False
+        a.auto_framing = False
+        return a
+
+    def _paint(self, sc):
+        return sc.view.viewport().grab().toImage()
+
+    def test_no_stale_frame(self):
+        a, sc, anims = self._create_repeating_animation(), scene(), animator(virtual_clock())
+        view = sc.view
+        view.setAttribute(Qt.WA_DontShowOnScreen)
+        view.show()
+        view.resize(200, 100)
+        a.reset(sc, anims)
+        cache = frame_cache()
+        view.set_frame_cache(cache, lambda: a.get_frame_key(anims))
+
+        a.play(sc, anims)
+        a.stop(sc, anims)
+        first = self._paint(sc)
+        self.assertEqual(first, self._paint(sc))
+        self.assertEqual(1, cache.hits)
+
+        a.play(sc, anims)
+        a.play_next_shot(sc, anims)
+        a.stop(sc, anims)
+        self.assertEqual(0, a.current_shot_index)
+        self.assertNotEqual(first, self._paint(sc))
+        self.assertEqual(1, cache.hits)
+
+        a.seek(sc, anims, 0)
+        self._paint(sc)
+        self.assertEqual(1, cache.hits)
+
+if __name__ == '__main__':
+    unittest.main()
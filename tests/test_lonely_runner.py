@@ -2,6 +2,13 @@ import unittest
 
 from anim import *
 from examples.lonely_runner.runners_allowed_intervals import *
+from examples.lonely_runner.exact_runners_intervals import *
+from examples.lonely_runner.speeds_search import *
+
+from fractions import Fraction
+import numpy as np
+import os
+import tempfile
 
 class lonely_runner_test(unittest.TestCase):
 
@@ -18,3 +25,70 @@ class lonely_runner_test(unittest.TestCase):
 
         self.assertEqual([(1./3., 1 - 1./3.)], generate_one_runner_allowed_time_intervals(1, 3))
         self.assertEqual([(1./6., 1./2. - 1./6.), (1./2. + 1./6.,  1./2. + (1./2 - 1./6))], generate_one_runner_allowed_time_intervals(2, 3))
+
+    def test_exact_runner_intervals(self):
+        self.assertEqual(2, runners_denominator([1], 2))
+        self.assertEqual([[1, 1]], generate_one_runner_exact_intervals(1, 2, 2).tolist())
+        self.assertEqual([[1, 1], [3, 3]], generate_one_runner_exact_intervals(2, 2, 4).tolist())
+        self.assertEqual([[1, 2]], generate_one_runner_exact_intervals(1, 3, 3).tolist())
+        self.assertEqual([[1, 2], [4, 5]], generate_one_runner_exact_intervals(2, 3, 6).tolist())
+        with self.assertRaises(ValueError):
+            generate_one_runner_exact_intervals(1.5, 3, 6)
+
+    def test_exact_intersections(self):
+        intervals, denominator = generate_all_exact_intervals([], 3)
+        self.assertEqual([[0, 3]], intervals.tolist())
+
+        # Closed intervals touching at a single time intersect at that time.
+        intervals = intersect_all_exact_intervals([
+            np.array([[1, 3], [5, 7]]),
+            np.array([[3, 5]]),
+        ], 8)
+        self.assertEqual([[3, 3], [5, 5]], intervals.tolist())
+
+        intervals, denominator = generate_all_exact_intervals([1, 3, 4, 7, 12], 6)
+        self.assertEqual(504, denominator)
+        self.assertEqual((Fraction(13, 72), Fraction(5, 24)), exact_intervals_to_fractions(intervals, denominator)[0])
+
+    def test_exact_solution(self):
+        solution = exact_runners_solution([0, 1, 3, 4, 7, 12], 0)
+        self.assertEqual(Fraction(13, 72), solution.earliest_solution_fraction)
+        for distance in solution.scaled_distances_from_lonely[1:]:
+            self.assertGreaterEqual(distance, 1. - 1e-9)
+
+        # Many runners, whose common denominator does not fit in 64 bits.
+        intervals, denominator = generate_all_exact_intervals(list(range(1, 60)), 60)
+        self.assertGreater(denominator, 2**64)
+        self.assertTrue(len(intervals))
+
+    def test_loneliness(self):
+        self.assertEqual(Fraction(1, 2), loneliness([1]))
+        self.assertEqual(Fraction(1, 3), loneliness([1, 2]))
+        self.assertEqual(Fraction(1, 2), loneliness([1, 3]))
+        self.assertEqual(Fraction(1, 5), loneliness([1, 3, 4, 7]))
+
+        result = evaluate_speeds((0, 1, 3, 4, 7))
+        self.assertEqual('0', result['gap'])
+        self.assertEqual('1/5', result['earliest_time'])
+
+    def test_search_resumes(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'search.jsonl')
+            results = search_speeds(3, 4, path, processes=1, chunk_size=2)
+            self.assertEqual(6, len(results))
+            self.assertEqual([0, 1, 2], results[0]['speeds'])
+
+            with open(path, 'a') as results_file:
+                results_file.write('{"speeds": [0, 4')
+            results = search_speeds(3, 5, path, processes=1)
+            self.assertEqual(10, len(results))
+            self.assertEqual(10, len(read_results(path)))
+
+            # A complete result without its end of line is also incomplete.
+            with open(path, 'rb+') as results_file:
+                results_file.truncate(os.path.getsize(path) - 1)
+            self.assertEqual(9, len(read_results(path)))
+            results = search_speeds(3, 5, path, processes=1)
+            self.assertEqual(10, len(results))
+            with open(path) as results_file:
+                self.assertEqual(10, len(results_file.readlines()))
@@ -0,0 +1,84 @@
+import unittest
+
+from anim import *
+from anim.ui.options_ui import option_changes
+from anim.ui.ui import create_offscreen_app
+
+from PySide6.QtWidgets import QApplication
+
+class recording_animation(animation):
+    def __init__(self):
+        super().__init__("options", "options")
+        self.resets = []
+
+    def reset_play(self, scene, animator, actor_names = None) -> None:
+        self.resets.append(actor_names)
+
+class handling_animation(recording_animation):
+    def __init__(self):
+        super().__init__()
+        self.handled = []
+
+    def option_changed(self, scene, animator, option) -> None:
+        super().option_changed(scene, animator, option)
+        self.handled.append(option.name)
+
+class option_changes_test(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or create_offscreen_app()
+
+    def _create_changes(self, a = None):
+        a = a or recording_animation()
+        changes = option_changes(scene(), a, animator(), 0)
+        changes.timer.timeout.connect(changes.apply)
+        return a, changes
+
+    def _wait_for_timer(self, changes: option_changes):
+        while changes.timer.isActive():
+            self.app.processEvents()
+
+    def test_burst_resets_once(self):
+        a, changes = self._create_changes()
+        first = option("first", "", 1, 0, 10, ["x"])
+        second = option("second", "", 1, 0, 10, ["y", "x"])
+        changes.changed(first)
+        changes.changed(second)
+        changes.changed(first)
+        self.assertEqual([], a.resets)
+        self._wait_for_timer(changes)
+        self.assertEqual([{"x", "y"}], a.resets)
+
+        whole = option("whole", "", 1, 0, 10)
+        changes.changed(first)
+        changes.changed(whole)
+        self._wait_for_timer(changes)
+        self.assertEqual([{"x", "y"}, None], a.resets)
+
+    def test_single_option(self):
+        a, changes = self._create_changes()
+        first = option("first", "", 1, 0, 10, ["x"])
+        changes.changed(first)
+        self._wait_for_timer(changes)
+        self.assertEqual([["x"]], a.resets)
+
+        changes.apply()
+        self.assertEqual([["x"]], a.resets)
+
+    def test_overridden_option_changed(self):
+        a, changes = self._create_changes(handling_animation())
+        first = option("first", "", 1, 0, 10, ["x"])
+        second = option("second", "", 1, 0, 10)
+        changes.changed(first)
+        changes.changed(second)
+        self._wait_for_timer(changes)
+        self.assertEqual([None], a.resets)
+        self.assertEqual(["first", "second"], a.handled)
+
+        changes.changed(first, immediate=True)
+        self.assertEqual([None, ["x"]], a.resets)
+        self.assertEqual(["first", "second", "first"], a.handled)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -90,3 +90,26 @@ class point_test(unittest.TestCase):
             self.assertAlmostEqual(point.distance_squared(p1, p2), dq)
             self.assertAlmostEqual(point.distance(p1, p2), math.sqrt(dq))
             self.assertAlmostEqual(point.distance_from_origin(p1), math.sqrt(doq))
+
+    def test_batch(self):
+        class counting_user:
+            def __init__(self):
+                self.updates = 0
+            def _update_geometry(self):
+                self.updates += 1
+
+        center = point(0., 0.)
+        corners = [relative_point(center, 1., 0.), relative_point(center, 0., 1.)]
+        user = counting_user()
+        for pt in corners:
+            pt.add_user(user)
+
+        center.set_point(point(2., 2.))
+        self.assertEqual(user.updates, 2)
+
+        with point_batch():
+            center.set_point(point(3., 3.))
+            self.assertAlmostEqual(corners[0].x(), 4.)
+            self.assertAlmostEqual(corners[1].y(), 4.)
+            self.assertEqual(user.updates, 2)
+        self.assertEqual(user.updates, 3)
@@ -0,0 +1,71 @@
+import unittest
+import math
+
+from anim import *
+
+class point_graph_test(unittest.TestCase):
+
+    def _create_points(self):
+        center = point(1., 2.)
+        relatives = [relative_point(center, float(i), 1.) for i in range(5)]
+        radial = radial_point(relatives[2], 3., 0.5)
+        on_radial = relative_radial_point(radial, 1., 0.25)
+        sub_relative = relative_point(on_radial, 2., -1.)
+        return center, relatives, radial, on_radial, sub_relative
+
+    def _assert_same_points(self, pts1, pts2):
+        for p1, p2 in zip(pts1, pts2):
+            self.assertAlmostEqual(p1.x(), p2.x())
+            self.assertAlmostEqual(p1.y(), p2.y())
+
+    def test_compile(self):
+        center, relatives, radial, on_radial, sub_relative = self._create_points()
+        graph = point_graph([center])
+        self.assertEqual(len(graph.points), 9)
+        self.assertEqual(graph.kinds[graph.index(center)], point_graph.ROOT)
+        self.assertEqual(graph.kinds[graph.index(radial)], point_graph.RADIAL)
+        self.assertEqual(graph.kinds[graph.index(on_radial)], point_graph.RELATIVE_RADIAL)
+        self.assertEqual(graph.origins[graph.index(sub_relative)], graph.index(on_radial))
+
+    def test_evaluate_like_points(self):
+        center, relatives, radial, on_radial, sub_relative = self._create_points()
+        graph = point_graph([center])
+
+        center.set_point(point(-4., 7.))
+        positions = graph.evaluate()
+        for pt in graph.points:
+            self.assertAlmostEqual(positions[graph.index(pt)][0], pt.x())
+            self.assertAlmostEqual(positions[graph.index(pt)][1], pt.y())
+
+    def test_update(self):
+        center, relatives, radial, on_radial, sub_relative = self._create_points()
+        expected = self._create_points()
+        graph = point_graph([center])
+        polygon_item = polygon([relatives[0], radial, sub_relative])
+
+        graph.deltas[graph.index(relatives[2])] = (5., 5.)
+        graph.angles[graph.index(radial)] = math.pi
+        graph.update()
+
+        expected[1][2].set_point(point(5., 5.))
+        expected[2].set_angle(math.pi)
+
+        self._assert_same_points(graph.points, point_graph([expected[0]]).points)
+        self.assertAlmostEqual(relatives[2].delta.x(), 5.)
+        self.assertAlmostEqual(radial.angle, math.pi)
+        self._assert_same_points(polygon_item.polygon(), [relatives[0], radial, sub_relative])
+
+    def test_deep_chain(self):
+        center = point(0., 0.)
+        chain = [center]
+        for i in range(3000):
+            chain.append(relative_point(chain[-1], 1., 0.))
+
+        graph = point_graph([chain[-1]])
+        self.assertEqual(len(graph.points), 3001)
+        self.assertEqual(len(graph._levels), 3000)
+
+        graph.deltas[graph.index(chain[1])] = (2., 1.)
+        graph.update()
+        self.assertAlmostEqual(chain[-1].x(), 3001.)
+        self.assertAlmostEqual(chain[-1].y(), 1.)
@@ -0,0 +1,21 @@
+import unittest
+
+from anim import *
+
+class profiler_test(unittest.TestCase):
+
+    def test_paints_outside_ticks(self):
+        prof = profiler()
+        prof.begin_tick(3)
+        prof.record('interpolation')
+        prof.record_span('paint', 1., 2.)
+        self.assertEqual(1, len(prof.ticks))
+
+        for _ in range(5):
+            prof.record_span('paint', 3., 4.)
+        self.assertEqual(6, len(prof.ticks))
+        self.assertTrue(all(len(tick['spans']) == 1 for tick in list(prof.ticks)[1:]))
+        self.assertEqual(0, prof.ticks[-1]['tracks'])
+
+if __name__ == '__main__':
+    unittest.main()
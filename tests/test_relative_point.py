@@ -137,3 +137,23 @@ class relative_point_test(unittest.TestCase):
                 self.assertAlmostEqual(relative_point.distance_squared(p1, p2), dq)
                 self.assertAlmostEqual(relative_point.distance(p1, p2), math.sqrt(dq))
                 self.assertAlmostEqual(relative_point.distance_from_origin(p1), math.sqrt(doq))
+
+    def test_relative_point_state(self):
+        for bx, by in self.bases:
+            base = point(bx, by)
+            pt = relative_point(base, 2., 3.)
+            base_state = base.get_state()
+            pt_state = pt.get_state()
+
+            base.set_point(point(bx + 5., by - 1.))
+            pt.set_delta(point(-4., 1.))
+            self.assertNotAlmostEqual(pt.x(), bx + 2.)
+
+            base.set_state(base_state)
+            pt.set_state(pt_state)
+            self.assertAlmostEqual(base.x(), bx)
+            self.assertAlmostEqual(base.y(), by)
+            self.assertAlmostEqual(pt.x(), bx + 2.)
+            self.assertAlmostEqual(pt.y(), by + 3.)
+            self.assertAlmostEqual(pt.delta.x(), 2.)
+            self.assertAlmostEqual(pt.delta.y(), 3.)
@@ -0,0 +1,31 @@
+import unittest
+
+from anim import *
+from anim.ui.ui import create_offscreen_app
+from examples import create_animation
+from examples.rotating_stars import rotating_stars
+
+from PySide6.QtWidgets import QApplication
+
+class rotating_stars_test(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or create_offscreen_app()
+
+    def test_reset_actors_keeps_counts(self):
+        renderer = frame_renderer(create_animation(rotating_stars.name), 320, 180)
+        a, sc, animator = renderer.animation, renderer.scene, renderer.animator
+        a.reset(sc, animator)
+
+        def counts():
+            return ([len(center._users) for center in rotating_stars.pts.inner_centers],
+                    len(sc.scene.items()), len(a.actors))
+
+        before = counts()
+        for _ in range(3):
+            self.assertTrue(a.reset_actors(sc, animator, rotating_stars.ratio_option.affects))
+            self.assertEqual(before, counts())
+
+if __name__ == '__main__':
+    unittest.main()
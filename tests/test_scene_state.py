@@ -0,0 +1,89 @@
+import os
+import tempfile
+import unittest
+
+from anim import *
+from anim.ui.ui import create_offscreen_app
+
+from PySide6.QtWidgets import QApplication
+
+class scene_state_test(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or create_offscreen_app()
+
+    def _create_scene(self):
+        sc = scene()
+        p1 = point(0., 0.)
+        p2 = relative_point(p1, 10., 5.)
+        l = line(p1, p2).outline(red).thickness(2.)
+        c = circle(p2, 3.).fill(blue)
+        for i in [l, c]:
+            sc.add_item(i)
+        return sc, p1, p2, l, c
+
+    def test_capture_and_restore(self):
+        sc, p1, p2, l, c = self._create_scene()
+        state = scene_state.capture(sc)
+
+        p1.set_point(point(4., 4.))
+        p2.set_delta(point(-1., 2.))
+        l.set_opacity(0.5).set_z_order(3.).outline(green)
+        c.fill(yellow)
+        moved, moved_points = state.differences(scene_state.capture(sc))
+        self.assertEqual(len(moved), 2)
+        self.assertEqual(len(moved_points), 2)
+
+        state.restore(sc)
+        self.assertAlmostEqual(p1.x(), 0.)
+        self.assertAlmostEqual(p2.x(), 10.)
+        self.assertAlmostEqual(p2.delta.y(), 5.)
+        self.assertAlmostEqual(l.opacity(), 1.)
+        self.assertAlmostEqual(l.zValue(), 0.)
+        self.assertAlmostEqual(l.get_thickness(), 2.)
+        self.assertEqual(l.get_outline(), red)
+        self.assertEqual(c.get_fill(), blue)
+        moved, moved_points = state.differences(scene_state.capture(sc))
+        self.assertEqual(len(moved), 0)
+        self.assertEqual(len(moved_points), 0)
+
+    def test_circle_radius_and_angles(self):
+        sc, p1, p2, l, c = self._create_scene()
+        state = scene_state.capture(sc)
+
+        c.set_radius(7.)
+        moved, moved_points = state.differences(scene_state.capture(sc))
+        self.assertEqual(1, len(moved))
+        self.assertEqual(0, len(moved_points))
+        c.set_partial_circle(0.5)
+        self.assertEqual(1, len(state.differences(scene_state.capture(sc))[0]))
+
+        state.restore(sc)
+        self.assertAlmostEqual(c.radius, 3.)
+        self.assertAlmostEqual(c.rect().width(), 6.)
+        self.assertEqual(c.spanAngle(), 360 * 16)
+        self.assertEqual(0, len(state.differences(scene_state.capture(sc))[0]))
+
+    def test_save_and_load(self):
+        sc, p1, p2, l, c = self._create_scene()
+        state = scene_state.capture(sc)
+        with tempfile.TemporaryDirectory() as folder:
+            file_name = os.path.join(folder, 'state.npy')
+            state.save(file_name)
+
+            p1.set_point(point(-2., 7.))
+            loaded = scene_state.load(file_name)
+            self.assertEqual(len(loaded.differences(state)[1]), 0)
+            loaded.restore(sc)
+            self.assertAlmostEqual(p2.x(), 10.)
+            self.assertAlmostEqual(p2.y(), 5.)
+            del loaded
+
+        other, *_ = self._create_scene()
+        other.add_item(line(point(0., 0.), point(1., 1.)))
+        with self.assertRaises(ValueError):
+            state.restore(other)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+
+from anim import *
+from anim.ui.ui import create_offscreen_app
+from examples import create_animation
+
+from PySide6.QtCore import QVariantAnimation
+from PySide6.QtWidgets import QApplication
+
+class seek_test(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or create_offscreen_app()
+
+    def _create_renderer(self, name: str) -> frame_renderer:
+        renderer = frame_renderer(create_animation(name), 320, 180)
+        renderer.animation.snapshot_shots = True
+        return renderer
+
+    def _play_shots(self, renderer: frame_renderer, shots_count: int, frames_count: int):
+        """
+        Plays the given number of shots in order and captures the state
+        of the scene after the given number of frames of each shot, by shot index.
+        """
+        a, sc, animator = renderer.animation, renderer.scene, renderer.animator
+        states = {}
+        a.reset(sc, animator)
+        a.play(sc, animator)
+        while a.playing and a.current_shot_index not in states and len(states) < shots_count:
+            index = a.current_shot_index
+            for _ in range(frames_count):
+                animator.advance(renderer.frame_duration)
+            states[index] = scene_state.capture(sc)
+            while a.playing and a.current_shot_index == index:
+                animator.set_current_time(animator.anim_group.totalDuration())
+        a.stop(sc, animator)
+        return states
+
+    def _check_seek(self, renderer: frame_renderer, states, order, frames_count: int) -> None:
+        a, sc, animator = renderer.animation, renderer.scene, renderer.animator
+        for index in order:
+            a.seek(sc, animator, index)
+            for _ in range(frames_count):
+                animator.advance(renderer.frame_duration)
+            moved, moved_points = states[index].differences(scene_state.capture(sc), 1e-6)
+            self.assertEqual(0, len(moved), f"shot {index}")
+            self.assertEqual(0, len(moved_points), f"shot {index}")
+
+    def test_seek_matches_playback(self):
+        shots_count, frames_count = 6, 10
+        for name in ["Rotating Stars", "Three Bisectors Meet", "Pentagramaths", "Lonely Runner"]:
+            with self.subTest(name):
+                renderer = self._create_renderer(name)
+                states = self._play_shots(renderer, shots_count, frames_count)
+                self.assertGreater(len(states), 1)
+
+                indexes = sorted(states)
+                self._check_seek(renderer, states, reversed(indexes), frames_count)
+                self._check_seek(renderer, states, indexes[1::2] + indexes[::2], frames_count)
+
+    def test_seek_without_snapshots(self):
+        renderer = self._create_renderer("Rotating Stars")
+        states = self._play_shots(renderer, 4, 5)
+        renderer.animation.snapshot_shots = False
+        renderer.animation.snapshots = {}
+        self._check_seek(renderer, states, [3, 1], 5)
+
+    def test_finish_endless_animation(self):
+        def make_endless():
+            anim = QVariantAnimation()
+            anim.setStartValue(0.)
+            anim.setEndValue(1.)
+            anim.setLoopCount(-1)
+            return anim
+
+        def requeue(anims):
+            anims.animate(make_endless(), 1., lambda: requeue(anims))
+
+        a = animation("endless", "endless")
+        a.add_shots([shot("a", "a", lambda shot, animation, scene, anims: requeue(anims)),
+                     shot("b", "b", lambda shot, animation, scene, anims: None)])
+        sc, anims = scene(), animator(virtual_clock())
+        a.reset(sc, anims)
+        a.play(sc, anims)
+        anims.finish(max_rounds=10)
+        self.assertEqual(0, a.current_shot_index)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+
+from anim.tracks import track_engine
+from anim.profiler import profiler
+
+from PySide6.QtCore import QVariantAnimation, QPointF
+from PySide6.QtGui import QColor
+
+class tracks_test(unittest.TestCase):
+
+    def _check_same_as_qt(self, values):
+        count = len(values)
+        timed_values = [(i / float(count - 1), values[i]) for i in range(count)]
+
+        qt_anim = QVariantAnimation()
+        qt_anim.setStartValue(timed_values[0][1])
+        qt_anim.setEndValue(timed_values[-1][1])
+        qt_anim.setKeyValues(timed_values)
+        qt_anim.setDuration(777)
+        qt_values = []
+        qt_anim.valueChanged.connect(qt_values.append)
+
+        engine = track_engine()
+        engine_values = []
+        engine.add_track(timed_values, 777, engine_values.append)
+
+        for t in range(0, 778, 7):
+            qt_anim.setCurrentTime(t)
+            engine.setCurrentTime(t)
+        self.assertListEqual(qt_values, engine_values)
+
+    def test_floats(self):
+        self._check_same_as_qt([0., 1.])
+        self._check_same_as_qt([0.5, 2., 0.5, 2., 0.5])
+
+    def test_points(self):
+        self._check_same_as_qt([QPointF(1., 2.), QPointF(5.5, -3.), QPointF(2., 2.)])
+
+    def test_colors(self):
+        self._check_same_as_qt([QColor(255, 255, 255), QColor(0, 0, 255), QColor(0, 0, 255), QColor(255, 255, 255)])
+
+    def test_on_finished(self):
+        finished = []
+        engine = track_engine()
+        engine.add_track([(0., 0.), (1., 1.)], 100, None, lambda: finished.append(1))
+        engine.add_track([(0., 0.), (1., 1.)], 200, None, lambda: finished.append(2))
+        self.assertEqual(engine.duration(), 200)
+
+        engine.setCurrentTime(50)
+        self.assertListEqual(finished, [])
+        engine.setCurrentTime(100)
+        self.assertListEqual(finished, [1])
+        engine.setCurrentTime(200)
+        self.assertListEqual(finished, [1, 2])
+
+    def test_seek_back(self):
+        engine = track_engine()
+        values = { 'float': [], 'point': [], 'color': [] }
+        engine.add_track([(0., 0.), (1., 1.)], 1000, values['float'].append)
+        engine.add_track([(0., 0.), (1., 2.)], 2000)
+        engine.add_track([(0., QPointF(0., 0.)), (1., QPointF(4., 2.))], 1000, values['point'].append)
+        engine.add_track([(0., QColor(0, 0, 0)), (1., QColor(200, 0, 0))], 1000, values['color'].append)
+
+        engine.setCurrentTime(1500)
+        self.assertEqual(1., values['float'][-1])
+        engine.setCurrentTime(500)
+        self.assertEqual(0.5, values['float'][-1])
+        self.assertEqual(QPointF(2., 1.), values['point'][-1])
+        self.assertEqual(QColor(100, 0, 0), values['color'][-1])
+        self.assertEqual(4, engine.active_track_count)
+
+        engine.setCurrentTime(1200)
+        self.assertEqual(1., values['float'][-1])
+        self.assertEqual(1, engine.active_track_count)
+
+    def test_profiler(self):
+        recorder = profiler()
+        engine = track_engine(True, profiler=recorder)
+        engine.add_track([(0., 0.), (1., 1.)], 100, lambda value: None)
+        engine.add_track([(0., 0.), (1., 1.)], 200)
+
+        engine.setCurrentTime(50)
+        engine.setCurrentTime(150)
+        self.assertEqual(2, len(recorder.ticks))
+        self.assertListEqual([2, 2], [tick['tracks'] for tick in recorder.ticks])
+        self.assertListEqual(['interpolation', 'callbacks', 'points', 'finished'], [span[0] for span in recorder.ticks[0]['spans']])
+
+        trace = recorder.to_chrome_trace()
+        self.assertEqual(2 * 5, len(trace['traceEvents']))
+        self.assertEqual(2., recorder.summary()['tracks'])